@@ -0,0 +1,226 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Benchmarks of the geometry and rendering stages of figures.py:
+#
+#   python bench.py            # run and compare against bench.json
+#   python bench.py --save     # run and store the results in bench.json
+#
+# Every stage records its best time (out of --repeat runs) and some counters
+# (points, path elements, bytes...). A stage is a regression when it is
+# slower than --threshold times its baseline. Besides, "import figures" must
+# not load pyx and must take less than IMPORT_BUDGET seconds.
+
+import os, sys, json, time, shutil, tempfile, subprocess, argparse
+
+from math     import *
+from geometry import *
+
+HERE     = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, "bench.json")
+
+# Importing figures.py (without drawing anything) must stay under this:
+IMPORT_BUDGET = 0.25
+
+CONSTANTS = (2, 3, 4, 5, e, pi, sqrt(2), sqrt(3), sqrt(5), (1+sqrt(5))/2)
+ANGLES    = (90, 180, 270, 360)
+
+### AUXILIARY FUNCTIONS ########################################################
+
+def timed(function, repeat):
+
+    # Best time out of repeat runs and the last result:
+    best = inf
+    for _ in range(repeat):
+        start  = time.perf_counter()
+        result = function()
+        best   = min(best, time.perf_counter() - start)
+    return best, result
+
+def spiral_path(P):
+    from pyx import path
+    PATH = path.path(path.moveto(*P[0]))
+    for p in P[1:]: PATH.append(path.lineto(*p))
+    return PATH
+
+### STAGES #####################################################################
+
+def bench_import(repeat):
+
+    # Fresh interpreter each time; the rendering stack must not be loaded:
+    code = ("import sys, time; t = time.perf_counter(); import {}; "
+            "print(time.perf_counter() - t, 'pyx' in sys.modules)")
+    results = {}
+    for module in ("geometry", "figures"):
+        best = inf
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, "-c", code.format(module)],
+                                 cwd=HERE, check=True, capture_output=True,
+                                 text=True).stdout.split()
+            best = min(best, float(out[0]))
+        results["import_" + module] = {"seconds": best,
+                                       "pyx": int(out[1] == "True")}
+    return results
+
+def bench_spiral(repeat):
+    results = {}
+    for points_per_turn in (90, 360, 1440):
+        for turns in (1, 10):
+            t, P = timed(lambda: logarithmic_spiral(4, turns, points_per_turn),
+                         repeat)
+            results["spiral_{}x{}".format(points_per_turn, turns)] = {
+                "seconds": t, "points": len(P)}
+    return results
+
+def bench_rotation(repeat):
+
+    # Rotation search as done by the examples (radii//4 sampled turns):
+    def search(K_per_turn, radii=24, points_per_turn=360):
+        rotation, scale = 0, 0
+        for i in range(radii//4):
+            P = logarithmic_spiral(K_per_turn, 1, points_per_turn,
+                                   i*2*pi/radii)
+            X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
+            Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P)
+            s = min(180/(X_max - X_min), 267/(Y_max - Y_min))/10
+            if scale < s: scale, rotation = s, i*2*pi/radii
+        return rotation
+
+    K = [k**(360/a) for k in CONSTANTS for a in ANGLES]
+    t, _ = timed(lambda: [search(k) for k in K], repeat)
+    return {"rotation": {"seconds": t, "points": len(K)*6*361}}
+
+def bench_layout(repeat):
+    jobs = [(k, a, 210, 297, 15) for k in CONSTANTS for a in ANGLES]
+    t1, L = timed(lambda: [layout(*j[:2]) for j in jobs], repeat)
+    t2, B = timed(lambda: layouts(jobs, samples=True), repeat)
+    return {"layout":  {"seconds": t1, "templates": len(L)},
+            "layouts": {"seconds": t2, "templates": len(B),
+                        "points": sum(len(b[-1]) for b in B)}}
+
+def bench_path(repeat):
+    P = layouts(((2, 90, 210, 297, 15),), samples=True)[0][-1]
+    t, PATH = timed(lambda: spiral_path(P), repeat)
+    return {"path": {"seconds": t, "elements": len(PATH.pathitems)}}
+
+def bench_text(repeat):
+
+    # The curved labels of a template, drawn with figures.put_text() (LaTeX
+    # is started once by setup(), as in figures.py):
+    import figures
+    figures.setup()
+    labels = (r"{\huge \bfseries MMACA}", r"{\Large $\phi$ / $ 90^{\circ}$}")
+    def typeset():
+        CANVAS = figures.canvas.canvas()
+        for label in labels: CANVAS.draw(*figures.put_text(0, 0, label))
+        return CANVAS
+    t, _ = timed(typeset, repeat)
+    return {"put_text": {"seconds": t, "labels": len(labels)}}
+
+def bench_pdf(repeat):
+    from pyx import canvas, style
+    P = layouts(((2, 90, 210, 297, 15),), samples=True)[0][-1]
+    CANVAS = canvas.canvas()
+    CANVAS.stroke(spiral_path(P), [style.linewidth.THick])
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "bench.pdf")
+        t, _ = timed(lambda: CANVAS.writePDFfile(filename), repeat)
+        size = os.path.getsize(filename)
+    return {"writePDFfile": {"seconds": t, "bytes": size}}
+
+def bench_build(repeat):
+
+    # Whole figures.py in a scratch directory (it needs LaTeX):
+    if shutil.which("latex") is None: raise FileNotFoundError("latex")
+    def build(tmp):
+        os.makedirs(os.path.join(tmp, "pictures"), exist_ok=True)
+        subprocess.run([sys.executable, os.path.join(HERE, "figures.py")],
+                       cwd=tmp, check=True, capture_output=True)
+        return [os.path.join(tmp, "pictures", f)
+                for f in os.listdir(os.path.join(tmp, "pictures"))]
+    with tempfile.TemporaryDirectory() as tmp:
+        t, F = timed(lambda: build(tmp), repeat)
+        size = sum(os.path.getsize(f) for f in F)
+    return {"build": {"seconds": t, "figures": len(F), "bytes": size}}
+
+STAGES = (("import",   bench_import),
+          ("spiral",   bench_spiral),
+          ("rotation", bench_rotation),
+          ("layout",   bench_layout),
+          ("path",     bench_path),
+          ("put_text", bench_text),
+          ("pdf",      bench_pdf),
+          ("build",    bench_build))
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Benchmark figures.py")
+    parser.add_argument("--repeat",    type=int,   default=5)
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--baseline",  default=BASELINE)
+    parser.add_argument("--save",      action="store_true")
+    parser.add_argument("--skip",      nargs="*", default=[],
+                        help="stages to skip ("+", ".join(s for s,f in STAGES)+")")
+    args = parser.parse_args()
+
+    # Run the stages (those that need pyx or LaTeX may be unavailable, any
+    # other error is a failure):
+    results, failures = {}, []
+    for name, stage in STAGES:
+        if name in args.skip: continue
+        repeat = 1 if name == "build" else args.repeat
+        try:
+            results.update(stage(repeat))
+        except (ImportError, FileNotFoundError) as error:
+            print("{:<16} skipped ({!r})".format(name, error))
+        except Exception as error:
+            print("{:<16} FAILED ({!r})".format(name, error))
+            failures.append(name)
+
+    # Compare against the baseline:
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline) as f: baseline = json.load(f)
+
+    regressions = []
+    for name, r in results.items():
+        counters = "  ".join("{}={}".format(k, v) for k, v in r.items()
+                             if k != "seconds")
+        line = "{:<16} {:10.3f} ms  {}".format(name, 1000*r["seconds"],
+                                               counters)
+        if name in baseline:
+            ratio = r["seconds"] / max(baseline[name]["seconds"], 1e-9)
+            line += "  ({:.2f}x baseline)".format(ratio)
+            if ratio > args.threshold and r["seconds"] > 1e-3:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    # Absolute budget: a compute-only import of figures.py
+    if "import_figures" in results:
+        r = results["import_figures"]
+        if r["pyx"] or r["seconds"] > IMPORT_BUDGET:
+            regressions.append("import_figures")
+            print("import_figures over budget ({:.0f} ms, pyx={})".format(
+                  1000*r["seconds"], r["pyx"]))
+
+    # New timings over the old ones (skipped stages keep their baseline):
+    if args.save:
+        saved = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f: saved = json.load(f)
+        saved.update(results)
+        with open(args.baseline, "w") as f: json.dump(saved, f, indent=2)
+        print("Baseline saved to", args.baseline)
+
+    sys.exit(1 if regressions or failures else 0)
+
+################################################################################
@@ -0,0 +1,117 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Contact sheet of the figures (needs Ghostscript):
+#
+#   python catalogue.py                   # pictures/*.pdf -> catalogue.pdf
+#   python catalogue.py --cols 10 --dpi 30
+#
+# Every figure is rasterized at --dpi into thumbs/<name>.pgm, in parallel,
+# and the thumbnails are composed into a single labelled PDF page. A
+# thumbnail is reused while its figure is unchanged: figures are compared
+# by the digest of their PDF without the creation date and the document
+# ID, which change on every build, so after an edit only the figures that
+# really changed are rasterized again.
+
+import os, re, json, glob, hashlib, argparse
+
+from concurrent.futures import ProcessPoolExecutor
+
+from images import *
+
+### THUMBNAILS #################################################################
+
+VOLATILE = re.compile(rb"/(CreationDate|ModDate)\s*\([^)]*\)|/ID\s*\[[^\]]*\]")
+
+def digest(filename):
+    with open(filename, "rb") as f:
+        return hashlib.sha256(VOLATILE.sub(b"", f.read())).hexdigest()
+
+def thumbnail(job):
+    filename, target, dpi = job
+    write_pnm(target, rasterize(filename, dpi))
+    return target
+
+def thumbnails(files, folder, dpi, jobs):
+
+    # Thumbnails of the files (rasterizing only the new or changed ones):
+    index = os.path.join(folder, "index.json")
+    cache = {}
+    if os.path.exists(index):
+        with open(index) as f: cache = json.load(f)
+
+    keys, todo = {}, []
+    for filename in files:
+        name   = os.path.splitext(os.path.basename(filename))[0]
+        target = os.path.join(folder, name + ".pgm")
+        keys[name] = "{}@{}".format(digest(filename), dpi)
+        if cache.get(name) != keys[name] or not os.path.exists(target):
+            todo.append((filename, target, dpi))
+
+    if todo:
+        with ProcessPoolExecutor(jobs) as pool: list(pool.map(thumbnail, todo))
+    with open(index, "w") as f: json.dump(keys, f, indent=0)
+
+    THUMBS = []
+    for name in keys:
+        with open(os.path.join(folder, name + ".pgm"), "rb") as f:
+            THUMBS.append((name, read_pnm(f.read())))
+    return THUMBS, len(todo)
+
+### CONTACT SHEET ##############################################################
+
+def contact_sheet(THUMBS, filename, cols=8, cell=2.5, gap=0.3):
+
+    # Thumbnails (scaled to cells of cell x 1.5*cell cm) with their names:
+    from pyx import canvas, path, style, color, bitmap, text
+    rows   = -(-len(THUMBS) // cols)
+    height = 1.5*cell
+    SHEET  = canvas.canvas()
+    for k, (name, (width, h, channels, pixels)) in enumerate(THUMBS):
+        r, c  = divmod(k, cols)
+        x, y  = c*(cell + gap), (rows - 1 - r)*(height + gap + 0.4)
+        s     = min(cell/width, height/h)
+        image = bitmap.image(width, h, "L" if channels == 1 else "RGB",
+                             pixels)
+        SHEET.insert(bitmap.bitmap(x + (cell - s*width)/2,
+                                   y + (height - s*h)/2 + 0.4, image,
+                                   width=s*width, compressmode="Flate"))
+        SHEET.stroke(path.rect(x, y + 0.4, cell, height),
+                     [style.linewidth.THIN, color.grey(0.7)])
+        SHEET.text(x + cell/2, y + 0.15, r"\tiny " + name.replace("_", r"\_"),
+                   [text.halign.center])
+    SHEET.writePDFfile(filename)
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    import figures
+
+    parser = argparse.ArgumentParser(description="Contact sheet")
+    parser.add_argument("--pictures", default="pictures")
+    parser.add_argument("--patterns", nargs="*",
+                        default=["Spiral_*.pdf", "Example_*.pdf"])
+    parser.add_argument("--thumbs",   default="thumbs")
+    parser.add_argument("--output",   default="catalogue.pdf")
+    parser.add_argument("--dpi",      type=int, default=20)
+    parser.add_argument("--cols",     type=int, default=8)
+    parser.add_argument("--jobs",     type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    files = sorted(f for p in args.patterns
+                     for f in glob.glob(os.path.join(args.pictures, p)))
+    os.makedirs(args.thumbs, exist_ok=True)
+    THUMBS, drawn = thumbnails(files, args.thumbs, args.dpi, args.jobs)
+    figures.setup()
+    contact_sheet(THUMBS, args.output, args.cols)
+    print("{} figures ({} rasterized) in {}".format(len(THUMBS), drawn,
+                                                    args.output))
+
+################################################################################
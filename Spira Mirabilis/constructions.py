@@ -0,0 +1,162 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+from math     import *
+from geometry import *
+
+# Every construction takes a frame (see frame() below) and a position t on
+# the spiral measured in turns (the radius i of a template is t = i/radii)
+# and returns (RECTANGLE, INPUT, OUTPUT) in the coordinates of the drawing:
+# the four corners of the rectangle (or None), the points that are given
+# and the points that the spiral finds. Nothing is sampled: two points of a
+# K/angle spiral that are d degrees apart have radii in proportion K^(d/angle).
+
+### FRAME ######################################################################
+
+def frame(K, angle, **kwargs):
+
+    # Spiral and page layout (same keywords as template()):
+    K_per_turn, rotation, scale, X, Y, X_top, Y_top, last = layout(K, angle,
+                                                                   **kwargs)
+    return (K, angle, K_per_turn, rotation, scale, X, Y)
+
+def point(frame, t):
+
+    # Point of the spiral after t turns:
+    K, angle, K_per_turn, rotation, scale, X, Y = frame
+    x, y = spiral_point(K_per_turn, t, rotation)
+    return (scale*x - X, scale*y - Y)
+
+def center(frame):
+    return (-frame[5], -frame[6])
+
+def construct(construction, frame):
+
+    # (RECTANGLE, INPUT, OUTPUT) of construction(frame), or a ValueError when
+    # the spiral can't do it (divide() and golden_section() return None):
+    result = construction(frame)
+    if result is None:
+        raise ValueError("the construction is not possible on the {:g}/{:g}° "
+                         "spiral".format(frame[0], frame[1]))
+    return result
+
+def turns_for(frame, ratio, tolerance=1e-9):
+
+    # Turns (a multiple of 1/2) that shrink the spiral by ratio, or None:
+    K_per_turn = frame[2]
+    if ratio <= 0 or K_per_turn == 1: return None
+    t = log(ratio)/log(K_per_turn)
+    if abs(2*t - round(2*t)) > tolerance or round(2*t) <= 0: return None
+    return round(2*t)/2
+
+### PROPORTIONS ################################################################
+
+def proportion(frame, t, degrees):
+
+    # Spiral points d degrees apart and the proportion of their radii:
+    K, angle = frame[0], frame[1]
+    return (point(frame, t), point(frame, t + degrees/360), K**(degrees/angle))
+
+def rectangle(frame, t, degrees=None):
+    """
+    Rectangle with a corner at the center and two sides on the radii
+    through t and t + degrees/360 (degrees must be 90 or 270, by default the
+    first one available in the spiral). Its proportion is K^(degrees/angle):
+    the A-paper rectangle of √2/90° and √2/270°, the set square of √3/270°,
+    the credit card of Phi/270°... INPUT holds the center and the short
+    side, OUTPUT the long side.
+    """
+
+    # Perpendicular radii:
+    if degrees is None: degrees = 90 if frame[1] <= 90 else 270
+    assert(degrees % 180 == 90)
+    O = center(frame)
+    P, Q, r = proportion(frame, t, degrees)
+
+    # get_rectangle() turns clockwise, so 270° starts on the other side:
+    if degrees % 360 == 90: RECTANGLE = get_rectangle(O, P, 1/r)
+    else:                   RECTANGLE = get_rectangle(P, O, 1/r)
+    return (RECTANGLE, (O, Q), (P,))
+
+def triangle(frame, t, degrees=None):
+    """
+    Right triangle with the two radii of rectangle() as legs: the set square
+    of √3/270°. INPUT and OUTPUT as in rectangle().
+    """
+
+    RECTANGLE, (O, Q), (P,) = rectangle(frame, t, degrees)
+    return ((P, O, Q), (O, Q), (P,))
+
+def square(frame, t):
+    """
+    Square with a corner at the center and a side on the radius through t.
+    Its diagonal lies on the radius 45° before t, where the spiral finds the
+    far corner if K^(45/angle) = √2 (like 2/90°). INPUT holds the center and
+    the side, OUTPUT the far corner.
+    """
+
+    O, P = center(frame), point(frame, t)
+    A, B, C, D = get_rectangle(P, O, 1)
+    return ((A, B, C, D), (O, P), (D,))
+
+def root(frame, t, n):
+    """
+    Rectangle whose sides are in proportion K^(1/n) using the radii through
+    t and t + angle/(360n): the √2 rectangle of 4/360° (n=4) or doubling the
+    cube with 2/270° (n=3). INPUT holds the center and the short side,
+    OUTPUT the long side (as in rectangle()).
+    """
+
+    assert(n > 0)
+    K, angle = frame[0], frame[1]
+    O = center(frame)
+    P, Q, r = proportion(frame, t, angle/n)
+    return (get_rectangle(O, P, 1/r), (O, Q), (P,))
+
+### DIVISIONS ##################################################################
+
+def divide(frame, t, n, ratio=1/2, across=None):
+    """
+    Divide a segment in n equal parts (n can be any real number > 1, the
+    golden section is n = Phi). The segment goes from the center to the
+    point t and the spiral finds its n-th part after a whole number of
+    turns; or else it goes across the center, between t and t + j + 1/2,
+    and the center splits it at 1/n (across=False or True allows only one
+    of them). The rectangle on the segment is ratio times as wide as long
+    (negative on the other side). Returns None if the spiral can't do it.
+    """
+
+    assert(n > 1)
+    O = center(frame)
+    P = point(frame, t)
+
+    # Same radius: |OP|/|OQ| = n
+    j = turns_for(frame, n)
+    if j is not None and j == int(j) and not across:
+        Q = point(frame, t + j)
+        return (get_rectangle(O, P, ratio), (O, P), (Q,))
+
+    # Opposite radii: |OP|/|OQ| = n-1
+    j = turns_for(frame, n-1)
+    if j is not None and j != int(j) and across is not False:
+        Q = point(frame, t + j)
+        return (get_rectangle(P, Q, ratio), (P, Q), (O,))
+
+    return None
+
+def golden_section(frame, t, ratio=1/2, across=None):
+    return (divide(frame, t, (1+sqrt(5))/2, ratio, across) or
+            divide(frame, t, (3+sqrt(5))/2, ratio, across))
+
+def divisions(frame, t, N=range(2, 11)):
+
+    # Every n in N that the spiral can divide in equal parts:
+    return tuple(n for n in N if divide(frame, t, n) is not None)
+
+################################################################################
@@ -0,0 +1,248 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# DXF templates for laser cutting:
+#
+#   python dxf.py                           # every template, dxf/*.dxf
+#   python dxf.py Phi --tolerance 0.005     # max. deviation of the cut (mm)
+#
+# The spiral is not written as its 3600 samples but as circular biarcs
+# (pairs of arcs meeting with the same tangent) through points of the
+# spiral with its exact tangents, so the cut is smooth (tangent continuous)
+# and the cutter does not slow down at every vertex. Every biarc is checked
+# against the spiral and split until it is within --tolerance of it. The
+# radii, the logo box and the construction are plain lines and circles.
+# Units are mm with the origin at the bottom left corner of the paper, and
+# every kind of line has its own layer (SPIRAL, RADII, DASHED, LOGO...).
+
+import os, argparse
+
+from math     import *
+from geometry import *
+
+from labels        import label, ascii_text
+from constructions import construct
+
+### BIARCS #####################################################################
+
+def arc(P, T, Q):
+
+    # Arc from P with unit tangent T to Q as (center, radius, ccw) or None
+    # when it is a straight segment:
+    N = (-T[1], T[0])
+    w = (Q[0] - P[0], Q[1] - P[1])
+    n = N[0]*w[0] + N[1]*w[1]
+    if abs(n) < 1e-12*(w[0]*w[0] + w[1]*w[1]): return None
+    s = (w[0]*w[0] + w[1]*w[1]) / (2*n)
+    return ((P[0] + s*N[0], P[1] + s*N[1]), abs(s), s > 0)
+
+def biarc(P0, T0, P1, T1):
+
+    # Two arcs (see arc()) from P0 with tangent T0 to P1 with tangent T1,
+    # with the same tangent at their joint M and chords of equal weight:
+    v  = (P1[0] - P0[0], P1[1] - P0[1])
+    t  = (T0[0] + T1[0], T0[1] + T1[1])
+    vt = v[0]*t[0] + v[1]*t[1]
+    vv = v[0]*v[0] + v[1]*v[1]
+    denominator = 2*(1 - (T0[0]*T1[0] + T0[1]*T1[1]))
+    if denominator < 1e-12: d = vv/(4*(v[0]*T1[0] + v[1]*T1[1]))
+    else:                   d = (-vt + sqrt(vt*vt + denominator*vv))/denominator
+    M = ((P0[0] + P1[0] + d*(T0[0] - T1[0]))/2,
+         (P0[1] + P1[1] + d*(T0[1] - T1[1]))/2)
+    return (P0, arc(P0, T0, M), M, arc(P1, (-T1[0], -T1[1]), M), P1)
+
+def deviation(B, points):
+
+    # Max. distance from the points to the circles (or lines) of biarc B:
+    P0, A0, M, A1, P1 = B
+    worst = 0
+    for p in points:
+        d = inf
+        for a, (u, v) in ((A0, (P0, M)), (A1, (M, P1))):
+            if a: d = min(d, abs(hypot(p[0] - a[0][0], p[1] - a[0][1]) - a[1]))
+            else:
+                L = hypot(v[0] - u[0], v[1] - u[1]) or 1
+                d = min(d, abs((p[0] - u[0])*(v[1] - u[1]) -
+                               (p[1] - u[1])*(v[0] - u[0]))/L)
+        worst = max(worst, d)
+    return worst
+
+def arc_points(A, P, Q, n):
+
+    # n points of the arc (see arc()) from P to Q, evenly spaced inside it:
+    if A is None:
+        return [(P[0] + (Q[0] - P[0])*(k+1)/(n+1),
+                 P[1] + (Q[1] - P[1])*(k+1)/(n+1)) for k in range(n)]
+    (cx, cy), r, ccw = A
+    a = atan2(P[1] - cy, P[0] - cx)
+    b = atan2(Q[1] - cy, Q[0] - cx)
+    d = (b - a) % (2*pi) if ccw else -((a - b) % (2*pi))
+    return [(cx + r*cos(a + d*(k+1)/(n+1)), cy + r*sin(a + d*(k+1)/(n+1)))
+            for k in range(n)]
+
+def distance(point, a, b, Q, samples=16, iterations=40):
+
+    # Distance from Q to the curve point(t), t in [a, b], from a scan of
+    # samples refined by golden section search:
+    def d(t):
+        p = point(t)
+        return hypot(p[0] - Q[0], p[1] - Q[1])
+    h = (b - a)/samples
+    t = min((a + h*k for k in range(samples + 1)), key=d)
+    lo, hi = max(a, t - h), min(b, t + h)
+    g = (sqrt(5) - 1)/2
+    for _ in range(iterations):
+        x1, x2 = hi - g*(hi - lo), lo + g*(hi - lo)
+        if d(x1) < d(x2): hi = x2
+        else:             lo = x1
+    return min(d(t), d((lo + hi)/2))
+
+def spiral_biarcs(point, tangent, t0, t1, tolerance, pieces=4, checks=8):
+
+    # Biarcs through the curve point(t) (with unit tangent(t)) from t0 to t1,
+    # starting with pieces and splitting until within tolerance: both the
+    # samples of the curve (to the circles of the biarc) and the points of
+    # the arcs (to the curve) are checked, against half the tolerance to
+    # cover the error between them:
+    B, stack = [], [(t0 + (t1 - t0)*k/pieces, t0 + (t1 - t0)*(k+1)/pieces)
+                    for k in reversed(range(pieces))]
+    while stack:
+        a, b = stack.pop()
+        C = biarc(point(a), tangent(a), point(b), tangent(b))
+        P0, A0, M, A1, P1 = C
+        samples = [point(a + (b - a)*(k+1)/(checks+1)) for k in range(checks)]
+        error = deviation(C, samples)
+        if error <= tolerance/2:
+            Q = arc_points(A0, P0, M, checks//2) + \
+                arc_points(A1 and (A1[0], A1[1], not A1[2]), M, P1, checks//2)
+            error = max(distance(point, a, b, q) for q in Q)
+        if error > tolerance/2 and b - a > 1e-9:
+            stack += [((a + b)/2, b), (a, (a + b)/2)]
+        else:
+            B.append(C)
+    return B
+
+### DXF ########################################################################
+
+LAYERS = (("SPIRAL", 1), ("RADII", 5), ("DASHED", 4), ("LOGO", 7),
+          ("RECTANGLE", 2), ("INPUT", 1), ("OUTPUT", 5))
+
+def entity(kind, layer, *pairs):
+    return "0\n{}\n8\n{}\n".format(kind, layer) + "".join(
+           "{}\n{}\n".format(code, round(value, 6) if isinstance(value, float)
+                                   else value) for code, value in pairs)
+
+def line(layer, A, B):
+    return entity("LINE", layer, (10, A[0]), (20, A[1]), (30, 0.0),
+                                 (11, B[0]), (21, B[1]), (31, 0.0))
+
+def arc_entity(layer, A, P, Q):
+
+    # DXF arcs go counterclockwise from the start to the end angle:
+    if A is None: return line(layer, P, Q)
+    (cx, cy), r, ccw = A
+    a = degrees(atan2(P[1] - cy, P[0] - cx))
+    b = degrees(atan2(Q[1] - cy, Q[0] - cx))
+    if not ccw: a, b = b, a
+    return entity("ARC", layer, (10, cx), (20, cy), (30, 0.0), (40, r),
+                  (50, a % 360), (51, b % 360))
+
+def circle(layer, C, r):
+    return entity("CIRCLE", layer, (10, C[0]), (20, C[1]), (30, 0.0), (40, r))
+
+def text(layer, C, height, t):
+    return entity("TEXT", layer, (10, C[0]), (20, C[1]), (30, 0.0),
+                  (40, height), (1, t), (72, 1),
+                  (11, C[0]), (21, C[1]), (31, 0.0))
+
+def write_template(filename, symbol, K, angle, radii=24,
+                   width=210, height=297, margin=15,
+                   points_per_turn=360, turns=10, min_radii=5,
+                   construction=None, precomputed=None, tolerance=0.01):
+
+    # Same figure as draw_template() in figures.py, returns the number of
+    # entities and of arcs of the spiral:
+    precomputed, R = template_layout(K, angle, radii, width, height, margin,
+                                     points_per_turn, turns, min_radii,
+                                     precomputed)
+    K_per_turn, rotation, scale, X, Y, X_top, Y_top, last, P = precomputed
+    mm = paper_mm(precomputed, width, height, margin)
+
+    # Spiral as a curve of t (turns), in mm:
+    def point(t):
+        r, a = K_per_turn**(-t), 2*pi*t - rotation
+        return mm((scale*r*sin(a) - X, scale*r*cos(a) - Y))
+    def tangent(t):
+        u, v = spiral_tangent(K_per_turn, t, rotation)
+        L = hypot(u, v)
+        return (u/L, v/L)
+    t_end = (len(P) - 1)/points_per_turn
+    B = spiral_biarcs(point, tangent, 0, t_end, tolerance,
+                      max(1, ceil(4*t_end)))
+
+    E = []
+    for P0, A0, M, A1, P1 in B:
+        E.append(arc_entity("SPIRAL", A0, P0, M))
+        E.append(arc_entity("SPIRAL", A1 and (A1[0], A1[1], not A1[2]),
+                            M, P1))
+    for i, r in enumerate(R):
+        dashed = radii >= 8 and radii%2 == 0 and i%2 == 1
+        E.append(line("DASHED" if dashed else "RADII", mm((-X, -Y)),
+                      mm((scale*r[0]-X, scale*r[1]-Y))))
+    box = [mm(p) for p in ((X_top-3.35, Y_top-0.95), (X_top, Y_top-0.95),
+                           (X_top, Y_top), (X_top-3.35, Y_top))]
+    E += [line("LOGO", a, b) for a, b in zip(box, box[1:] + box[:1])]
+    E.append(text("LOGO", mm((X_top-1.65, Y_top-0.75)), 5, "MMACA"))
+    E.append(text("LOGO", mm((X_top-1.65, Y_top-1.65)), 3.5,
+                  ascii_text("{} / {}°".format(label(symbol), angle))))
+    if construction:
+        frame = (K, angle, K_per_turn, rotation, scale, X, Y)
+        RECTANGLE, INPUT, OUTPUT = construct(construction, frame)
+        if RECTANGLE:
+            Q = [mm(p) for p in RECTANGLE]
+            E += [line("RECTANGLE", a, b) for a, b in zip(Q, Q[1:] + Q[:1])]
+        E += [circle("INPUT",  mm(p), 2.5) for p in INPUT]
+        E += [circle("OUTPUT", mm(p), 2.5) for p in OUTPUT]
+
+    with open(filename, "w") as f:
+        f.write("0\nSECTION\n2\nHEADER\n9\n$ACADVER\n1\nAC1009\n0\nENDSEC\n")
+        f.write("0\nSECTION\n2\nTABLES\n0\nTABLE\n2\nLAYER\n70\n{}\n".format(
+                len(LAYERS)))
+        for name, color in LAYERS:
+            f.write("0\nLAYER\n2\n{}\n70\n0\n62\n{}\n6\nCONTINUOUS\n".format(
+                    name, color))
+        f.write("0\nENDTAB\n0\nENDSEC\n0\nSECTION\n2\nENTITIES\n")
+        f.write("".join(E))
+        f.write("0\nENDSEC\n0\nEOF\n")
+    return len(E), 2*len(B)
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    import figures
+
+    parser = argparse.ArgumentParser(description="DXF templates")
+    parser.add_argument("constants", nargs="*",
+                        help="names of figures.CONSTANTS (default: all)")
+    parser.add_argument("--tolerance", type=float, default=0.01, help="mm")
+    parser.add_argument("--folder",    default="dxf")
+    args = parser.parse_args()
+
+    jobs, L = figures.template_layouts(args.constants)
+    os.makedirs(args.folder, exist_ok=True)
+    for (name, symbol, value, a), precomputed in zip(jobs, L):
+        filename = "Spiral_{}_{:03d}".format(name, a)
+        entities, arcs = write_template(
+            os.path.join(args.folder, filename + ".dxf"), symbol, value, a,
+            precomputed=precomputed, tolerance=args.tolerance)
+        print("{}: {} arcs instead of {} segments ({} entities)".format(
+              filename, arcs, len(precomputed[-1]) - 1, entities))
+
+################################################################################
@@ -7,73 +7,145 @@
 #                                                       #
 #########################################################
 
-from pyx  import *
-from math import *
+from math     import *
+from geometry import *
+from tracing  import span, traced
 
-### AUXILIARY FUNCTIONS ########################################################
+from constructions import (construct, rectangle, triangle, square, root,
+                           divide, golden_section)
 
-def get_rectangle(A,B, ratio):
-    v = (B[1]-A[1],A[0]-B[0])
-    k = ratio #/ hypot(*v)
-    C = (B[0] + k*v[0], B[1] + k*v[1])
-    D = (A[0] + k*v[0], A[1] + k*v[1])
-    return (A,B,C,D)
-    
-def logarithmic_spiral(factor_per_turn, turns, points_per_turn, rotation=0):
+import os, importlib
+
+# Output formats of the figures (SPIRA_FORMATS=pdf,svg for both):
+FORMATS = tuple(os.environ.get("SPIRA_FORMATS", "pdf").split(","))
+
+### LAZY PYX ###################################################################
 
-    # Sanity checks
-    assert(factor_per_turn > 0)
-    assert(turns           > 0)
-    assert(points_per_turn > 0)
+# The pyx modules are imported the first time something is drawn, so the
+# geometry (see geometry.py) can be used without paying for them:
 
-    # Derived constants
-    N = int(turns*points_per_turn) + 1
-    A = 2*pi/points_per_turn
-    R = (1/factor_per_turn)**(1/points_per_turn)
+class lazy:
 
-    # Return points
-    return tuple(((R**i)*sin(A*i - rotation),
-                  (R**i)*cos(A*i - rotation)) for i in range(N))
+    def __init__(self, name): self.name = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module("pyx." + self.name)
+        globals()[self.name] = module
+        return getattr(module, attr)
+
+canvas, path, style = lazy("canvas"), lazy("path"), lazy("style")
+color,  deco, text  = lazy("color"),  lazy("deco"), lazy("text")
+
+### AUXILIARY FUNCTIONS ########################################################
 
 def put_text(x, y, t, s=[]):
     return (path.path(path.moveto(x-0.01,y),
                       path.lineto(x+0.01,y)),[deco.curvedtext(t)]+s)
 
+def polylines(lines):
+
+    # One path with all the polylines (a single stroke in the PDF):
+    items = []
+    for line in lines:
+        items.append(path.moveto(*line[0]))
+        items.extend(path.lineto(*p) for p in line[1:])
+    return path.path(*items)
+
+def dots(points):
+
+    # One path with a zero length segment at every point, that stroked with
+    # round caps draws a dot as wide as the line at each of them:
+    items = []
+    for x, y in points: items += [path.moveto(x, y), path.lineto(x, y)]
+    return path.path(*items)
+
+def fibonacci(layout, line_style, rectangle_style=None):
+
+    # Whirling squares of the Fibonacci spiral (see whirl() in geometry.py)
+    # placed on the Phi/90° template of layout (it starts at the origin):
+    X, Y   = layout[3:5]
+    LAMBDA = 0.8
+    ALPHA  = 90 *pi/180
+    F, STEPS, BOUNDARY, LINES = whirl((0,0), (LAMBDA*cos(ALPHA),
+                                             LAMBDA*sin(ALPHA)), 8)
+    XX, YY = X - 0.1, Y + 0.4
+
+    CANVAS = canvas.canvas()
+    if rectangle_style:
+        A,B,C,D = [F[i] for i in BOUNDARY]
+        CANVAS.stroke(path.path(path.moveto(A[0]-XX, A[1]-YY),
+                                path.lineto(B[0]-XX, B[1]-YY),
+                                path.lineto(C[0]-XX, C[1]-YY),
+                                path.lineto(D[0]-XX, D[1]-YY),
+                                path.closepath()),
+                                rectangle_style)
+    for A,B in LINES:
+        CANVAS.stroke(path.path(path.moveto(F[A][0]-XX, F[A][1]-YY),
+                                path.lineto(F[B][0]-XX, F[B][1]-YY)),
+                                line_style)
+    return CANVAS
+
+def write(CANVAS, filename):
+
+    # Output of the examples in FORMATS (SVG with compact paths, see svg.py):
+    if "pdf" in FORMATS: CANVAS.writePDFfile("./pictures/" + filename)
+    if "svg" in FORMATS:
+        import svg
+        svg.write_canvas(CANVAS, "./pictures/" + filename + ".svg")
+
 def template(filename, symbol, K, angle, radii=24,
             width=210, height=297, margin=15,
-            points_per_turn=360, turns=10, min_radii=5):
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
+            points_per_turn=360, turns=10, min_radii=5,
+            construction=None, styles=None, precomputed=None, output=None):
+
+    # Output PDF (to ./pictures/ unless output, a file name or a binary file,
+    # is given):
+    if output or "pdf" in FORMATS:
+        CANVAS = draw_template(filename, symbol, K, angle, radii,
+                               width, height, margin,
+                               points_per_turn, turns, min_radii,
+                               construction, styles, precomputed)
+        with span("writePDFfile", figure=filename):
+            CANVAS.writePDFfile(output or "./pictures/" + filename)
+
+    # Output SVG (straight from the layout, see svg.py):
+    if not output and "svg" in FORMATS:
+        import svg
+        with span("writeSVGfile", figure=filename):
+            svg.write_template("./pictures/" + filename + ".svg", symbol, K,
+                               angle, radii, width, height, margin,
+                               points_per_turn, turns, min_radii,
+                               construction, precomputed)
+
+def draw_template(filename, symbol, K, angle, radii=24,
+                  width=210, height=297, margin=15,
+                  points_per_turn=360, turns=10, min_radii=5,
+                  construction=None, styles=None, precomputed=None,
+                  border=None, logo=True, background=None):
+
+    # Canvas of template(), centered at the paper center (in cm). Without
+    # margin the figure ends at the spiral extremes, (-X_top, -Y_top) and
+    # (X_top, Y_top), otherwise at the paper border (white unless a border
+    # color is given, none if border is False). The logo and info can be
+    # left out and a background canvas goes under everything else.
+
+    # Compute K_per_turn, rotation, scale, center, extremes, Points (without
+    # the ones that are too close to the center) and Radii, unless they come
+    # from a batch call to layouts(..., samples=True):
+    with span("layout", figure=filename) as S:
+        precomputed, R = template_layout(K, angle, radii, width, height,
+                                         margin, points_per_turn, turns,
+                                         min_radii, precomputed)
+        K_per_turn, rotation, scale, X, Y, X_top, Y_top, last, P = precomputed
+        W, H = (width-1)/20, (height-1)/20
+        S.count("points", len(P))
+        S.count("radii",  len(R))
+
+    # Compute Construction (see constructions.py):
+    if construction:
+        frame = (K, angle, K_per_turn, rotation, scale, X, Y)
+        RECTANGLE, INPUT, OUTPUT = construct(construction, frame)
+        rectangle_style, input_style, output_style = styles
 
     # Setup drawing:
     CANVAS = canvas.canvas()
@@ -81,43 +153,64 @@ def template(filename, symbol, K, angle, radii=24,
     THICK  = BASE + [style.linewidth.THick]
     DASHED = BASE + [style.linestyle.dashed]
     DOTTED = BASE + [style.linestyle.dotted]
-    
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
+    if background: CANVAS.insert(background)
+    
+    # Draw RECTANGLE (or any other polygon)
+    if construction and RECTANGLE:
+        PATH = path.path(path.moveto(*RECTANGLE[0]))
+        for p in RECTANGLE[1:]: PATH.append(path.lineto(*p))
+        PATH.append(path.closepath())
+        CANVAS.stroke(PATH, rectangle_style)
+
+    if logo:
+        with span("text", figure=filename, labels=2):
+
+            # Draw Logo:
+            CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
+            CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75,
+                                  r"{\huge \bfseries MMACA}",
+                                  [color.rgb.white]))
+
+            # Draw Info:
+            info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
+            CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65,
+                                  r"{\Large "+info+"}"))
+    
+    with span("paths", figure=filename) as S:
+
+        # Draw Radii:
+        if   radii   <  8: R_STYLE = [BASE] * (radii+1)
+        elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
+        else:              R_STYLE = [BASE] * (radii+1)
+        for i,r in enumerate(R):
+            CANVAS.stroke(path.path(path.moveto(-X, -Y),
+                                    path.lineto(scale*r[0]-X, scale*r[1]-Y)),
+                                    R_STYLE[i])
+
+        # Draw Spiral:
+        PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
+        for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
+        CANVAS.stroke(PATH, THICK)
+        S.count("elements", len(PATH.pathitems) + 2*len(R))
+
+    # Draw INPUT and OUTPUT:
+    if construction:
+        for p in INPUT:  CANVAS.stroke(path.circle(p[0], p[1], 0.25),
+                                       input_style)
+        for p in OUTPUT: CANVAS.stroke(path.circle(p[0], p[1], 0.25),
+                                       output_style)
 
     # Draw Paper Border:
-    if margin:
+    if margin and border is not False:
         CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
                                 path.lineto( W,  H), path.lineto( W, -H),
                                 path.closepath()),
-                                BASE + [color.rgb.white, style.linewidth.THIN])
+                                BASE + [border or color.rgb.white,
+                                        style.linewidth.THIN])
 
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    return CANVAS
 
+@traced
 def example_00(rectangle_style, input_style, output_style):
     """
     Frontpage Logo
@@ -128,81 +221,14 @@ def example_00(rectangle_style, input_style, output_style):
     K               = (1+sqrt(5))/2
     angle           = 90
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
+    # Spiral and radii, without logo (see draw_template()):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           logo=False)
 
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.white, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_00b(rectangle_style, input_style, output_style):
     """
     Frontpage Logo
@@ -213,81 +239,14 @@ def example_00b(rectangle_style, input_style, output_style):
     K               = (1+sqrt(5))/2
     angle           = 90
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
+    # Spiral and radii, without logo nor paper border:
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           logo=False, border=False)
 
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    #if margin:
-    #    CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-    #                            path.lineto( W,  H), path.lineto( W, -H),
-    #                            path.closepath()),
-    #                            BASE + [color.rgb.white, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_01(rectangle_style, input_style, output_style):
     """
     Un full de paper de mida A7 encaixa a l'espiral √2/270°.
@@ -299,110 +258,16 @@ def example_01(rectangle_style, input_style, output_style):
     K               = sqrt(2)
     angle           = 270
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((scale*RR[5][0]-X,scale*RR[5][1]-Y),
-                            (              -X,              -Y),
-                            1/sqrt(2))
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(C[0], C[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), output_style)
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
+    # A7 paper on the radii 5 and 23 (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: rectangle(F, 5/24),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_02(rectangle_style, input_style, output_style):
     """
     Un full de paper de mida A7 encaixa a l'espiral √2/90°.
@@ -414,110 +279,16 @@ def example_02(rectangle_style, input_style, output_style):
     K               = sqrt(2)
     angle           = 90
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
+    # A7 paper on the radii 9 and 15 (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: rectangle(F, 9/24),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((              -X,              -Y),
-                            (scale*RR[9][0]-X,scale*RR[9][1]-Y),
-                            1/sqrt(2))
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(D[0], D[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), output_style)
-        
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_03(rectangle_style, input_style, output_style):
     """
     Divideix un rectangle en 3 parts iguals amb l'ajuda de l'espiral 3/360°.
@@ -529,111 +300,16 @@ def example_03(rectangle_style, input_style, output_style):
     K               = 3
     angle           = 360
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
+    # Thirds of the radius 3, one turn later (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: divide(F, 3/24, 3),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((              -X,              -Y),
-                            (scale*RR[3][0]-X,scale*RR[3][1]-Y),
-                            1/2)
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(scale*RR[27][0]-X, scale*RR[27][1]-Y, 0.25),
-                              output_style)
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_04(rectangle_style, input_style, output_style):
     """
     Divideix un rectangle en 3 parts iguals amb l'ajuda de l'espiral 3/360°.
@@ -645,110 +321,16 @@ def example_04(rectangle_style, input_style, output_style):
     K               = 4
     angle           = 360
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((scale*RR[14][0]-X,scale*RR[14][1]-Y),
-                            (scale*RR[26][0]-X,scale*RR[26][1]-Y),
-                            1/2)
+    # Thirds of the radii 14 and 26 across the center (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: divide(F, 14/24, 3),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(-X, -Y, 0.25), output_style)
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_05(rectangle_style, input_style, output_style):
     """
     Crea un rectangle de proporcions 1:√2 amb ajuda de l'espiral 4/360°
@@ -759,111 +341,16 @@ def example_05(rectangle_style, input_style, output_style):
     K               = 4
     angle           = 360
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
+    # √2 rectangle on the radii 20 and 26 (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: root(F, 20/24, 4),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((scale*RR[26][0]-X,scale*RR[26][1]-Y),
-                            (-X,-Y),
-                            sqrt(2))
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(scale*RR[20][0]-X, scale*RR[20][1]-Y, 0.25),
-                              output_style)
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_06(rectangle_style, input_style, output_style):
     """
     Comprova quines són les proporcions dels catets d'un escaire
@@ -875,111 +362,16 @@ def example_06(rectangle_style, input_style, output_style):
     K               = sqrt(3)
     angle           = 270
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((scale*RR[1][0]-X,scale*RR[1][1]-Y),
-                            (-X,-Y),
-                            1/sqrt(3))
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            #path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(C[0], C[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25),
-                              output_style)
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
+    # Set square on the radii 1 and 19 (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: triangle(F, 1/24),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_07(rectangle_style, input_style, output_style):
     """
     Comprova quina relació hi ha entre la diagonal i el costat d'un quadrat
@@ -991,110 +383,17 @@ def example_07(rectangle_style, input_style, output_style):
     K               = 2
     angle           = 90
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((scale*RR[8][0]-X,scale*RR[8][1]-Y),
-                            (-X,-Y),
-                            1)
+    # Square on the radius 8, its diagonal on the radius 5 (see
+    # constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: square(F, 8/24),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(D[0], D[1], 0.25), output_style)
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_08(rectangle_style, input_style, output_style):
     """
     Comprova que les targetes de crèdit tenen són rectangles auris
@@ -1106,110 +405,16 @@ def example_08(rectangle_style, input_style, output_style):
     K               = (1+sqrt(5))/2
     angle           = 270
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
+    # Credit card on the radii 15 and 33 (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: rectangle(F, 15/24),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((scale*RR[15][0]-X,scale*RR[15][1]-Y),
-                            (-X,-Y),
-                            1/K)
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(C[0], C[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), output_style)
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_09(rectangle_style, input_style, output_style):
     """
     Divideix un segment en proporció àuria amb l'ajuda de l'espiral Phi/360°
@@ -1221,111 +426,16 @@ def example_09(rectangle_style, input_style, output_style):
     K               = (1+sqrt(5))/2
     angle           = 360
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
+    # Golden section of the radius 4, one turn later (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: golden_section(F, 4/24),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((              -X,              -Y),
-                            (scale*RR[4][0]-X,scale*RR[4][1]-Y),
-                            1/2)
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(scale*RR[28][0]-X, scale*RR[28][1]-Y, 0.25),
-                              output_style)    
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_10(rectangle_style, input_style, output_style):
     """
     Divideix un segment en proporció àuria amb l'ajuda de l'espiral Phi/360°
@@ -1337,110 +447,18 @@ def example_10(rectangle_style, input_style, output_style):
     K               = (1+sqrt(5))/2
     angle           = 180
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((scale*RR[28][0]-X,scale*RR[28][1]-Y),
-                            (scale*RR[16][0]-X,scale*RR[16][1]-Y),
-                            1/3)
+    # Golden section of the radii 16 and 28, across the center, with a thinner
+    # rectangle on the other side (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: golden_section(F, 16/24,
+                                                                 -1/3, True),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(-X, -Y, 0.25), output_style)
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_11(rectangle_style, input_style, output_style):
     """
     Comprova que l'espiral de Fibonacci és una bona aproximació
@@ -1452,129 +470,19 @@ def example_11(rectangle_style, input_style, output_style):
     K               = (1+sqrt(5))/2
     angle           = 90
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw Fibonacci Spiral
-    LAMBDA = 0.8
-    ALPHA  = 90 *pi/180
-    F = [None] * 18
-    F[0] = (0,0)
-    F[1] = (LAMBDA*cos(ALPHA), LAMBDA*sin(ALPHA))
-    A,B,F[ 2],F[ 3] = get_rectangle(F[ 0], F[ 1], -1)
-    A,B,F[ 4],F[ 5] = get_rectangle(F[ 0], F[ 3], -1)
-    A,B,F[ 6],F[ 7] = get_rectangle(F[ 1], F[ 5], -1)
-    A,B,F[ 8],F[ 9] = get_rectangle(F[ 2], F[ 7], -1)
-    A,B,F[10],F[11] = get_rectangle(F[ 4], F[ 9], -1)
-    A,B,F[12],F[13] = get_rectangle(F[ 6], F[11], -1)
-    A,B,F[14],F[15] = get_rectangle(F[ 8], F[13], -1)
-    A,B,F[16],F[17] = get_rectangle(F[10], F[15], -1)
-
-    LINES = ((17,16),(16,14),(14,12),(17,12),(10,15),
-             (8,13),(6,11),(4,9),(2,7),(1,5),(0,3))
-
-    XX = X - 0.1
-    YY = Y + 0.4
-
-    CANVAS.stroke(path.path(path.moveto(F[17][0]-XX, F[17][1]-YY),
-                            path.lineto(F[16][0]-XX, F[16][1]-YY),
-                            path.lineto(F[14][0]-XX, F[14][1]-YY),
-                            path.lineto(F[12][0]-XX, F[12][1]-YY),
-                            path.closepath()),
-                            rectangle_style)
-
-    for A,B in LINES:
-        CANVAS.stroke(path.path(path.moveto(F[A][0]-XX, F[A][1]-YY),
-                                path.lineto(F[B][0]-XX, F[B][1]-YY)),
-                                output_style + [style.linewidth.THIck,
-                                                style.linestyle.dashed])
-
-    ARCS = ()
+    # Fibonacci spiral (whirling squares, see geometry.py) under the spiral:
+    precomputed = template_layout(K, angle)[0]
+    FIBONACCI = fibonacci(precomputed, output_style + [style.linewidth.THIck,
+                                                       style.linestyle.dashed],
+                          rectangle_style)
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           precomputed=precomputed, border=color.rgb.black,
+                           background=FIBONACCI)
 
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    #for f in F: CANVAS.stroke(path.circle(f[0]-X, f[1]-Y, 0.25), input_style)
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_11b(rectangle_style, input_style, output_style):
     """
     Comprova que l'espiral de Fibonacci és una bona aproximació
@@ -1586,129 +494,19 @@ def example_11b(rectangle_style, input_style, output_style):
     K               = (1+sqrt(5))/2
     angle           = 90
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw Fibonacci Spiral
-    LAMBDA = 0.8
-    ALPHA  = 90 *pi/180
-    F = [None] * 18
-    F[0] = (0,0)
-    F[1] = (LAMBDA*cos(ALPHA), LAMBDA*sin(ALPHA))
-    A,B,F[ 2],F[ 3] = get_rectangle(F[ 0], F[ 1], -1)
-    A,B,F[ 4],F[ 5] = get_rectangle(F[ 0], F[ 3], -1)
-    A,B,F[ 6],F[ 7] = get_rectangle(F[ 1], F[ 5], -1)
-    A,B,F[ 8],F[ 9] = get_rectangle(F[ 2], F[ 7], -1)
-    A,B,F[10],F[11] = get_rectangle(F[ 4], F[ 9], -1)
-    A,B,F[12],F[13] = get_rectangle(F[ 6], F[11], -1)
-    A,B,F[14],F[15] = get_rectangle(F[ 8], F[13], -1)
-    A,B,F[16],F[17] = get_rectangle(F[10], F[15], -1)
-
-    LINES = ((17,16),(16,14),(14,12),(17,12),(10,15),
-             (8,13),(6,11),(4,9),(2,7),(1,5),(0,3))
-
-    XX = X - 0.1
-    YY = Y + 0.4
-
-    #CANVAS.stroke(path.path(path.moveto(F[17][0]-XX, F[17][1]-YY),
-    #                        path.lineto(F[16][0]-XX, F[16][1]-YY),
-    #                        path.lineto(F[14][0]-XX, F[14][1]-YY),
-    #                        path.lineto(F[12][0]-XX, F[12][1]-YY),
-    #                        path.closepath()),
-    #                        rectangle_style)
-
-    for A,B in LINES:
-        CANVAS.stroke(path.path(path.moveto(F[A][0]-XX, F[A][1]-YY),
-                                path.lineto(F[B][0]-XX, F[B][1]-YY)),
-                                output_style + [style.linewidth.THICK,
-                                                style.linestyle.dashed])
-
-    ARCS = ()
+    # Fibonacci spiral (whirling squares, see geometry.py) under the spiral,
+    # without its rectangle nor logo:
+    precomputed = template_layout(K, angle)[0]
+    FIBONACCI = fibonacci(precomputed, output_style + [style.linewidth.THICK,
+                                                       style.linestyle.dashed])
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           precomputed=precomputed, border=color.rgb.black,
+                           logo=False, background=FIBONACCI)
 
-    # Draw Logo:
-    #CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    #CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-    #                      [color.rgb.white]))
-
-    # Draw Info:
-    #info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    #CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    #for f in F: CANVAS.stroke(path.circle(f[0]-X, f[1]-Y, 0.25), input_style)
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_12(rectangle_style, input_style, output_style):
     """
     Divideix la longitud d'un segment entre 8 amb l'ajuda de l'espiral 2/360°
@@ -1719,111 +517,16 @@ def example_12(rectangle_style, input_style, output_style):
     K               = 2
     angle           = 360
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
+    # Eighths of the radius 4, three turns later (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: divide(F, 4/24, 8),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    A,B,C,D = get_rectangle((              -X,              -Y),
-                            (scale*RR[4][0]-X,scale*RR[4][1]-Y),
-                            1/2)
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(scale*RR[76][0]-X, scale*RR[76][1]-Y, 0.25),
-                              output_style)    
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_13(rectangle_style, input_style, output_style):
     """
     Divideix la longitud d'un segment entre 9 amb l'ajuda de l'espiral 3/360°
@@ -1834,111 +537,16 @@ def example_13(rectangle_style, input_style, output_style):
     K               = 3
     angle           = 360
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
+    # Ninths of the radius 2, two turns later (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: divide(F, 2/24, 9),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((              -X,              -Y),
-                            (scale*RR[2][0]-X,scale*RR[2][1]-Y),
-                            1/2)
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), input_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(scale*RR[50][0]-X, scale*RR[50][1]-Y, 0.25),
-                              output_style)    
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_14(rectangle_style, input_style, output_style):
     """
     Fes-ho també amb l'ajuda de l'espiral Phi/90°
@@ -1949,111 +557,16 @@ def example_14(rectangle_style, input_style, output_style):
     K               = (1+sqrt(5))/2
     angle           = 90
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((              -X,              -Y),
-                            (scale*RR[7][0]-X,scale*RR[7][1]-Y),
-                            1/K)
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
+    # Golden rectangle on the radii 7 and 13 (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: rectangle(F, 7/24),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
 
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), output_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(scale*RR[13][0]-X, scale*RR[13][1]-Y, 0.25),
-                              input_style)    
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
 
+@traced
 def example_15(rectangle_style, input_style, output_style):
     """
     Espiral 2/270º i la duplicació del cub
@@ -2064,114 +577,91 @@ def example_15(rectangle_style, input_style, output_style):
     K               = 2
     angle           = 270
 
-    # Default values:    
-    radii           =  24
-    width           = 210
-    height          = 297
-    margin          =  15
-    points_per_turn = 360
-    turns           =  10
-    min_radii       =   5
-
-    # Compute K_per_turn:
-    K_per_turn = K**(360/angle)
-
-    # Select the best rotation angle (so one of the radii is vertical):
-    rotation, scale = 0, 0
-    for i in range(radii//4):
-        P = logarithmic_spiral(K_per_turn, 1, points_per_turn, i*2*pi/radii)
-        X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-        Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-        s = min((width  - 2*margin) / (X_max - X_min),
-                (height - 2*margin) / (Y_max - Y_min)) / 10
-        if scale < s: scale, rotation = s, i*2*pi/radii
-
-    # Compute Points:
-    P = logarithmic_spiral(K_per_turn, turns, points_per_turn, rotation)
-    
-    # Compute Radii:
-    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
-    else:     R = tuple()
-
-    # Compute Center and Extremes
-    X_min, X_max = min(p[0] for p in P), max(p[0] for p in P)
-    Y_min, Y_max = min(p[1] for p in P), max(p[1] for p in P) 
-    X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
-    W, H = (width-1)/20, (height-1)/20
-    X_top, Y_top = scale*X_max - X, scale*Y_max - Y, 
-
-    # Remove points that are too close to the center:
-    last_P = max(i for i in range(len(P)) if scale*hypot(*P[i]) >= min_radii/10)
-    last_P = (points_per_turn*2/radii) * round(last_P*radii/2/points_per_turn,0)
-    P = tuple(p for p in P[:int(max(points_per_turn+1,last_P))])
-
-    # Setup drawing:
-    CANVAS = canvas.canvas()
-    BASE   = [style.linecap.round, style.linejoin.round]
-    THICK  = BASE + [style.linewidth.THick]
-    DASHED = BASE + [style.linestyle.dashed]
-    DOTTED = BASE + [style.linestyle.dotted]
-
-    # Draw RECTANGLE
-    RR = logarithmic_spiral(K_per_turn, 10, radii, rotation)
-
-    A,B,C,D = get_rectangle((              -X,              -Y),
-                            (scale*RR[10][0]-X,scale*RR[10][1]-Y),
-                            1/(2**(1/3)))
-
-    CANVAS.stroke(path.path(path.moveto(A[0], A[1]),
-                            path.lineto(B[0], B[1]),
-                            path.lineto(C[0], C[1]),
-                            path.lineto(D[0], D[1]),
-                            path.closepath()), rectangle_style)
-
-    # Draw Logo:
-    CANVAS.fill(path.rect(X_top-3.35,Y_top-0.95, 3.35,0.95))
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-0.75, r"{\huge \bfseries MMACA}",
-                          [color.rgb.white]))
-
-    # Draw Info:
-    info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
-    CANVAS.draw(*put_text(X_top-1.65,Y_top-1.65, r"{\Large "+info+"}"))
-    
-    # Draw Radii:
-    if   radii   <  8: R_STYLE = [BASE] * (radii+1)
-    elif radii%2 == 0: R_STYLE = [BASE, DASHED] * (radii+1)
-    else:              R_STYLE = [BASE] * (radii+1)
-    for i,r in enumerate(R):
-        CANVAS.stroke(path.path(path.moveto(-X, -Y),
-                                path.lineto(scale*r[0]-X, scale*r[1]-Y)),
-                                R_STYLE[i])
-
-    # Draw Spiral:
-    PATH = path.path(path.moveto(scale*P[0][0]-X, scale*P[0][1]-Y))
-    for p in P[1:]: PATH.append(path.lineto(scale*p[0]-X, scale*p[1]-Y))
-    CANVAS.stroke(PATH, THICK)
-
-    # Draw INPUT:
-    CANVAS.stroke(path.circle(A[0], A[1], 0.25), input_style)
-    CANVAS.stroke(path.circle(B[0], B[1], 0.25), output_style)
-    
-    # Draw OUTPUT:
-    CANVAS.stroke(path.circle(scale*RR[16][0]-X, scale*RR[16][1]-Y, 0.25),
-                              input_style)    
-    
-    # Output SVG:
-    #CANVAS.writeSVGfile("./pictures/" + filename)
-
-    # Draw Paper Border:
-    if margin:
-        CANVAS.stroke(path.path(path.moveto(-W, -H), path.lineto(-W,  H),
-                                path.lineto( W,  H), path.lineto( W, -H),
-                                path.closepath()),
-                                BASE + [color.rgb.black, style.linewidth.THIN])
-
-    # Output PDF:
-    CANVAS.writePDFfile("./pictures/" + filename)
+    # Doubling the cube on the radii 10 and 16 (see constructions.py):
+    CANVAS = draw_template(filename, symbol, K, angle,
+                           construction=lambda F: root(F, 10/24, 3),
+                           styles=(rectangle_style, input_style, output_style),
+                           border=color.rgb.black)
+
+    # Output PDF (and/or SVG):
+    write(CANVAS, filename)
+
+### TEMPLATES ##################################################################
+
+CONSTANTS = {"2"     : (r"$2$",          2,             [90,180,270,360]),
+             "3"     : (r"$3$",          3,             [90,180,270,360]),
+             "4"     : (r"$4$",          4,             [90,180,270,360]),
+             "5"     : (r"$5$",          5,             [90,180,270,360]),
+             "E"     : (r"$e$",          e,             [90,180,270,360]),
+             "Pi"    : (r"$\pi$",        pi,            [90,180,270,360]),
+             "Root2" : (r"$\sqrt{2}$",   sqrt(2),       [90,180,270,360]),
+             "Root3" : (r"$\sqrt{3}$",   sqrt(3),       [90,180,270,360]),
+             "Root5" : (r"$\sqrt{5}$",   sqrt(5),       [90,180,270,360]),
+             "Phi"   : (r"$\phi$",       (1+sqrt(5))/2, [90,180,270,360])}
+
+def template_jobs(constants=CONSTANTS):
+    return [(name, symbol, value, a)
+            for name, (symbol, value, angles) in constants.items()
+            for a in angles]
+
+def template_layouts(constants=(), width=210, height=297, margin=15,
+                     samples=True):
+
+    # Jobs of the given constants (all of them if none) and their layouts,
+    # from one layouts() call:
+    jobs = [j for j in template_jobs() if not constants or j[0] in constants]
+    return jobs, layouts([(value, a, width, height, margin)
+                          for name, symbol, value, a in jobs],
+                         samples=samples)
+
+def draw_templates(jobs, cache=None):
+
+    # Draw the templates, computing the missing layouts in one batch (cache
+    # maps (K, angle, width, height, margin) to an already computed layout):
+    cache = {} if cache is None else cache
+    new   = [(value, a, 210, 297, 15) for name, symbol, value, a in jobs
+             if (value, a, 210, 297, 15) not in cache]
+    if new:
+        with span("layouts", templates=len(new)):
+            cache.update(zip(new, layouts(new, samples=True)))
+
+    for name, symbol, value, a in jobs:
+        filename = "Spiral_{}_{:03d}".format(name, a)
+        with span(filename):
+            template(filename, symbol, value, a,
+                     precomputed=cache[(value, a, 210, 297, 15)])
+
+def formats(filename, symbol, K, angle, papers=("A5", "A4", "A3", "A2", "A1",
+            "A0", "Letter"), radii=24, margin=15, points_per_turn=360,
+            turns=10, min_radii=5):
+
+    # The same template on several paper sizes (<filename>_<paper>). The
+    # layouts come from one layouts() call, so the rotation search tables
+    # and the spiral samples are computed once and only the rotation, scale
+    # and truncation of each paper are recomputed. Papers are names of
+    # PAPERS or (width, height) and margin can be a {paper: margin} dict:
+    sizes   = [PAPERS[p] if isinstance(p, str) else p for p in papers]
+    margins = [margin.get(p, 15) if isinstance(margin, dict) else margin
+               for p in papers]
+    with span("layouts", templates=len(papers)):
+        L = layouts([(K, angle, w, h, m) for (w, h), m in zip(sizes, margins)],
+                    radii, points_per_turn, turns, min_radii, True)
+
+    for p, (w, h), m, precomputed in zip(papers, sizes, margins, L):
+        name = p if isinstance(p, str) else "{:g}x{:g}".format(w, h)
+        with span(filename + "_" + name):
+            template(filename + "_" + name, symbol, K, angle, radii, w, h, m,
+                     points_per_turn, turns, min_radii,
+                     precomputed=precomputed)
 
 ### MAIN #######################################################################
 
-if __name__ == "__main__":
+EXAMPLES = (example_00, example_00b, example_01, example_02, example_03,
+            example_04, example_05,  example_06, example_07, example_08,
+            example_09, example_10,  example_11, example_11b, example_12,
+            example_13, example_14,  example_15)
+
+def setup():
 
     # Setup LaTeX font
     text.set(text.LatexEngine)
@@ -2185,42 +675,16 @@ if __name__ == "__main__":
     rectangle_style = [style.linecap.round, style.linejoin.round,
                        style.linewidth.THIN, color.cmyk.Goldenrod,
                        deco.filled([color.cmyk.Goldenrod])]
+    return (rectangle_style, input_style, output_style)
+
+if __name__ == "__main__":
+
+    styles = setup()
 
     # Draw examples:
-    example_00(rectangle_style, input_style, output_style)
-    example_00b(rectangle_style, input_style, output_style)
-    example_01(rectangle_style, input_style, output_style)
-    example_02(rectangle_style, input_style, output_style)
-    example_03(rectangle_style, input_style, output_style)
-    example_04(rectangle_style, input_style, output_style)
-    example_05(rectangle_style, input_style, output_style)
-    example_06(rectangle_style, input_style, output_style)
-    example_07(rectangle_style, input_style, output_style)
-    example_08(rectangle_style, input_style, output_style)
-    example_09(rectangle_style, input_style, output_style)
-    example_10(rectangle_style, input_style, output_style)
-    example_11(rectangle_style, input_style, output_style)
-    example_11b(rectangle_style, input_style, output_style)
-    example_12(rectangle_style, input_style, output_style)
-    example_13(rectangle_style, input_style, output_style)
-    example_14(rectangle_style, input_style, output_style)
-    example_15(rectangle_style, input_style, output_style)
+    for example in EXAMPLES: example(*styles)
 
     # Draw templates:
-    CONSTANTS = {"2"     : (r"$2$",          2,             [90,180,270,360]),
-                 "3"     : (r"$3$",          3,             [90,180,270,360]),
-                 "4"     : (r"$4$",          4,             [90,180,270,360]),
-                 "5"     : (r"$5$",          5,             [90,180,270,360]),
-                 "E"     : (r"$e$",          e,             [90,180,270,360]),
-                 "Pi"    : (r"$\pi$",        pi,            [90,180,270,360]),
-                 "Root2" : (r"$\sqrt{2}$",   sqrt(2),       [90,180,270,360]),
-                 "Root3" : (r"$\sqrt{3}$",   sqrt(3),       [90,180,270,360]),
-                 "Root5" : (r"$\sqrt{5}$",   sqrt(5),       [90,180,270,360]),
-                 "Phi"   : (r"$\phi$",       (1+sqrt(5))/2, [90,180,270,360])}
-
-    for name in CONSTANTS:
-        symbol, value, angles = CONSTANTS[name]
-        for a in angles:
-            template("Spiral_{}_{:03d}".format(name, a), symbol, value, a)
+    draw_templates(template_jobs())
     
 ################################################################################
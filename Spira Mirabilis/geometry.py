@@ -0,0 +1,478 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+from math import *
+
+### SPIRAL POINTS ##############################################################
+
+def get_rectangle(A,B, ratio):
+    v = (B[1]-A[1],A[0]-B[0])
+    k = ratio #/ hypot(*v)
+    C = (B[0] + k*v[0], B[1] + k*v[1])
+    D = (A[0] + k*v[0], A[1] + k*v[1])
+    return (A,B,C,D)
+
+def logarithmic_spiral(factor_per_turn, turns, points_per_turn, rotation=0):
+
+    # Sanity checks
+    assert(factor_per_turn > 0)
+    assert(turns           > 0)
+    assert(points_per_turn > 0)
+
+    # Derived constants
+    N = int(turns*points_per_turn) + 1
+    A = 2*pi/points_per_turn
+    R = (1/factor_per_turn)**(1/points_per_turn)
+
+    # Return points
+    return tuple(((R**i)*sin(A*i - rotation),
+                  (R**i)*cos(A*i - rotation)) for i in range(N))
+
+def spiral_point(factor_per_turn, t, rotation=0):
+
+    # Point of the spiral after t turns (same convention as the sample i of
+    # logarithmic_spiral(factor_per_turn, turns, points_per_turn, rotation)
+    # with t = i/points_per_turn):
+    r = factor_per_turn**(-t)
+    return (r*sin(2*pi*t - rotation), r*cos(2*pi*t - rotation))
+
+def spiral_tangent(factor_per_turn, t, rotation=0):
+
+    # Derivative of spiral_point() with respect to t (its unit vector is the
+    # tangent of the spiral, pointing towards the center):
+    r, a, k = factor_per_turn**(-t), 2*pi*t - rotation, log(factor_per_turn)
+    return (r*(2*pi*cos(a) - k*sin(a)), -r*(2*pi*sin(a) + k*cos(a)))
+
+### LAYOUT #####################################################################
+
+# Paper sizes (width, height) in mm:
+PAPERS = {"A0": (841, 1189), "A1": (594, 841), "A2": (420, 594),
+          "A3": (297,  420), "A4": (210, 297), "A5": (148, 210),
+          "A6": (105,  148), "Letter": (215.9, 279.4),
+          "Legal": (215.9, 355.6)}
+
+def layout(K, angle, radii=24, width=210, height=297, margin=15,
+           points_per_turn=360, turns=10, min_radii=5):
+    """
+    Page layout used by template() and the examples, as the tuple
+    (K_per_turn, rotation, scale, X, Y, X_top, Y_top, last) where last is
+    the number of spiral samples kept after removing the ones that are too
+    close to the center.
+    """
+
+    return layouts(((K, angle, width, height, margin),),
+                   radii, points_per_turn, turns, min_radii)[0]
+
+def layouts(jobs, radii=24, points_per_turn=360, turns=10, min_radii=5,
+            samples=False):
+    """
+    Batch version of layout() for jobs (K, angle, width, height, margin).
+    Sines and cosines are shared by all the jobs, powers and extents by all
+    the jobs with the same K_per_turn (whatever their paper size). With
+    samples=True each layout ends with its (truncated) spiral samples,
+    equal to those of logarithmic_spiral() and shared by the jobs with the
+    same K_per_turn and rotation.
+    """
+
+    # Sanity checks
+    assert(radii           >= 4)
+    assert(turns           >  0)
+    assert(points_per_turn >  0)
+
+    # Derived constants
+    N   = int(turns*points_per_turn) + 1
+    M   = min(N, points_per_turn + 1)
+    A   = 2*pi/points_per_turn
+    ROT = tuple(j*2*pi/radii for j in range(radii//4))
+
+    # Shared tables (filled on demand):
+    TRIG, POW, EXT, SAMPLES = {}, {}, {}, {}
+
+    def trig(j, n):
+        T = TRIG.setdefault(j, [])
+        for i in range(len(T), n): T.append((sin(A*i - ROT[j]),
+                                             cos(A*i - ROT[j])))
+        return T
+
+    def power(K_per_turn, n):
+        R = (1/K_per_turn)**(1/points_per_turn)
+        T = POW.setdefault(K_per_turn, [])
+        for i in range(len(T), n): T.append(R**i)
+        return T
+
+    def extents(K_per_turn, j, n):
+        if (K_per_turn, j, n) not in EXT:
+            T, S = power(K_per_turn, n), trig(j, n)
+            X = tuple(T[i]*S[i][0] for i in range(n))
+            Y = tuple(T[i]*S[i][1] for i in range(n))
+            EXT[(K_per_turn, j, n)] = (min(X), max(X), min(Y), max(Y))
+        return EXT[(K_per_turn, j, n)]
+
+    LAYOUTS = []
+    for K, angle, width, height, margin in jobs:
+
+        # Compute K_per_turn:
+        K_per_turn = K**(360/angle)
+        R = (1/K_per_turn)**(1/points_per_turn)
+
+        # Select the best rotation angle (so one of the radii is vertical):
+        rotation, scale, J = 0, 0, 0
+        for j in range(len(ROT)):
+            X_min, X_max, Y_min, Y_max = extents(K_per_turn, j, M)
+            s = min((width  - 2*margin) / (X_max - X_min),
+                    (height - 2*margin) / (Y_max - Y_min)) / 10
+            if scale < s: scale, rotation, J = s, ROT[j], j
+
+        # Compute Center and Extremes (every sample after the first turn is
+        # a shrunk copy of one of the first turn, so they can't be extremes):
+        X_min, X_max, Y_min, Y_max = extents(K_per_turn, J, M if R < 1 else N)
+        X, Y = scale*(X_max+X_min)/2, scale*(Y_max+Y_min)/2
+        X_top, Y_top = scale*X_max - X, scale*Y_max - Y
+
+        # Last sample that is not too close to the center (sample i has
+        # radius R**i, the guess is then checked against the samples):
+        T, S = power(K_per_turn, N), trig(J, N)
+        def far(i): return scale*hypot(T[i]*S[i][0],
+                                       T[i]*S[i][1]) >= min_radii/10
+        if R < 1: last = min(N-1, max(0, int(log(min_radii/10/scale)/log(R))))
+        else:     last = N-1
+        while last+1 < N and far(last+1): last += 1
+        while last > 0 and not far(last): last -= 1
+
+        # Round it to the radii:
+        last = (points_per_turn*2/radii) * round(last*radii/2/points_per_turn,0)
+        last = int(max(points_per_turn+1,last))
+
+        LAYOUT = (K_per_turn, rotation, scale, X, Y, X_top, Y_top, last)
+        # Samples (shared by the jobs with the same K_per_turn and rotation,
+        # like the same template on several paper sizes):
+        if samples:
+            P, n = SAMPLES.get((K_per_turn, J), ()), min(last, N)
+            if len(P) < n:
+                P = P + tuple((T[i]*S[i][0], T[i]*S[i][1])
+                              for i in range(len(P), n))
+                SAMPLES[(K_per_turn, J)] = P
+            LAYOUT += (P[:n],)
+        LAYOUTS.append(LAYOUT)
+
+    return tuple(LAYOUTS)
+
+def template_layout(K, angle, radii=24, width=210, height=297, margin=15,
+                    points_per_turn=360, turns=10, min_radii=5,
+                    precomputed=None):
+
+    # Layout with samples (unless precomputed by a batch call to layouts())
+    # and radii of a template:
+    if precomputed is None:
+        precomputed, = layouts(((K, angle, width, height, margin),), radii,
+                               points_per_turn, turns, min_radii, True)
+    K_per_turn, rotation = precomputed[:2]
+    if radii: R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
+    else:     R = tuple()
+    return precomputed, R
+
+def paper_mm(layout, width=210, height=297, margin=15):
+
+    # Drawing coordinates (cm from the paper center) to mm from the bottom
+    # left corner of the paper (of the figure, without margin):
+    X_top, Y_top = layout[5:7]
+    if margin: ox, oy = width/2, height/2
+    else:      ox, oy = 10*X_top, 10*Y_top
+    return lambda p: (ox + 10*p[0], oy + 10*p[1])
+
+### CLOSEST POINT ON THE SPIRAL ################################################
+
+def closest_point(Q, factor_per_turn, turns, rotation=0,
+                  scale=1, center=(0,0), samples=32, iterations=60):
+    """
+    Closest point to Q of the spiral arc t in [0, turns] drawn as
+    scale*spiral_point(t) - center (the coordinates used by template()).
+    Returns (distance, t, point). Multiply t by points_per_turn to get the
+    index of the matching sample of logarithmic_spiral().
+    """
+
+    # Sanity checks
+    assert(factor_per_turn > 0)
+    assert(turns           > 0)
+    assert(scale           > 0)
+
+    # Query point in spiral coordinates:
+    qx, qy = (Q[0] + center[0])/scale, (Q[1] + center[1])/scale
+    rho    = hypot(qx, qy)
+    phi    = atan2(qx, qy)
+    a      = log(factor_per_turn)
+
+    def d2(t):
+        r = exp(-a*t)
+        return r*r + rho*rho - 2*r*rho*cos(2*pi*t - rotation - phi)
+
+    # Turns where the spiral crosses the ray through Q (and the endpoints):
+    t0 = ((phi + rotation)/(2*pi)) % 1
+    T  = [t0 + k for k in range(int(ceil(turns - t0)) + 1) if t0 + k <= turns]
+    T += [0, turns]
+
+    # Any closer point lies within d_best of rho, so only the half-turn
+    # windows around crossings whose radii reach [rho-d, rho+d] matter:
+    d_best = sqrt(max(0, min(d2(t) for t in T)))
+    W = []
+    for t in T:
+        lo, hi = max(0, t - 0.5), min(turns, t + 0.5)
+        r_lo, r_hi = sorted((exp(-a*lo), exp(-a*hi)))
+        if r_lo - d_best <= rho <= r_hi + d_best: W.append((lo, hi))
+
+    # Coarse scan of each window:
+    best = min(((d2(t), t) for t in T))
+    for lo, hi in W:
+        h = (hi - lo)/samples
+        for i in range(samples + 1):
+            t = lo + i*h
+            v = d2(t)
+            if v < best[0]: best = (v, t)
+
+    # Golden section refinement around the best sample:
+    h      = 1/samples
+    lo, hi = max(0, best[1] - h), min(turns, best[1] + h)
+    g      = (sqrt(5) - 1)/2
+    x1, x2 = hi - g*(hi - lo), lo + g*(hi - lo)
+    f1, f2 = d2(x1), d2(x2)
+    for _ in range(iterations):
+        if f1 < f2: hi, x2, f2 = x2, x1, f1; x1 = hi - g*(hi - lo); f1 = d2(x1)
+        else:       lo, x1, f1 = x1, x2, f2; x2 = lo + g*(hi - lo); f2 = d2(x2)
+    if min(f1, f2) < best[0]: best = min((f1, x1), (f2, x2))
+
+    # Return distance, parameter and point (in the caller coordinates):
+    t = best[1]
+    x, y = spiral_point(factor_per_turn, t, rotation)
+    return (scale*sqrt(max(0, best[0])), t,
+            (scale*x - center[0], scale*y - center[1]))
+
+def closest_points(Qs, factor_per_turn, turns, rotation=0,
+                   scale=1, center=(0,0)):
+
+    # Batch version of closest_point():
+    return tuple(closest_point(Q, factor_per_turn, turns, rotation,
+                               scale, center) for Q in Qs)
+
+### SPATIAL INDEX ##############################################################
+
+def build_index(points, cell=0.5):
+
+    # Uniform hash grid over a finite set of points (sampled spirals,
+    # rectangle corners, construction points...):
+    assert(cell > 0)
+    grid = {}
+    for i, p in enumerate(points):
+        grid.setdefault((floor(p[0]/cell), floor(p[1]/cell)), []).append(i)
+    return (cell, tuple(points), grid)
+
+def _ring(cx, cy, k):
+
+    # Cells at Chebyshev distance k from (cx, cy):
+    if k == 0: return ((cx, cy),)
+    return (tuple((cx + i, cy - k) for i in range(-k, k+1)) +
+            tuple((cx + i, cy + k) for i in range(-k, k+1)) +
+            tuple((cx - k, cy + j) for j in range(1-k, k)) +
+            tuple((cx + k, cy + j) for j in range(1-k, k)))
+
+def query_index(index, Q):
+
+    # Closest indexed point to Q as (distance, i). Rings of cells are
+    # visited outwards until no unvisited cell can hold a closer point:
+    cell, points, grid = index
+    if not points: return (inf, None)
+    cx, cy = floor(Q[0]/cell), floor(Q[1]/cell)
+    best, k, K = (inf, None), 0, None
+    while K is None or k <= K:
+        for c in _ring(cx, cy, k):
+            for n in grid.get(c, ()):
+                d = hypot(points[n][0] - Q[0], points[n][1] - Q[1])
+                if d < best[0]: best = (d, n)
+        if K is None and best[1] is not None: K = int(best[0]/cell) + 1
+        k += 1
+    return best
+
+def query_radius(index, Q, radius):
+
+    # Indices of all the indexed points within radius of Q:
+    cell, points, grid = index
+    cx, cy = floor(Q[0]/cell), floor(Q[1]/cell)
+    k = int(ceil(radius/cell))
+    return tuple(n for i in range(cx - k, cx + k + 1)
+                   for j in range(cy - k, cy + k + 1)
+                   for n in grid.get((i, j), ())
+                   if hypot(points[n][0] - Q[0],
+                            points[n][1] - Q[1]) <= radius)
+
+### TILES ######################################################################
+
+def tile_windows(width, height, tile_width, tile_height, overlap):
+
+    # Windows (row, col, x0, y0, x1, y1) of the tiles that cover the
+    # rectangle [-width/2, width/2] x [-height/2, height/2], row by row from
+    # the top left one, each tile overlapping its neighbours by overlap:
+    assert(tile_width > overlap and tile_height > overlap)
+    cols = max(1, ceil((width  - overlap) / (tile_width  - overlap)))
+    rows = max(1, ceil((height - overlap) / (tile_height - overlap)))
+    x0 = -((cols - 1)*(tile_width  - overlap) + tile_width)/2
+    y1 =  ((rows - 1)*(tile_height - overlap) + tile_height)/2
+    return tuple((r, c, x0 + c*(tile_width  - overlap),
+                        y1 - r*(tile_height - overlap) - tile_height,
+                        x0 + c*(tile_width  - overlap) + tile_width,
+                        y1 - r*(tile_height - overlap))
+                 for r in range(rows) for c in range(cols))
+
+def tile_ranges(P, windows):
+
+    # Index of the polyline P by tile: {window: [(start, end), ...]} where
+    # the segments P[i]-P[i+1] with start <= i < end may cross the window.
+    # Windows must come from tile_windows(), so the tile of a segment is
+    # found from its bounding box without testing every window:
+    rows, cols = windows[-1][0] + 1, windows[-1][1] + 1
+    X0, Y1     = windows[0][2], windows[0][5]
+    W, H       = windows[0][4] - windows[0][2], windows[0][5] - windows[0][3]
+    DX = windows[1][2] - X0         if cols > 1 else W
+    DY = Y1 - windows[cols][5]      if rows > 1 else H
+    index = {}
+    for i in range(len(P) - 1):
+        (ax, ay), (bx, by) = P[i], P[i+1]
+        c0 = max(0,      ceil((min(ax, bx) - X0 - W)/DX))
+        c1 = min(cols-1, floor((max(ax, bx) - X0)/DX))
+        r0 = max(0,      ceil((Y1 - max(ay, by) - H)/DY))
+        r1 = min(rows-1, floor((Y1 - min(ay, by))/DY))
+        for r in range(r0, r1+1):
+            for c in range(c0, c1+1):
+                R = index.setdefault(windows[r*cols + c], [])
+                if R and R[-1][1] == i: R[-1] = (R[-1][0], i+1)
+                else:                   R.append((i, i+1))
+    return index
+
+def clip_segment(A, B, window):
+
+    # Part of the segment AB inside the window (Liang-Barsky), or None:
+    x0, y0, x1, y1 = window[-4:]
+    t0, t1 = 0, 1
+    dx, dy = B[0] - A[0], B[1] - A[1]
+    for p, q in ((-dx, A[0] - x0), (dx, x1 - A[0]),
+                 (-dy, A[1] - y0), (dy, y1 - A[1])):
+        if p == 0:
+            if q < 0: return None
+        elif p < 0: t0 = max(t0, q/p)
+        else:       t1 = min(t1, q/p)
+    if t0 > t1: return None
+    return ((A[0] + t0*dx, A[1] + t0*dy), (A[0] + t1*dx, A[1] + t1*dy))
+
+### WHIRLING RECTANGLES #######################################################
+
+def whirl(F0, F1, steps, ratio=1):
+    """
+    Whirling squares (ratio=1) or ratio-r rectangles: every step attaches a
+    rectangle of depth ratio*|PQ| on the side PQ of the previous union.
+    Returns (F, STEPS, BOUNDARY, LINES) where F are the points, STEPS the
+    (P,Q,C,D) indices of each rectangle, BOUNDARY the outer rectangle and
+    LINES the segments drawn in example_11.
+    """
+
+    # Sanity checks
+    assert(steps > 0)
+    assert(ratio > 0)
+
+    # Attach the rectangles (the union is kept as [P,Q,R,S] so that the
+    # next rectangle goes on PQ):
+    F, STEPS = [F0, F1], []
+    P, Q, R, S = 0, 1, 1, 0
+    for _ in range(steps):
+        A, B, C, D = get_rectangle(F[P], F[Q], -ratio)
+        F += [C, D]
+        STEPS.append((P, Q, len(F)-2, len(F)-1))
+        P, Q, R, S = S, len(F)-1, len(F)-2, R
+
+    # Outer rectangle and dividing lines:
+    BOUNDARY = (Q, R, S, P)
+    LINES    = ((Q,R), (R,S), (S,P), (Q,P))
+    LINES   += tuple((s[0], s[1]) for s in reversed(STEPS[1:]))
+
+    return (tuple(F), tuple(STEPS), BOUNDARY, LINES)
+
+def whirl_arcs(F, STEPS, points_per_arc=32):
+
+    # Quarter circle (ellipse if ratio!=1) of every rectangle, centered at
+    # P and going from Q to D, as a single polyline:
+    assert(points_per_arc > 0)
+    ARCS = [F[STEPS[0][1]]]
+    for P, Q, C, D in STEPS:
+        P, Q, D = F[P], F[Q], F[D]
+        for i in range(1, points_per_arc+1):
+            c, s = cos(i*pi/2/points_per_arc), sin(i*pi/2/points_per_arc)
+            ARCS.append((P[0] + c*(Q[0]-P[0]) + s*(D[0]-P[0]),
+                         P[1] + c*(Q[1]-P[1]) + s*(D[1]-P[1])))
+    return tuple(ARCS)
+
+def whirl_spiral(F, STEPS, ratio=1):
+    """
+    Logarithmic spiral matching the whirl, as the tuple
+    (factor_per_turn, rotation, scale, center, mirror) so that its points
+    are scale*spiral_point(factor_per_turn, t, rotation) - center, after
+    mirroring x <-> -x when mirror is True. It goes through the outermost
+    corner (t=0) and its pole is the fixed point of the last step.
+    """
+
+    # Exact similarity between two consecutive steps:
+    assert(len(STEPS) > 1)
+    P0, Q0 = [complex(*F[i]) for i in STEPS[-2][:2]]
+    P1, Q1 = [complex(*F[i]) for i in STEPS[-1][:2]]
+    L = (ratio + sqrt(ratio*ratio + 4))/2
+    a = L*1j if ((Q1-P1)/(Q0-P0)).imag > 0 else -L*1j
+
+    # Pole and outermost corner (in the mirrored frame when needed):
+    mirror = a.imag < 0
+    z = (P1 - a*P0)/(1 - a)
+    c = complex(*F[STEPS[-1][3]]) - z
+    if mirror: z, c = complex(-z.real, z.imag), complex(-c.real, c.imag)
+
+    return (L**4, atan2(c.imag, c.real) - pi/2, abs(c), (-z.real, -z.imag),
+            mirror)
+
+def whirl_deviation(F, STEPS, ratio=1, points_per_arc=32):
+    """
+    Deviation between the arcs of the whirl and its logarithmic spiral as
+    (max distance from the arcs to the spiral, Hausdorff distance).
+    """
+
+    ARCS = whirl_arcs(F, STEPS, points_per_arc)
+    f, rotation, scale, center, mirror = whirl_spiral(F, STEPS, ratio)
+    turns = len(STEPS)/4
+    if mirror: ARCS = tuple((-x, y) for x, y in ARCS)
+
+    # From the arcs to the (analytic) spiral:
+    d_max = max(d for d, t, p in closest_points(ARCS, f, turns + 1, rotation,
+                                                scale, center))
+
+    # From the sampled spiral to the arcs:
+    S = logarithmic_spiral(f, turns, 4*points_per_arc, rotation)
+    S = tuple((scale*x - center[0], scale*y - center[1]) for x, y in S)
+    index = build_index(ARCS, scale/points_per_arc)
+    d_inv = max(query_index(index, p)[0] for p in S)
+
+    return (d_max, max(d_max, d_inv))
+
+def whirl_errors(depths, ratios, points_per_arc=32):
+
+    # Relative deviation (divided by the outer side) of whirls of several
+    # depths and ratios, as rows (depth, ratio, max, Hausdorff):
+    rows = []
+    for r in ratios:
+        for n in depths:
+            F, STEPS, BOUNDARY, LINES = whirl((0,0), (0,1), n, r)
+            L = hypot(F[STEPS[-1][1]][0] - F[STEPS[-1][0]][0],
+                      F[STEPS[-1][1]][1] - F[STEPS[-1][0]][1])
+            d_max, d_h = whirl_deviation(F, STEPS, r, points_per_arc)
+            rows.append((n, r, d_max/L, d_h/L))
+    return tuple(rows)
+
+################################################################################
@@ -0,0 +1,112 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Grey/RGB images as (width, height, channels, pixels) where pixels is a
+# bytes object with one byte per channel, row after row, top to bottom.
+
+import zlib, struct, subprocess
+
+### RASTERIZE ##################################################################
+
+def rasterize(filename, dpi=50, gs="gs"):
+
+    # First page of a PDF as a grey image (needs Ghostscript):
+    out = subprocess.run([gs, "-q", "-dNOPAUSE", "-dBATCH", "-dSAFER",
+                          "-sDEVICE=pgmraw", "-r{}".format(dpi),
+                          "-dFirstPage=1", "-dLastPage=1",
+                          "-dTextAlphaBits=4", "-dGraphicsAlphaBits=4",
+                          "-sOutputFile=-", filename],
+                         check=True, capture_output=True).stdout
+    return read_pnm(out)
+
+### PNM ########################################################################
+
+def read_pnm(data):
+
+    # Binary PGM (P5) or PPM (P6) with 8 bit samples:
+    fields, i, n = [], 0, len(data)
+    while len(fields) < 4:
+        while i < n and data[i:i+1].isspace(): i += 1
+        if i == n: raise ValueError("truncated PNM header")
+        if data[i:i+1] == b"#":
+            while i < n and data[i:i+1] not in b"\r\n": i += 1
+            continue
+        j = i
+        while j < n and not data[j:j+1].isspace(): j += 1
+        fields.append(data[i:j])
+        i = j
+    magic, width, height, maxval = fields
+    if magic not in (b"P5", b"P6") or maxval != b"255" or \
+       not width.isdigit() or not height.isdigit():
+        raise ValueError("not an 8 bit binary PGM/PPM")
+    channels = 1 if magic == b"P5" else 3
+    width, height = int(width), int(height)
+    if n < i+1 + width*height*channels: raise ValueError("truncated PNM")
+    return (width, height, channels,
+            bytes(data[i+1:i+1 + width*height*channels]))
+
+def write_pnm(filename, image):
+    width, height, channels, pixels = image
+    with open(filename, "wb") as f:
+        f.write(b"P5" if channels == 1 else b"P6")
+        f.write(" {} {} 255\n".format(width, height).encode())
+        f.write(pixels)
+
+### PNG ########################################################################
+
+def png_chunk(kind, data):
+    return (struct.pack(">I", len(data)) + kind + data +
+            struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff))
+
+def png_header(image):
+
+    # Signature and IHDR of a grey (1), grey+alpha (2), RGB (3) or RGBA (4)
+    # image:
+    width, height, channels, pixels = image
+    kind = {1: 0, 2: 4, 3: 2, 4: 6}[channels]
+    return (b"\x89PNG\r\n\x1a\n" +
+            png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height,
+                                           8, kind, 0, 0, 0)))
+
+def png_data(image, level=6):
+
+    # Compressed rows of the image (filter type 0):
+    width, height, channels, pixels = image
+    row = width*channels
+    return zlib.compress(b"".join(b"\0" + pixels[y*row:(y+1)*row]
+                                  for y in range(height)), level)
+
+def png_bytes(image, level=6):
+    return (png_header(image) + png_chunk(b"IDAT", png_data(image, level)) +
+            png_chunk(b"IEND", b""))
+
+def write_png(filename, image, level=6):
+    with open(filename, "wb") as f: f.write(png_bytes(image, level))
+
+def apng_bytes(frames, delay=0.1, plays=0, level=6):
+
+    # Animated PNG of frames of the same size, delay seconds each, played
+    # plays times (0 is forever):
+    width, height = frames[0][0], frames[0][1]
+    out, sequence = [png_header(frames[0]),
+                     png_chunk(b"acTL", struct.pack(">II", len(frames),
+                                                    plays))], 0
+    for k, frame in enumerate(frames):
+        out.append(png_chunk(b"fcTL", struct.pack(">IIIIIHHBB", sequence,
+                             width, height, 0, 0, round(1000*delay), 1000,
+                             0, 0)))
+        sequence += 1
+        data = png_data(frame, level)
+        if k == 0: out.append(png_chunk(b"IDAT", data))
+        else:
+            out.append(png_chunk(b"fdAT", struct.pack(">I", sequence) + data))
+            sequence += 1
+    return b"".join(out) + png_chunk(b"IEND", b"")
+
+################################################################################
@@ -0,0 +1,108 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# N-up imposition of the templates:
+#
+#   python impose.py                            # every template, 4 per A4
+#   python impose.py Phi Root2 --per-sheet 2    # only these constants
+#   python impose.py --crop --per-sheet 6       # the spirals, not the paper
+#
+# The templates are drawn (see draw_template() in figures.py) straight into
+# one canvas per sheet, so every sheet is a single PDF whose fonts and other
+# resources are shared by all its templates, instead of a page embedding
+# several full page PDFs. Every template goes to a cell of a grid, placed by
+# its analytic bounding box: the paper or, with --crop, the extremes of the
+# spiral given by the layout (X_top, Y_top), scaled to fit.
+
+import os, argparse
+
+from pyx      import canvas, path, style, color, trafo
+from geometry import *
+
+import figures
+
+### IMPOSITION #################################################################
+
+def grid(n, width, height, box_width, box_height, gutter):
+
+    # (cols, rows, scale) of the grid of n cells that fits the biggest boxes:
+    best = (1, n, 0)
+    for cols in range(1, n+1):
+        rows  = ceil(n/cols)
+        scale = min((width  - (cols+1)*gutter) / (cols*box_width),
+                    (height - (rows+1)*gutter) / (rows*box_height))
+        if scale > best[2]: best = (cols, rows, scale)
+    return best
+
+def impose(jobs, per_sheet=4, sheet="A4", gutter=5, crop=False,
+           folder=".", name="Sheet"):
+
+    # Layouts of all the templates in one call:
+    L = layouts([(value, a, 210, 297, 15) for n, symbol, value, a in jobs],
+                samples=True)
+
+    # Boxes (half width, half height in cm) and the grid that fits them:
+    if crop: boxes = [(l[5], l[6]) for l in L]
+    else:    boxes = [((210-1)/20, (297-1)/20)] * len(jobs)
+    bw, bh = 2*max(b[0] for b in boxes), 2*max(b[1] for b in boxes)
+    W, H  = PAPERS[sheet] if isinstance(sheet, str) else sheet
+    W, H, g = W/10, H/10, gutter/10
+    (cols, rows, scale), width, height = max(
+        ((grid(per_sheet, w, h, bw, bh, g), w, h) for w, h in ((W,H), (H,W))),
+        key=lambda G: G[0][2])
+    cell_w = (width  - (cols+1)*g) / cols
+    cell_h = (height - (rows+1)*g) / rows
+
+    FILES = []
+    for first in range(0, len(jobs), per_sheet):
+        SHEET = canvas.canvas()
+        for k in range(first, min(first + per_sheet, len(jobs))):
+            n, symbol, value, a = jobs[k]
+            r, c = divmod(k - first, cols)
+            x = g + c*(cell_w + g) + cell_w/2
+            y = height - g - r*(cell_h + g) - cell_h/2
+            CANVAS = figures.draw_template("Spiral_{}_{:03d}".format(n, a),
+                                           symbol, value, a,
+                                           margin=0 if crop else 15,
+                                           precomputed=L[k])
+            SHEET.insert(CANVAS, [trafo.scale(scale).translated(x, y)])
+
+        # Sheet border (so the PDF has the size of the sheet):
+        SHEET.stroke(path.rect(0, 0, width, height),
+                     [color.rgb.white, style.linewidth.THIN])
+        FILES.append(os.path.join(folder, "{}_{:02d}.pdf".format(
+                                  name, first//per_sheet + 1)))
+        SHEET.writePDFfile(FILES[-1])
+
+    return FILES
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="N-up imposition")
+    parser.add_argument("constants", nargs="*",
+                        help="names of figures.CONSTANTS (default: all)")
+    parser.add_argument("--per-sheet", type=int,   default=4)
+    parser.add_argument("--sheet",     default="A4")
+    parser.add_argument("--gutter",    type=float, default=5, help="mm")
+    parser.add_argument("--crop",      action="store_true")
+    parser.add_argument("--folder",    default="sheets")
+    args = parser.parse_args()
+
+    jobs = [j for j in figures.template_jobs()
+            if not args.constants or j[0] in args.constants]
+    figures.setup()
+    os.makedirs(args.folder, exist_ok=True)
+    FILES = impose(jobs, args.per_sheet, args.sheet, args.gutter, args.crop,
+                   args.folder)
+    print("{} templates on {} sheets in {}".format(len(jobs), len(FILES),
+                                                   args.folder))
+
+################################################################################
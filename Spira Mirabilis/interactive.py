@@ -0,0 +1,243 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Interactive (zoomable) HTML versions of the templates:
+#
+#   python interactive.py                   # every template, web/*.html+.bin
+#   python interactive.py Phi --inline      # one self-contained HTML file
+#
+# The geometry of the template (spiral samples, radii and construction, in
+# cm) goes to a little endian Float32 buffer, <name>.bin (or base64 inside
+# the HTML with --inline, so it also opens from disk), that the viewer maps
+# with typed arrays instead of parsing lists of numbers. The page only
+# holds a small viewer and the layout (K_per_turn, rotation, scale,
+# center...): drag to move, wheel to zoom, double click to reset. When
+# zoomed in, the spiral is drawn from its equation instead of the samples:
+# only the part of every turn that reaches the screen, with as many points
+# as the screen pixels need and down to the center (the zoom goes from 0.5x
+# to 100000x).
+
+import os, sys, json, base64, argparse
+
+from math     import *
+from geometry import *
+from array    import array
+
+from labels        import label
+from constructions import construct
+
+### DATA #######################################################################
+
+def pack(parts):
+
+    # {name: points} as one Float32 buffer (little endian) and the
+    # {name: [offset, count]} of every part (offset in floats):
+    data, index = array("f"), {}
+    for name, points in parts.items():
+        index[name] = [len(data), len(points)]
+        for p in points: data.extend(p)
+    if sys.byteorder == "big": data.byteswap()
+    return data.tobytes(), index
+
+def export(filename, symbol, K, angle, radii=24,
+           width=210, height=297, margin=15,
+           points_per_turn=360, turns=10, min_radii=5,
+           construction=None, precomputed=None, inline=False):
+
+    # <filename>.html and, unless inline, <filename>.bin:
+    precomputed, R = template_layout(K, angle, radii, width, height, margin,
+                                     points_per_turn, turns, min_radii,
+                                     precomputed)
+    K_per_turn, rotation, scale, X, Y, X_top, Y_top, last, P = precomputed
+
+    parts = {"spiral": [(scale*p[0]-X, scale*p[1]-Y) for p in P],
+             "radii":  [(scale*r[0]-X, scale*r[1]-Y) for r in R]}
+    if construction:
+        frame = (K, angle, K_per_turn, rotation, scale, X, Y)
+        RECTANGLE, INPUT, OUTPUT = construct(construction, frame)
+        parts.update(rectangle=RECTANGLE or (), input=INPUT, output=OUTPUT)
+    data, index = pack(parts)
+
+    header = {"K_per_turn": K_per_turn, "rotation": rotation, "scale": scale,
+              "X": X, "Y": Y, "X_top": X_top, "Y_top": Y_top,
+              "width": width/10, "height": height/10,
+              "dashed": radii >= 8 and radii%2 == 0,
+              "info": "{} / {}°".format(label(symbol), angle),
+              "parts": index}
+    if inline: header["base64"] = base64.b64encode(data).decode()
+    else:
+        header["data"] = os.path.basename(filename) + ".bin"
+        with open(filename + ".bin", "wb") as f: f.write(data)
+    with open(filename + ".html", "w", encoding="utf-8") as f:
+        f.write(VIEWER.replace("{{TITLE}}", os.path.basename(filename))
+                      .replace("{{HEADER}}", json.dumps(header)))
+    return len(data)
+
+### VIEWER #####################################################################
+
+VIEWER = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{{TITLE}}</title>
+<style>html,body{margin:0;height:100%;overflow:hidden;background:#ddd}
+canvas{display:block;cursor:grab}</style></head>
+<body><canvas id="c"></canvas><script>
+"use strict";
+const D = {{HEADER}};
+const c = document.getElementById("c"), g = c.getContext("2d");
+const ZOOM = [0.5, 1e5];
+let F, view = {x: 0, y: 0, zoom: 1}, base = 1;
+
+function part(name) {
+  const [o, n] = D.parts[name] || [0, 0];
+  return F.subarray(o, o + 2*n);
+}
+function px(x, y) {
+  const k = base*view.zoom;
+  return [c.width/2 + (x - view.x)*k, c.height/2 - (y - view.y)*k];
+}
+function polyline(P, close) {
+  g.beginPath();
+  for (let i = 0; i < P.length; i += 2) {
+    const [u, v] = px(P[i], P[i+1]);
+    if (i) g.lineTo(u, v); else g.moveTo(u, v);
+  }
+  if (close) g.closePath();
+}
+function spiral(pad) {
+  // Samples at low zoom, the equation (log space, so it never underflows)
+  // when zoomed in: only the turns and directions that reach the screen
+  // (grown by pad), with chords within 1/4 px of the curve, down to 1/2 px:
+  const k = base*view.zoom, L = Math.log(D.K_per_turn);
+  if (view.zoom < 4 || L <= 0) return polyline(part("spiral"));
+  const [cx, cy] = px(-D.X, -D.Y), R = D.scale*k;
+  const x0 = -pad, y0 = -pad, x1 = c.width + pad, y1 = c.height + pad;
+  const near = Math.hypot(Math.max(0, x0 - cx, cx - x1),
+                          Math.max(0, y0 - cy, cy - y1));
+  const far  = Math.hypot(Math.max(cx - x0, x1 - cx),
+                          Math.max(cy - y0, y1 - cy));
+  // Directions a of the screen (the point at a is (sin a, -cos a) from the
+  // center), all of them unless the center is on screen:
+  let a0 = 0, a1 = 2*Math.PI;
+  if (near > 0) {
+    const m = Math.atan2((x0 + x1)/2 - cx, cy - (y0 + y1)/2);
+    const d = [[x0, y0], [x1, y0], [x0, y1], [x1, y1]].map(([x, y]) => {
+      const e = Math.atan2(x - cx, cy - y) - m;
+      return e - 2*Math.PI*Math.round(e/(2*Math.PI));
+    });
+    a0 = m + Math.min(...d); a1 = m + Math.max(...d);
+  }
+  // Turns s (with a = 2*PI*s - rotation) between the radii far and near:
+  const s0 = (a0 + D.rotation)/(2*Math.PI), s1 = (a1 + D.rotation)/(2*Math.PI);
+  const first = Math.max(0, Math.log(R/far)/L);
+  const last  = Math.min(Math.log(2*R)/L, Math.log(R/near)/L);
+  g.beginPath();
+  let end = -1;
+  for (let m = Math.floor(first - s1); m + s0 < last; m++) {
+    const lo = Math.max(first, s0 + m), hi = Math.min(last, s1 + m);
+    if (lo >= hi) continue;
+    const r = R*Math.exp(-lo*L);
+    const n = Math.max(2, Math.ceil(2*Math.PI*(hi - lo)*Math.sqrt(r/2)));
+    for (let i = 0; i <= n; i++) {
+      const s = lo + (hi - lo)*i/n, q = R*Math.exp(-s*L);
+      const a = 2*Math.PI*s - D.rotation;
+      const u = cx + q*Math.sin(a), v = cy - q*Math.cos(a);
+      if (i || lo == end) g.lineTo(u, v); else g.moveTo(u, v);
+    }
+    end = hi;
+  }
+}
+function draw() {
+  c.width = innerWidth; c.height = innerHeight;
+  base = 0.95*Math.min(c.width/D.width, c.height/D.height);
+  const k = base*view.zoom, lw = Math.max(0.5, 0.02*k);
+  g.fillStyle = "#fff";
+  g.fillRect(...px(-D.width/2, D.height/2), D.width*k, D.height*k);
+  g.lineCap = g.lineJoin = "round";
+  if (D.parts.rectangle && D.parts.rectangle[1]) {
+    polyline(part("rectangle"), true);
+    g.fillStyle = "#ffe629"; g.fill();
+  }
+  const R = part("radii");
+  g.strokeStyle = "#000";
+  for (let i = 0; i < R.length; i += 2) {
+    g.setLineDash(D.dashed && i%4 ? [2*lw, 2*lw] : []);
+    polyline([-D.X, -D.Y, R[i], R[i+1]]);
+    g.lineWidth = lw; g.stroke();
+  }
+  g.setLineDash([]);
+  const sw = Math.max(1, 0.0566*k);
+  spiral(sw);
+  g.lineWidth = sw; g.stroke();
+  const [lx, ly] = px(D.X_top - 3.35, D.Y_top);
+  g.fillStyle = "#000"; g.fillRect(lx, ly, 3.35*k, 0.95*k);
+  g.textAlign = "center";
+  g.font = "bold " + 0.6*k + "px sans-serif";
+  g.fillStyle = "#fff"; g.fillText("MMACA", ...px(D.X_top - 1.65, D.Y_top - 0.75));
+  g.font = 0.45*k + "px sans-serif";
+  g.fillStyle = "#000"; g.fillText(D.info, ...px(D.X_top - 1.65, D.Y_top - 1.65));
+  for (const [name, color] of [["input", "#f00"], ["output", "#00f"]]) {
+    const P = part(name);
+    g.strokeStyle = color; g.lineWidth = Math.max(1, 0.1131*k);
+    for (let i = 0; i < P.length; i += 2) {
+      g.beginPath(); g.arc(...px(P[i], P[i+1]), 0.25*k, 0, 2*Math.PI);
+      g.stroke();
+    }
+  }
+}
+function zoom(factor, u, v) {
+  const k = base*view.zoom;
+  const x = view.x + (u - c.width/2)/k, y = view.y - (v - c.height/2)/k;
+  view.zoom = Math.min(ZOOM[1], Math.max(ZOOM[0], view.zoom*factor));
+  view.x = x - (u - c.width/2)/(base*view.zoom);
+  view.y = y + (v - c.height/2)/(base*view.zoom);
+  draw();
+}
+let drag = null;
+c.onmousedown = e => drag = [e.clientX, e.clientY];
+onmouseup = () => drag = null;
+onmousemove = e => {
+  if (!drag) return;
+  const k = base*view.zoom;
+  view.x -= (e.clientX - drag[0])/k; view.y += (e.clientY - drag[1])/k;
+  drag = [e.clientX, e.clientY]; draw();
+};
+c.onwheel = e => { e.preventDefault(); zoom(Math.exp(-e.deltaY/500), e.clientX, e.clientY); };
+c.ondblclick = () => { view = {x: 0, y: 0, zoom: 1}; draw(); };
+onresize = draw;
+(D.base64 ? Promise.resolve(Uint8Array.from(atob(D.base64), x => x.charCodeAt(0)).buffer)
+          : fetch(D.data).then(r => r.arrayBuffer())).then(b => {
+  F = new Float32Array(b); draw();
+});
+</script></body></html>
+"""
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    import figures
+
+    parser = argparse.ArgumentParser(description="Interactive templates")
+    parser.add_argument("constants", nargs="*",
+                        help="names of figures.CONSTANTS (default: all)")
+    parser.add_argument("--inline", action="store_true",
+                        help="data inside the HTML (base64)")
+    parser.add_argument("--folder", default="web")
+    args = parser.parse_args()
+
+    jobs, L = figures.template_layouts(args.constants)
+    os.makedirs(args.folder, exist_ok=True)
+    total = 0
+    for (name, symbol, value, a), precomputed in zip(jobs, L):
+        total += export(os.path.join(args.folder,
+                                     "Spiral_{}_{:03d}".format(name, a)),
+                        symbol, value, a, precomputed=precomputed,
+                        inline=args.inline)
+    print("{} templates, {} bytes of data".format(len(jobs), total))
+
+################################################################################
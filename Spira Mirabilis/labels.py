@@ -0,0 +1,31 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Plain text of the LaTeX labels of the templates, for the outputs that
+# don't typeset them.
+
+### LABELS #####################################################################
+
+LATEX = ((r"\sqrt{", "√{"), (r"\phi", "φ"), (r"\pi", "π"),
+         (r"^{\circ}", "°"), ("$", ""), ("{", ""), ("}", ""))
+
+def label(t):
+
+    # Text of the LaTeX labels used by the templates:
+    for a, b in LATEX: t = t.replace(a, b)
+    return t
+
+def ascii_text(t):
+
+    # DXF (R12) text: ASCII with %%d for the degree sign:
+    for a, b in (("φ", "phi"), ("π", "pi"), ("√", "sqrt"), ("°", "%%d")):
+        t = t.replace(a, b)
+    return t
+
+################################################################################
@@ -0,0 +1,177 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# 3D printable nautilus shells (binary STL):
+#
+#   python nautilus.py shell.stl                        # solid tube
+#   python nautilus.py shell.stl --wall 1.2 --chambers 12 --tolerance 0.02
+#
+# A circular section is swept along the logarithmic spiral (see
+# spiral_point() in geometry.py) growing with it, so the shell is self
+# similar like the spiral. The spiral is sampled by its curvature: every
+# step turns the tangent by the largest angle whose chord stays within
+# --tolerance mm of the outer side of the tube, so the big outer whorl gets
+# many more rings than the small inner ones, and the rings have as many
+# points as the biggest section needs. With --wall the tube is hollow (an
+# inner surface facing inwards) and --chambers adds that many septa per
+# turn inside it. The triangles are generated ring after ring and written
+# as they come, so only two rings are in memory whatever the size of the
+# mesh; the number of triangles is written in the header at the end.
+
+import struct, time, argparse
+
+from math     import *
+from geometry import *
+
+### SHELL ######################################################################
+
+def steps(K_per_turn, size, width, turns, tolerance):
+
+    # Values of t (turns) with chords of the outer side of the tube within
+    # tolerance (the tangent of the spiral turns 2*pi every turn and its
+    # radius of curvature is r*sqrt(1 + b*b), b = log(K_per_turn)/(2*pi)):
+    b = log(K_per_turn)/(2*pi)
+    T = [0]
+    while T[-1] < turns:
+        r = size/2 * K_per_turn**(-T[-1])
+        rho = r*sqrt(1 + b*b) + width*r
+        T.append(min(turns, T[-1] + 2*acos(max(-1, 1 - tolerance/rho))/(2*pi)))
+    return T
+
+def ring(K_per_turn, size, width, t, n, offset=0):
+
+    # n points of the section of the tube at t (radius width*r - offset):
+    x, y = spiral_point(K_per_turn, t)
+    u, v = spiral_tangent(K_per_turn, t)
+    L = hypot(u, v)
+    N = (v/L, -u/L)
+    r = size/2 * K_per_turn**(-t)
+    rho = width*r - offset
+    return [(size/2*x + rho*cos(2*pi*j/n)*N[0],
+             size/2*y + rho*cos(2*pi*j/n)*N[1],
+             rho*sin(2*pi*j/n)) for j in range(n)]
+
+def band(A, B, flip=False):
+
+    # Triangles between two rings of the same size (facing outwards):
+    n = len(A)
+    for j in range(n):
+        a, b, c, d = A[j], A[(j+1)%n], B[(j+1)%n], B[j]
+        if flip: yield (a, b, c); yield (a, c, d)
+        else:    yield (a, c, b); yield (a, d, c)
+
+def fan(center, A, flip=False):
+    n = len(A)
+    for j in range(n):
+        if flip: yield (center, A[j], A[(j+1)%n])
+        else:    yield (center, A[(j+1)%n], A[j])
+
+def shell(K_per_turn=3, size=100, width=0.3, turns=3, tolerance=0.05,
+          wall=0, chambers=0, septum=0.8):
+
+    # Triangles of the shell (facing outwards), one ring at a time. A hollow
+    # shell is solid where its section gets thinner than 3 walls:
+    T = steps(K_per_turn, size, width, turns, tolerance)
+    n = max(8, ceil(pi/acos(max(-1, 1 - tolerance/(width*size/2)))))
+    hollow = 0
+    if wall:
+        hollow = min(turns, max(0, log(width*size/2/(1.5*wall))/
+                                   log(K_per_turn)))
+        T = sorted(set(T) | {hollow})
+    def center(t):
+        x, y = spiral_point(K_per_turn, t)
+        return (size/2*x, size/2*y, 0)
+    def section(t, offset=0):
+        return ring(K_per_turn, size, width, t, n, offset)
+
+    # Outer and inner surfaces:
+    A = section(T[0])
+    if hollow: I = section(T[0], wall)
+    for t in T[1:]:
+        B = section(t)
+        yield from band(A, B)
+        if t <= hollow:
+            J = section(t, wall)
+            yield from band(I, J, True)
+            I = J
+        A = B
+
+    # Ends (an annulus where hollow) and end of the cavity:
+    if hollow: yield from band(section(T[0], wall), section(T[0]))
+    else:      yield from fan(center(T[0]), section(T[0]), True)
+    if hollow == turns:
+        yield from band(section(turns), section(turns, wall))
+    else:
+        yield from fan(center(turns), section(turns))
+        if hollow: yield from fan(center(hollow), section(hollow, wall), True)
+
+    # Septa (thin closed discs inside the cavity):
+    for k in range(1, int(turns*chambers) if hollow else 0):
+        t0 = k/chambers
+        t1 = t0 + septum/(2*pi*size/2*K_per_turn**(-t0))
+        if t1 >= hollow: break
+        A, B = section(t0, wall/2), section(t1, wall/2)
+        yield from band(A, B)
+        yield from fan(center(t0), A, True)
+        yield from fan(center(t1), B)
+
+### STL ########################################################################
+
+def write_stl(filename, triangles, chunk=4096):
+
+    # Binary STL streamed from an iterable of triangles, returns their
+    # number (written in the header at the end):
+    pack, count, buffer = struct.Struct("<12fH").pack, 0, []
+    with open(filename, "wb") as f:
+        f.write(b"Spira Mirabilis".ljust(80, b" ") + struct.pack("<I", 0))
+        for a, b, c in triangles:
+            u = (b[0] - a[0], b[1] - a[1], b[2] - a[2])
+            v = (c[0] - a[0], c[1] - a[1], c[2] - a[2])
+            N = (u[1]*v[2] - u[2]*v[1], u[2]*v[0] - u[0]*v[2],
+                 u[0]*v[1] - u[1]*v[0])
+            L = sqrt(N[0]*N[0] + N[1]*N[1] + N[2]*N[2]) or 1
+            buffer.append(pack(N[0]/L, N[1]/L, N[2]/L, *a, *b, *c, 0))
+            if len(buffer) == chunk:
+                f.write(b"".join(buffer))
+                count += len(buffer)
+                buffer = []
+        f.write(b"".join(buffer))
+        count += len(buffer)
+        f.seek(80)
+        f.write(struct.pack("<I", count))
+    return count
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Nautilus shell (STL)")
+    parser.add_argument("output")
+    parser.add_argument("--K",         type=float, default=3,
+                        help="growth per turn")
+    parser.add_argument("--size",      type=float, default=100,
+                        help="diameter of the spiral (mm)")
+    parser.add_argument("--width",     type=float, default=0.3,
+                        help="radius of the tube relative to the spiral")
+    parser.add_argument("--turns",     type=float, default=3)
+    parser.add_argument("--tolerance", type=float, default=0.05, help="mm")
+    parser.add_argument("--wall",      type=float, default=0,
+                        help="thickness of a hollow shell (mm)")
+    parser.add_argument("--chambers",  type=int,   default=0,
+                        help="septa per turn (hollow shells)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    n = write_stl(args.output, shell(args.K, args.size, args.width,
+                                     args.turns, args.tolerance, args.wall,
+                                     args.chambers))
+    print("{} triangles ({} bytes) in {:.2f} s".format(
+          n, 84 + 50*n, time.perf_counter() - start))
+
+################################################################################
@@ -0,0 +1,150 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Complexity of the generated figures:
+#
+#   python pdfstats.py                      # ./pictures/*.pdf
+#   python pdfstats.py pictures --budget budget.json
+#
+# For every PDF it reports the path operators, the (uncompressed) content
+# stream bytes, the embedded fonts and the object count, and exits with 1
+# when a figure goes over the budget of the first pattern that matches its
+# name. A budget file is a JSON dict {pattern: {counter: maximum}} that
+# replaces BUDGETS below.
+
+import os, re, sys, json, zlib, glob, argparse
+
+from fnmatch import fnmatch
+
+# Budgets for the current settings (points_per_turn=360, turns=10) with
+# some room left. Raising points_per_turn ten times breaks them.
+BUDGETS = {"Spiral_*":  {"path_ops": 6000, "content_bytes": 150000,
+                         "fonts":       8, "objects":          80},
+           "Example_*": {"path_ops": 8000, "content_bytes": 200000,
+                         "fonts":       8, "objects":          80},
+           "*":         {"path_ops": 8000, "content_bytes": 200000,
+                         "fonts":       8, "objects":          80}}
+
+PATH_OPS = {b"m", b"l", b"c", b"v", b"y", b"h", b"re"}
+
+### PARSING ####################################################################
+
+STREAM = re.compile(rb"\bobj\b((?:(?!endobj).)*?)\bstream\r?\n", re.S)
+
+def streams(data):
+
+    # (dictionary, decoded bytes) of every stream of the file:
+    for match in STREAM.finditer(data):
+        head  = match.group(1)
+        begin = match.end()
+
+        # Its end (an indirect /Length, like "12 0 R", is found at endstream,
+        # minus the end of line that goes before it):
+        size  = re.search(rb"/Length\s+(\d+)\b(?!\s+\d+\s+R)", head)
+        if size:
+            end = begin + int(size.group(1))
+        else:
+            end = data.index(b"endstream", begin)
+            if   data[end-2:end] == b"\r\n":         end -= 2
+            elif data[end-1:end] in (b"\r", b"\n"): end -= 1
+        raw   = data[begin:end]
+        if b"/FlateDecode" in head:
+            try:    raw = zlib.decompress(raw)
+            except zlib.error: pass
+        yield head, raw
+
+def operators(content):
+
+    # Operators of a content stream (strings, names and numbers skipped):
+    i, n = 0, len(content)
+    while i < n:
+        c = content[i:i+1]
+        if c == b"(":
+            depth = 0
+            while i < n:
+                c = content[i:i+1]
+                if   c == b"\\": i += 1
+                elif c == b"(":  depth += 1
+                elif c == b")":  depth -= 1
+                i += 1
+                if depth == 0: break
+            continue
+        if c == b"%":
+            while i < n and content[i:i+1] not in b"\r\n": i += 1
+            continue
+        if c == b"<" and content[i:i+2] != b"<<":
+            i = content.find(b">", i) + 1 or n
+            continue
+        if c.isalpha() or c in b"'\"*":
+            j = i
+            while j < n and (content[j:j+1].isalpha() or
+                             content[j:j+1] in b"'\"*"): j += 1
+            yield content[i:j]
+            i = j
+            continue
+        if c == b"/":
+            i += 1
+            while i < n and content[i:i+1] not in b" \t\r\n/[]()<>{}%": i += 1
+            continue
+        i += 1
+
+def stats(filename):
+    with open(filename, "rb") as f: data = f.read()
+
+    path_ops, content_bytes, fonts, objects = 0, 0, set(), 0
+    objects = len(re.findall(rb"\d+\s+\d+\s+obj\b", data))
+    fonts.update(re.findall(rb"/BaseFont\s*/([^\s/<>\[\]]+)", data))
+    for head, raw in streams(data):
+        if b"/ObjStm" in head:
+            objects += int(re.search(rb"/N\s+(\d+)", head).group(1))
+            fonts.update(re.findall(rb"/BaseFont\s*/([^\s/<>\[\]]+)", raw))
+        elif not re.search(rb"/(Subtype|Type)\s*/(Image|XRef|Metadata|Type1C|"
+                           rb"CIDFontType0C|OpenType)|"
+                           rb"/Length[123]", head):
+            content_bytes += len(raw)
+            path_ops += sum(1 for op in operators(raw) if op in PATH_OPS)
+
+    return {"path_ops": path_ops, "content_bytes": content_bytes,
+            "fonts": len(fonts), "objects": objects, "bytes": len(data)}
+
+def budget(name, budgets):
+    for pattern, limits in budgets.items():
+        if fnmatch(name, pattern): return limits
+    return {}
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Complexity of the figures")
+    parser.add_argument("folder", nargs="?", default="pictures")
+    parser.add_argument("--budget",  help="JSON file with the budgets")
+    parser.add_argument("--pattern", default="*.pdf")
+    args = parser.parse_args()
+
+    budgets = BUDGETS
+    if args.budget:
+        with open(args.budget) as f: budgets = json.load(f)
+
+    failures = 0
+    print("{:<24} {:>9} {:>14} {:>6} {:>8} {:>9}".format(
+          "figure", "path_ops", "content_bytes", "fonts", "objects", "bytes"))
+    for filename in sorted(glob.glob(os.path.join(args.folder, args.pattern))):
+        name   = os.path.splitext(os.path.basename(filename))[0]
+        S      = stats(filename)
+        limits = budget(name, budgets)
+        over   = [k for k in limits if S.get(k, 0) > limits[k]]
+        failures += bool(over)
+        print("{:<24} {path_ops:>9} {content_bytes:>14} {fonts:>6} "
+              "{objects:>8} {bytes:>9}".format(name, **S) +
+              ("  OVER BUDGET: " + ", ".join(over) if over else ""))
+
+    sys.exit(1 if failures else 0)
+
+################################################################################
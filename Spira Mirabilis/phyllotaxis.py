@@ -0,0 +1,150 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Phyllotaxis (sunflower) figures with the golden angle:
+#
+#   python phyllotaxis.py                       # 2000 seeds, pictures/
+#   python phyllotaxis.py --seeds 100000 --dot 0.5
+#   python phyllotaxis.py --angle 137.3         # not golden: no spirals
+#
+# Seed k (Vogel's model) is at radius c*sqrt(k) and angle k*angle, so every
+# seed takes the same area (pi*c*c) and its neighbours are at a distance of
+# about c*sqrt(pi). The seeds are indexed in a hash grid (see build_index()
+# in geometry.py) to check that the dots do not overlap and to find the two
+# nearest neighbours of every seed: the index offsets of those links are
+# consecutive Fibonacci numbers (21, 34, 55...) and the links with the same
+# offset, chained, are the visible spirals (parastichies). All the dots go
+# to one path and every family of spirals to another (see dots() and
+# polylines() in figures.py), so the PDF has a handful of strokes whatever
+# the number of seeds.
+
+import os, time, argparse
+
+from math     import *
+from pyx      import canvas, path, style, color
+from geometry import *
+
+import figures
+
+GOLDEN_ANGLE = pi*(3 - sqrt(5))
+
+### SEEDS ######################################################################
+
+def seeds(n, c=1, angle=GOLDEN_ANGLE):
+    return tuple((c*sqrt(k)*sin(k*angle), c*sqrt(k)*cos(k*angle))
+                 for k in range(1, n+1))
+
+def overlaps(index, radius):
+
+    # Pairs of seeds (dots of this radius) that overlap:
+    cell, points, grid = index
+    return sum(len(query_radius(index, p, 2*radius)) - 1
+               for p in points) // 2
+
+def links(index, c=1, k=2):
+
+    # Links (i, j), i < j, from every seed to its k nearest neighbours:
+    cell, points, grid = index
+    L = set()
+    for i, p in enumerate(points):
+        near = sorted((hypot(points[j][0] - p[0], points[j][1] - p[1]), j)
+                      for j in query_radius(index, p, 1.4*c*sqrt(pi))
+                      if j != i)
+        for d, j in near[:k]: L.add((min(i, j), max(i, j)))
+    return L
+
+def parastichies(points, L, share=0.02):
+
+    # {offset: polylines} chaining the links with the same index offset,
+    # for the offsets with at least share of the links:
+    families = {}
+    for i, j in L: families.setdefault(j - i, set()).add(i)
+    spirals = {}
+    for d, starts in sorted(families.items()):
+        if len(starts) < share*len(L): continue
+        lines = []
+        for i in sorted(starts):
+            if i - d in starts: continue
+            line = [points[i]]
+            while i in starts:
+                i += d
+                line.append(points[i])
+            lines.append(line)
+        spirals[d] = lines
+    return spirals
+
+### FIGURE #####################################################################
+
+COLORS = ((0.85, 0.15, 0.10), (0.10, 0.30, 0.80), (0.10, 0.60, 0.20),
+          (0.80, 0.50, 0.00))
+
+def phyllotaxis(filename, n=2000, angle=GOLDEN_ANGLE, dot=0.6,
+                width=210, height=297, margin=15, symbol=r"$\phi$"):
+
+    # Disc of n seeds filling the paper, dots of dot times the spacing:
+    X_top, Y_top = width/20 - margin/10, height/20 - margin/10
+    c = min(X_top, Y_top - 2) / sqrt(n)
+    start = time.perf_counter()
+    P = seeds(n, c, angle)
+    index = build_index(P, c*sqrt(pi))
+    radius = dot*c*sqrt(pi)/2
+    spirals = parastichies(P, links(index, c))
+    report = {"seeds": n, "overlaps": overlaps(index, radius),
+              "families": {d: len(l) for d, l in spirals.items()},
+              "geometry": round(time.perf_counter() - start, 2)}
+
+    CANVAS = canvas.canvas()
+    BASE   = [style.linecap.round, style.linejoin.round]
+    for k, (d, lines) in enumerate(sorted(spirals.items())):
+        CANVAS.stroke(figures.polylines(lines),
+                      BASE + [style.linewidth(radius/2),
+                              color.rgb(*COLORS[k % len(COLORS)])])
+    CANVAS.stroke(figures.dots(P), BASE + [style.linewidth(2*radius)])
+
+    # Logo and info (as in template()):
+    CANVAS.fill(path.rect(X_top-3.35, Y_top-0.95, 3.35, 0.95))
+    CANVAS.draw(*figures.put_text(X_top-1.65, Y_top-0.75,
+                                  r"{\huge \bfseries MMACA}",
+                                  [color.rgb.white]))
+    info = r"${:.1f}".format(degrees(angle)) + r"^{\circ}$"
+    if symbol: info = symbol + " / " + info
+    CANVAS.draw(*figures.put_text(X_top-1.65, Y_top-1.65,
+                                  r"{\Large " + info + "}"))
+
+    # Paper border:
+    W, H = (width-1)/20, (height-1)/20
+    CANVAS.stroke(path.rect(-W, -H, 2*W, 2*H),
+                  BASE + [color.rgb.white, style.linewidth.THIN])
+    CANVAS.writePDFfile(filename)
+    report["drawing"] = round(time.perf_counter() - start
+                              - report["geometry"], 2)
+    return report
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Phyllotaxis figure")
+    parser.add_argument("--seeds",  type=int,   default=2000)
+    parser.add_argument("--angle",  type=float, default=degrees(GOLDEN_ANGLE),
+                        help="degrees")
+    parser.add_argument("--dot",    type=float, default=0.6,
+                        help="dot diameter relative to the seed spacing")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    figures.setup()
+    filename = args.output or os.path.join("pictures", "Phyllotaxis_{}".format(
+                                                       args.seeds))
+    golden = abs(radians(args.angle) - GOLDEN_ANGLE) < 1e-6
+    report = phyllotaxis(filename, args.seeds, radians(args.angle), args.dot,
+                         symbol=r"$\phi$" if golden else None)
+    print(report)
+
+################################################################################
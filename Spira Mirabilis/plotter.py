@@ -0,0 +1,228 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Pen plotter output of the templates (HPGL or G-code):
+#
+#   python plotter.py Phi                   # plotter/Spiral_Phi_*.hpgl
+#   python plotter.py Phi 2 --gcode --draw-speed 30 --travel-speed 120
+#
+# The strokes of the template (spiral, radii, logo box and construction)
+# are reordered to shorten the pen up travel: a greedy tour picks the
+# nearest stroke next, entering it by its nearer end (or, if it is closed,
+# by its nearest vertex), and 2-opt then reverses any run of strokes that
+# shortens the tour (reversing a run also reverses every stroke in it, so
+# only the two travels at its ends change) and Or-opt moves single strokes
+# to where they add the least travel, counting the trip back home after the
+# last one. The plot time is estimated from the drawing and travel speeds
+# (mm/s) and the time to lift and drop the pen, for the strokes in drawing
+# order and after the optimization.
+# The labels are plotted with the character generator of HPGL (LB) and
+# left out of the G-code.
+
+import os, argparse
+
+from math     import *
+from geometry import *
+
+from labels        import label, ascii_text
+from constructions import construct
+
+### STROKES ####################################################################
+
+def template_strokes(symbol, K, angle, radii=24,
+                     width=210, height=297, margin=15,
+                     points_per_turn=360, turns=10, min_radii=5,
+                     construction=None, precomputed=None):
+
+    # Strokes (points in mm from the bottom left corner, closed) and labels
+    # (x, y, height, text) of draw_template() in figures.py, in its order:
+    precomputed, R = template_layout(K, angle, radii, width, height, margin,
+                                     points_per_turn, turns, min_radii,
+                                     precomputed)
+    K_per_turn, rotation, scale, X, Y, X_top, Y_top, last, P = precomputed
+    mm = paper_mm(precomputed, width, height, margin)
+
+    strokes = []
+    if construction:
+        frame = (K, angle, K_per_turn, rotation, scale, X, Y)
+        RECTANGLE, INPUT, OUTPUT = construct(construction, frame)
+        if RECTANGLE: strokes.append(([mm(p) for p in RECTANGLE], True))
+    strokes.append(([mm(p) for p in ((X_top-3.35, Y_top-0.95),
+                                     (X_top, Y_top-0.95), (X_top, Y_top),
+                                     (X_top-3.35, Y_top))], True))
+    for r in R:
+        strokes.append(([mm((-X, -Y)), mm((scale*r[0]-X, scale*r[1]-Y))],
+                        False))
+    strokes.append(([mm((scale*p[0]-X, scale*p[1]-Y)) for p in P], False))
+    if construction:
+        for c in tuple(INPUT) + tuple(OUTPUT):
+            x, y = mm(c)
+            strokes.append(([(x + 2.5*cos(2*pi*k/36), y + 2.5*sin(2*pi*k/36))
+                             for k in range(36)], True))
+
+    (lx, ly), (ix, iy) = mm((X_top-1.65, Y_top-0.85)), mm((X_top-1.65,
+                                                            Y_top-1.75))
+    labels = [(lx, ly, 5, "MMACA"),
+              (ix, iy, 3.5, "{} / {}".format(ascii_text(label(symbol)),
+                                             angle))]
+    return strokes, labels
+
+def path(stroke, start=0, reverse=False):
+
+    # Points to draw for a stroke entered at vertex start (closed) or from
+    # its last point (reverse):
+    points, closed = stroke
+    if closed: return points[start:] + points[:start+1]
+    return points[::-1] if reverse else points
+
+### TOUR #######################################################################
+
+def order(strokes, home=(0, 0), passes=8):
+
+    # Paths of the strokes (see path()) in the order and direction of a
+    # greedy nearest stroke tour from home, improved with 2-opt and Or-opt:
+    left, tour, p = list(range(len(strokes))), [], home
+    while left:
+        best = (inf, None, None)
+        for k in left:
+            points, closed = strokes[k]
+            if closed:
+                for i, q in enumerate(points):
+                    d = hypot(q[0] - p[0], q[1] - p[1])
+                    if d < best[0]: best = (d, k, (i, False))
+            else:
+                for reverse in (False, True):
+                    q = points[-1 if reverse else 0]
+                    d = hypot(q[0] - p[0], q[1] - p[1])
+                    if d < best[0]: best = (d, k, (0, reverse))
+        d, k, how = best
+        left.remove(k)
+        tour.append(path(strokes[k], *how))
+        p = tour[-1][-1]
+
+    # 2-opt: reverse tour[i:j+1] (and every path in it, even a single one)
+    # when the travels home/end(i-1) -> start(i) and end(j) -> start(j+1)
+    # get shorter (after the last path, the pen goes back home, as counted
+    # by estimate()):
+    def d(a, b): return hypot(a[0] - b[0], a[1] - b[1])
+    for _ in range(passes):
+        better = False
+        for i in range(len(tour)):
+            a = tour[i-1][-1] if i else home
+            for j in range(i, len(tour)):
+                b = tour[j+1][0] if j+1 < len(tour) else home
+                old = d(a, tour[i][0])  + d(tour[j][-1], b)
+                new = d(a, tour[j][-1]) + d(tour[i][0],  b)
+                if new < old - 1e-9:
+                    tour[i:j+1] = [t[::-1] for t in reversed(tour[i:j+1])]
+                    better = True
+
+        # Or-opt: move a path (either way round) to where it adds the least
+        # travel, as 2-opt alone gets stuck when the trip home counts:
+        for i in range(len(tour)):
+            t      = tour.pop(i)
+            ends   = [home] + [p[-1] for p in tour]
+            starts = [p[0] for p in tour] + [home]
+            def cost(k, u): return (d(ends[k], u[0]) + d(u[-1], starts[k]) -
+                                    d(ends[k], starts[k]))
+            c, k, u = min(((cost(k, u), k, u) for k in range(len(tour) + 1)
+                           for u in (t, t[::-1])), key=lambda o: o[0])
+            if c < cost(i, t) - 1e-9: tour.insert(k, u); better = True
+            else:                     tour.insert(i, t)
+        if not better: break
+
+    # Paths that start where the previous one ends are drawn without
+    # lifting the pen:
+    paths = tour[:1]
+    for t in tour[1:]:
+        a, b = paths[-1][-1], t[0]
+        if hypot(a[0] - b[0], a[1] - b[1]) < 1e-6: paths[-1] = paths[-1] + t[1:]
+        else:                                       paths.append(t)
+    return paths
+
+def estimate(paths, draw_speed=40, travel_speed=100, pen_time=0.15,
+             home=(0, 0)):
+
+    # (seconds, drawn mm, travelled mm) to plot the paths in this order:
+    drawn = sum(hypot(b[0] - a[0], b[1] - a[1])
+                for p in paths for a, b in zip(p, p[1:]))
+    travel, q = 0, home
+    for p in paths:
+        travel += hypot(p[0][0] - q[0], p[0][1] - q[1])
+        q = p[-1]
+    travel += hypot(home[0] - q[0], home[1] - q[1])
+    return (drawn/draw_speed + travel/travel_speed + 2*pen_time*len(paths),
+            drawn, travel)
+
+### OUTPUT #####################################################################
+
+def write_hpgl(filename, paths, labels=(), units=40):
+
+    # HPGL with units plotter units per mm (40 is the usual 0.025 mm):
+    def xy(p): return "{},{}".format(round(p[0]*units), round(p[1]*units))
+    with open(filename, "w") as f:
+        f.write("IN;SP1;\n")
+        for p in paths:
+            f.write("PU{};PD{};\n".format(xy(p[0]),
+                                          ",".join(xy(q) for q in p[1:])))
+        for x, y, size, t in labels:
+            f.write("PU{};SI{:.2f},{:.2f};LO5;LB{}\x03\n".format(
+                    xy((x, y)), 0.07*size, 0.1*size, t))
+        f.write("PU0,0;SP0;\n")
+
+def write_gcode(filename, paths, draw_speed=40, z_up=3):
+
+    # G-code in mm with the pen on the Z axis (0 is down, travel at rapid
+    # speed):
+    with open(filename, "w") as f:
+        f.write("G21\nG90\nG0 Z{}\n".format(z_up))
+        for p in paths:
+            f.write("G0 X{:.3f} Y{:.3f}\nG1 Z0 F{}\n".format(*p[0],
+                                                              60*draw_speed))
+            f.write("".join("G1 X{:.3f} Y{:.3f}\n".format(*q) for q in p[1:]))
+            f.write("G0 Z{}\n".format(z_up))
+        f.write("G0 X0 Y0\nM2\n")
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    import figures
+
+    parser = argparse.ArgumentParser(description="Pen plotter templates")
+    parser.add_argument("constants", nargs="*",
+                        help="names of figures.CONSTANTS (default: all)")
+    parser.add_argument("--gcode",        action="store_true")
+    parser.add_argument("--draw-speed",   type=float, default=40, help="mm/s")
+    parser.add_argument("--travel-speed", type=float, default=100,
+                        help="mm/s")
+    parser.add_argument("--pen-time",     type=float, default=0.15,
+                        help="seconds to lift or drop the pen")
+    parser.add_argument("--folder",       default="plotter")
+    args = parser.parse_args()
+
+    jobs, L = figures.template_layouts(args.constants)
+    os.makedirs(args.folder, exist_ok=True)
+    speeds = (args.draw_speed, args.travel_speed, args.pen_time)
+    for (name, symbol, value, a), precomputed in zip(jobs, L):
+        strokes, labels = template_strokes(symbol, value, a,
+                                           precomputed=precomputed)
+        before = estimate([path(s) for s in strokes], *speeds)
+        paths  = order(strokes)
+        after  = estimate(paths, *speeds)
+        filename = os.path.join(args.folder, "Spiral_{}_{:03d}".format(name, a))
+        if args.gcode:
+            write_gcode(filename + ".gcode", paths, args.draw_speed)
+        else:
+            write_hpgl(filename + ".hpgl", paths, labels)
+        print("{}: {:.0f} s -> {:.0f} s (pen up {:.0f} mm -> {:.0f} mm)".format(
+              os.path.basename(filename), before[0], after[0], before[2],
+              after[2]))
+
+################################################################################
@@ -0,0 +1,157 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Wall posters printed as tiled sheets:
+#
+#   python poster.py Phi 90                         # A0 poster on A4 tiles
+#   python poster.py 2 180 --paper A1 --overlap 15  # K as a number
+#
+# The poster is laid out once at its real size and its spiral samples are
+# indexed by tile (see tile_ranges() in geometry.py), so every tile only
+# gets the pieces of the spiral, the radii and the logo that cross it,
+# clipped to its window. Tiles overlap their neighbours by --overlap mm and
+# the registration marks in the overlaps, together with the label of every
+# tile (row letter, column number), help to glue them. Line widths, margin
+# and logo grow with the poster (relative to A4).
+
+import os, argparse
+
+from math     import *
+from pyx      import canvas, path, style, color, trafo, text
+from geometry import *
+
+import figures
+
+### TILES ######################################################################
+
+def poster(filename, symbol, K, angle, paper="A0", tile="A4", overlap=10,
+           border=10, radii=24, points_per_turn=360, turns=10, folder="."):
+
+    # Poster layout (in cm, centered at the origin):
+    width,  height = PAPERS[paper] if isinstance(paper, str) else paper
+    tile_w, tile_h = PAPERS[tile]  if isinstance(tile,  str) else tile
+    f = width/210
+    (K_per_turn, rotation, scale, X, Y, X_top, Y_top, last,
+     P), = layouts(((K, angle, width, height, 15*f),), radii,
+                   points_per_turn, turns, 5*f, True)
+    Q = tuple((scale*p[0] - X, scale*p[1] - Y) for p in P)
+    R = logarithmic_spiral(K_per_turn, 1, radii, rotation)
+    R = tuple((scale*r[0] - X, scale*r[1] - Y) for r in R)
+
+    # Windows of the tiles (in the orientation that needs less of them):
+    W, H, O = (tile_w - 2*border)/10, (tile_h - 2*border)/10, overlap/10
+    windows = min(tile_windows(width/10, height/10, W, H, O),
+                  tile_windows(width/10, height/10, H, W, O), key=len)
+    rows, cols = windows[-1][0] + 1, windows[-1][1] + 1
+    index = tile_ranges(Q, windows)
+
+    # Registration marks (at the middle of every overlap):
+    marks = []
+    for r, c, x0, y0, x1, y1 in windows:
+        if c+1 < cols: marks.append((x1 - O/2, (y0 + y1)/2))
+        if r+1 < rows: marks.append(((x0 + x1)/2, y0 + O/2))
+
+    # Styles:
+    BASE   = [style.linecap.round, style.linejoin.round]
+    NORMAL = BASE + [style.linewidth(f*style.linewidth.normal.width)]
+    THICK  = BASE + [style.linewidth(f*style.linewidth.THick.width)]
+    DASHED = NORMAL + [style.linestyle.dashed]
+    THIN   = BASE + [style.linewidth.THIN]
+    if   radii   <  8: R_STYLE = [NORMAL] * (radii+1)
+    elif radii%2 == 0: R_STYLE = [NORMAL, DASHED] * (radii+1)
+    else:              R_STYLE = [NORMAL] * (radii+1)
+    LOGO = (X_top - 3.35*f, Y_top - 2.1*f, X_top, Y_top)
+
+    FILES = []
+    for window in windows:
+        r, c, x0, y0, x1, y1 = window
+        dx, dy = border/10 - x0, border/10 - y0
+        page   = canvas.canvas()
+        inner  = canvas.canvas([canvas.clip(path.rect(x0+dx, y0+dy,
+                                                      x1-x0, y1-y0))])
+
+        # Radii (clipped to the window):
+        for i, q in enumerate(R):
+            segment = clip_segment((-X, -Y), q, window)
+            if segment:
+                (ax, ay), (bx, by) = segment
+                inner.stroke(path.line(ax+dx, ay+dy, bx+dx, by+dy),
+                             R_STYLE[i])
+
+        # Spiral (only the sample ranges that cross the window):
+        for start, end in index.get(window, ()):
+            PATH = path.path(path.moveto(Q[start][0]+dx, Q[start][1]+dy))
+            for p in Q[start+1:end+1]: PATH.append(path.lineto(p[0]+dx,
+                                                               p[1]+dy))
+            inner.stroke(PATH, THICK)
+
+        # Logo and info (drawn as in template() and scaled):
+        if LOGO[0] < x1 and LOGO[2] > x0 and LOGO[1] < y1 and LOGO[3] > y0:
+            logo = canvas.canvas()
+            logo.fill(path.rect(-3.35, -0.95, 3.35, 0.95))
+            logo.draw(*figures.put_text(-1.65, -0.75,
+                      r"{\huge \bfseries MMACA}", [color.rgb.white]))
+            info = r"{} / ${:3d}".format(symbol, angle) + r"^{\circ}$"
+            logo.draw(*figures.put_text(-1.65, -1.65, r"{\Large "+info+"}"))
+            inner.insert(logo, [trafo.scale(f).translated(X_top+dx,
+                                                          Y_top+dy)])
+
+        # Registration marks:
+        for x, y in marks:
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                inner.stroke(path.circle(x+dx, y+dy, 0.4), THIN)
+                inner.stroke(path.line(x+dx-0.6, y+dy, x+dx+0.6, y+dy), THIN)
+                inner.stroke(path.line(x+dx, y+dy-0.6, x+dx, y+dy+0.6), THIN)
+
+        # Window, label and sheet border:
+        page.insert(inner)
+        page.stroke(path.rect(border/10, border/10, x1-x0, y1-y0),
+                    THIN + [style.linestyle.dotted, color.grey(0.5)])
+        name = "{}{}".format(chr(ord("A") + r), c+1)
+        page.text(border/10, border/20, r"\tiny {} -- {} ({}x{})".format(
+                  name, filename.replace("_", r"\_"), rows, cols),
+                  [text.valign.middle])
+        page.stroke(path.rect(0, 0, x1-x0 + border/5, y1-y0 + border/5),
+                    [color.rgb.white, style.linewidth.THIN])
+
+        FILES.append(os.path.join(folder, "{}_{}.pdf".format(filename, name)))
+        page.writePDFfile(FILES[-1])
+
+    return FILES
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Tiled poster")
+    parser.add_argument("K",     help="a name of figures.CONSTANTS or a number")
+    parser.add_argument("angle", type=int)
+    parser.add_argument("--paper",   default="A0")
+    parser.add_argument("--tile",    default="A4")
+    parser.add_argument("--overlap", type=float, default=10)
+    parser.add_argument("--border",  type=float, default=10,
+                        help="unprinted border of the tiles (mm)")
+    parser.add_argument("--radii",   type=int,   default=24)
+    parser.add_argument("--folder",  default="posters")
+    args = parser.parse_args()
+
+    if args.K in figures.CONSTANTS:
+        name, (symbol, K, angles) = args.K, figures.CONSTANTS[args.K]
+    else:
+        name, K = args.K, float(args.K)
+        symbol  = "${:g}$".format(K)
+
+    figures.setup()
+    os.makedirs(args.folder, exist_ok=True)
+    FILES = poster("Poster_{}_{:03d}_{}".format(name, args.angle, args.paper),
+                   symbol, K, args.angle, args.paper, args.tile, args.overlap,
+                   args.border, args.radii, folder=args.folder)
+    print("{} tiles in {}".format(len(FILES), args.folder))
+
+################################################################################
@@ -0,0 +1,300 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# PNG previews of the templates without PDF, pyx or LaTeX:
+#
+#   python raster.py                        # every template, 50 dpi
+#   python raster.py Phi E --dpi 150 --folder previews
+#
+# The figure of draw_template() (figures.py) is drawn from its layout into
+# an image buffer (see images.py) with anti-aliased lines: every path is
+# first accumulated as the coverage of its pixels (the exact distance from
+# the pixel center to the stroke, only over the rows and columns the stroke
+# can reach) and blended once, so the joints of the spiral are not darker
+# than the rest. Polygons are filled with 4 subscanlines per row and the
+# labels come from a small bitmap font whose glyphs are box filtered to
+# every size once and cached.
+
+import os, time, argparse
+
+from math      import *
+from geometry  import *
+from functools import lru_cache
+
+from images        import write_png
+from labels        import label
+from constructions import construct
+
+### CANVAS #####################################################################
+
+class Raster:
+
+    # Image of width x height cm at dpi (channels 1 or 3) centered at the
+    # origin, in the coordinates of draw_template():
+    def __init__(self, width, height, dpi=50, channels=1):
+        self.dpi      = dpi
+        self.k        = dpi/2.54
+        self.width    = max(1, round(width*self.k))
+        self.height   = max(1, round(height*self.k))
+        self.channels = channels
+        self.pixels   = bytearray(b"\xff" * (self.width*self.height*channels))
+
+    def px(self, p):
+        return (self.width/2 + p[0]*self.k, self.height/2 - p[1]*self.k)
+
+    def image(self):
+        return (self.width, self.height, self.channels, bytes(self.pixels))
+
+    def blend(self, coverage, color=(0, 0, 0)):
+
+        # Paint every pixel (index: coverage) with color:
+        C, P = self.channels, self.pixels
+        if C == 1: color = (round(0.299*color[0] + 0.587*color[1] +
+                                  0.114*color[2]),)
+        for i, a in coverage.items():
+            a = min(a, 1)
+            for c in range(C):
+                P[C*i + c] = round(P[C*i + c]*(1 - a) + color[c]*a)
+
+    def stroke(self, points, width, color=(0, 0, 0), dash=None):
+
+        # Polyline of points (cm) with width (cm), solid or dashed (on, off):
+        Q = [self.px(p) for p in points]
+        r = width*self.k/2
+        if dash: Q = dashes(Q, dash[0]*self.k, dash[1]*self.k)
+        else:    Q = [Q]
+        coverage = {}
+        for piece in Q:
+            for a, b in zip(piece, piece[1:]): self.capsule(a, b, r, coverage)
+        self.blend(coverage, color)
+
+    def capsule(self, A, B, r, coverage):
+
+        # Coverage of the pixels around the segment AB with half width r
+        # (lines thinner than a pixel are one pixel wide and fainter):
+        alpha, r = min(1, 2*r), max(r, 0.5)
+        R = r + 0.5
+        ax, ay, bx, by = A[0], A[1], B[0], B[1]
+        dx, dy = bx - ax, by - ay
+        L2 = dx*dx + dy*dy
+        L  = sqrt(L2)
+        x_lo, x_hi = min(ax, bx) - R, max(ax, bx) + R
+        W = self.width
+        for j in range(max(0, floor(min(ay, by) - R)),
+                       min(self.height, ceil(max(ay, by) + R))):
+            yc = j + 0.5
+            lo, hi = x_lo, x_hi
+            if L and abs(dy) > 1e-9*L:
+                # Band of the line at this row: |(x-ax)*dy - (yc-ay)*dx| <= R*L
+                u, v = ax + (yc - ay)*dx/dy, R*L/abs(dy)
+                lo, hi = max(lo, u - v), min(hi, u + v)
+            for i in range(max(0, floor(lo)), min(W, ceil(hi))):
+                xc = i + 0.5
+                t  = ((xc - ax)*dx + (yc - ay)*dy)/L2 if L2 else 0
+                t  = 0 if t < 0 else 1 if t > 1 else t
+                d  = hypot(xc - ax - t*dx, yc - ay - t*dy)
+                a  = (R - d)*alpha
+                if a > 0:
+                    n = j*W + i
+                    if a > coverage.get(n, 0): coverage[n] = a
+
+    def circle(self, center, radius, width, color=(0, 0, 0)):
+
+        # Circle of radius (cm) stroked with width (cm):
+        (cx, cy), rho = self.px(center), radius*self.k
+        alpha, r = min(1, width*self.k), max(width*self.k/2, 0.5)
+        R, coverage = r + 0.5, {}
+        for j in range(max(0, floor(cy - rho - R)),
+                       min(self.height, ceil(cy + rho + R))):
+            for i in range(max(0, floor(cx - rho - R)),
+                           min(self.width, ceil(cx + rho + R))):
+                a = (R - abs(hypot(i + 0.5 - cx, j + 0.5 - cy) - rho))*alpha
+                if a > 0: coverage[j*self.width + i] = a
+        self.blend(coverage, color)
+
+    def fill(self, points, color=(0, 0, 0), sub=4):
+
+        # Polygon (even-odd rule) with sub subscanlines per row:
+        Q = [self.px(p) for p in points]
+        E = list(zip(Q, Q[1:] + Q[:1]))
+        coverage = {}
+        for j in range(max(0, floor(min(q[1] for q in Q))),
+                       min(self.height, ceil(max(q[1] for q in Q)))):
+            for s in range(sub):
+                y = j + (s + 0.5)/sub
+                X = sorted(a[0] + (y - a[1])*(b[0] - a[0])/(b[1] - a[1])
+                           for a, b in E if (a[1] <= y) != (b[1] <= y))
+                for x0, x1 in zip(X[::2], X[1::2]):
+                    x0, x1 = max(0, x0), min(self.width, x1)
+                    for i in range(floor(x0), ceil(x1)):
+                        a = (min(x1, i + 1) - max(x0, i))/sub
+                        n = j*self.width + i
+                        coverage[n] = coverage.get(n, 0) + a
+        self.blend(coverage, color)
+
+    def text(self, x, y, t, height, color=(0, 0, 0)):
+
+        # t centered at x with its baseline at y (height of the capitals in
+        # cm), from the cached glyphs:
+        size = max(3, round(height*self.k))
+        G = [glyph(c, size) for c in t]
+        total = sum(g[0] for g in G) + (len(G) - 1)*max(1, size//7)
+        X, Y = self.px((x, y))
+        left, top = round(X - total/2), round(Y) - size
+        coverage = {}
+        for w, h, cells in G:
+            for (gi, gj), a in cells:
+                i, j = left + gi, top + gj
+                if 0 <= i < self.width and 0 <= j < self.height:
+                    coverage[j*self.width + i] = a
+            left += w + max(1, size//7)
+        self.blend(coverage, color)
+
+def dashes(Q, on, off):
+
+    # Pieces of the polyline Q (pixels) drawn with the dash pattern on, off:
+    pieces, piece, drawing, left = [], [Q[0]], True, on
+    for a, b in zip(Q, Q[1:]):
+        L, t = hypot(b[0] - a[0], b[1] - a[1]), 0
+        while L - t > left:
+            t += left
+            p = (a[0] + (b[0] - a[0])*t/L, a[1] + (b[1] - a[1])*t/L)
+            if drawing: pieces.append(piece + [p])
+            piece, drawing = [p], not drawing
+            left = on if drawing else off
+        left -= L - t
+        piece.append(b)
+    if drawing: pieces.append(piece)
+    return pieces
+
+### GLYPHS #####################################################################
+
+# 5x7 font with the characters of the labels (anything else is a box):
+FONT = {
+    "A": (" ### ", "#   #", "#   #", "#####", "#   #", "#   #", "#   #"),
+    "C": (" ####", "#    ", "#    ", "#    ", "#    ", "#    ", " ####"),
+    "M": ("#   #", "## ##", "# # #", "# # #", "#   #", "#   #", "#   #"),
+    "0": (" ### ", "#   #", "#  ##", "# # #", "##  #", "#   #", " ### "),
+    "1": ("  #  ", " ##  ", "  #  ", "  #  ", "  #  ", "  #  ", " ### "),
+    "2": (" ### ", "#   #", "    #", "   # ", "  #  ", " #   ", "#####"),
+    "3": ("#####", "   # ", "  #  ", "   # ", "    #", "#   #", " ### "),
+    "4": ("   # ", "  ## ", " # # ", "#  # ", "#####", "   # ", "   # "),
+    "5": ("#####", "#    ", "#### ", "    #", "    #", "#   #", " ### "),
+    "6": ("  ## ", " #   ", "#    ", "#### ", "#   #", "#   #", " ### "),
+    "7": ("#####", "    #", "   # ", "  #  ", " #   ", " #   ", " #   "),
+    "8": (" ### ", "#   #", "#   #", " ### ", "#   #", "#   #", " ### "),
+    "9": (" ### ", "#   #", "#   #", " ####", "    #", "   # ", " ##  "),
+    "e": ("     ", "     ", " ### ", "#   #", "#####", "#    ", " ### "),
+    "x": ("     ", "     ", "#   #", " # # ", "  #  ", " # # ", "#   #"),
+    "φ": ("  #  ", " ### ", "# # #", "# # #", "# # #", " ### ", "  #  "),
+    "π": ("     ", "#####", " # # ", " # # ", " # # ", " # # ", "#  ##"),
+    "√": ("  ###", "  #  ", "  #  ", "  #  ", "# #  ", " ##  ", "  #  "),
+    "°": (" ##  ", "#  # ", "#  # ", " ##  ", "     ", "     ", "     "),
+    "/": ("    #", "    #", "   # ", "  #  ", " #   ", "#    ", "#    "),
+    ".": ("     ", "     ", "     ", "     ", "     ", " ##  ", " ##  "),
+    "-": ("     ", "     ", "     ", " ### ", "     ", "     ", "     "),
+    " ": ("   ",   "   ",   "   ",   "   ",   "   ",   "   ",   "   "),
+}
+BOX = ("#####", "#   #", "#   #", "#   #", "#   #", "#   #", "#####")
+
+@lru_cache(maxsize=None)
+def glyph(c, size):
+
+    # Character c with size pixels of height as (width, height, cells) where
+    # cells are ((i, j), coverage), box filtered from the 5x7 font:
+    rows  = FONT.get(c, BOX)
+    s     = size/7
+    w     = max(1, round(len(rows[0])*s))
+    cells = []
+    for j in range(size):
+        for i in range(w):
+            a = 0
+            for v in range(floor(j/s), min(7, ceil((j+1)/s))):
+                for u in range(floor(i/s), min(len(rows[0]), ceil((i+1)/s))):
+                    if rows[v][u] == "#":
+                        a += ((min((i+1)/s, u+1) - max(i/s, u)) *
+                              (min((j+1)/s, v+1) - max(j/s, v)))
+            if a > 0: cells.append(((i, j), a*s*s))
+    return (w, size, tuple(cells))
+
+### TEMPLATES ##################################################################
+
+# Line widths (cm) of pyx (normal, THick, THICk) and colors of setup():
+NORMAL, THICK, MARKER = 0.02, 0.0566, 0.1131
+COLORS = {"rectangle": (255, 230, 41), "input": (255, 0, 0),
+          "output": (0, 0, 255)}
+
+def render_template(symbol, K, angle, radii=24,
+                    width=210, height=297, margin=15,
+                    points_per_turn=360, turns=10, min_radii=5,
+                    construction=None, precomputed=None, dpi=50, channels=1):
+
+    # Same figure as draw_template() in figures.py as an image:
+    precomputed, R = template_layout(K, angle, radii, width, height, margin,
+                                     points_per_turn, turns, min_radii,
+                                     precomputed)
+    K_per_turn, rotation, scale, X, Y, X_top, Y_top, last, P = precomputed
+    if margin: image = Raster(width/10, height/10, dpi, channels)
+    else:      image = Raster(2*X_top, 2*Y_top, dpi, channels)
+
+    # Construction rectangle:
+    if construction:
+        frame = (K, angle, K_per_turn, rotation, scale, X, Y)
+        RECTANGLE, INPUT, OUTPUT = construct(construction, frame)
+        if RECTANGLE: image.fill(RECTANGLE, COLORS["rectangle"])
+
+    # Logo and info:
+    image.fill(((X_top-3.35, Y_top-0.95), (X_top, Y_top-0.95),
+                (X_top, Y_top), (X_top-3.35, Y_top)))
+    image.text(X_top-1.65, Y_top-0.75, "MMACA", 0.5, (255, 255, 255))
+    image.text(X_top-1.65, Y_top-1.65,
+               "{} / {}°".format(label(symbol), angle), 0.35)
+
+    # Radii:
+    for i, r in enumerate(R):
+        dashed = radii >= 8 and radii%2 == 0 and i%2 == 1
+        image.stroke(((-X, -Y), (scale*r[0]-X, scale*r[1]-Y)), NORMAL,
+                     dash=(2*NORMAL, 2*NORMAL) if dashed else None)
+
+    # Spiral:
+    image.stroke([(scale*p[0]-X, scale*p[1]-Y) for p in P], THICK)
+
+    # INPUT and OUTPUT:
+    if construction:
+        for p in INPUT:  image.circle(p, 0.25, MARKER, COLORS["input"])
+        for p in OUTPUT: image.circle(p, 0.25, MARKER, COLORS["output"])
+
+    return image.image()
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    import figures
+
+    parser = argparse.ArgumentParser(description="PNG previews")
+    parser.add_argument("constants", nargs="*",
+                        help="names of figures.CONSTANTS (default: all)")
+    parser.add_argument("--dpi",    type=int, default=50)
+    parser.add_argument("--rgb",    action="store_true")
+    parser.add_argument("--folder", default="previews")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    jobs, L = figures.template_layouts(args.constants)
+    os.makedirs(args.folder, exist_ok=True)
+    for (name, symbol, value, a), precomputed in zip(jobs, L):
+        write_png(os.path.join(args.folder,
+                               "Spiral_{}_{:03d}.png".format(name, a)),
+                  render_template(symbol, value, a, precomputed=precomputed,
+                                  dpi=args.dpi, channels=3 if args.rgb else 1))
+    print("{} previews in {:.2f} s".format(len(jobs),
+                                           time.perf_counter() - start))
+
+################################################################################
@@ -0,0 +1,132 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Visual regression tests of the figures (needs Ghostscript):
+#
+#   python regression.py --update     # store the golden images
+#   python regression.py              # compare against them
+#   python regression.py --build      # run figures.py first (scratch dir)
+#
+# Every pictures/*.pdf is rasterized at --dpi and compared pixel by pixel
+# with golden/<name>.pgm.gz. A pixel differs when its grey levels differ by
+# more than --level, and a figure fails when more than --tolerance of its
+# pixels differ. Failing figures get a heatmap in diffs/<name>.png. The
+# figures are processed in parallel.
+
+import os, sys, gzip, glob, shutil, tempfile, subprocess, argparse
+
+from concurrent.futures import ProcessPoolExecutor
+
+from images import *
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+### COMPARISON #################################################################
+
+def difference(A, B, level):
+
+    # Per pixel differences of two grey images (None if sizes differ), only
+    # computed on the rows that are not equal byte for byte:
+    if A[:3] != B[:3]: return None
+    if A[3] == B[3]:   return (0, b"")
+    row, count = A[0]*A[2], 0
+    above = bytes(d > level for d in range(256))
+    D = bytearray(len(A[3]))
+    for i in range(0, len(A[3]), row):
+        a, b = A[3][i:i+row], B[3][i:i+row]
+        if a == b: continue
+        D[i:i+row] = bytes(abs(x - y) for x, y in zip(a, b))
+        count += D[i:i+row].translate(above).count(1)
+    return (count, bytes(D))
+
+def heatmap(image, D):
+
+    # Golden image faded to light grey with the differences in red:
+    width, height, channels, pixels = image
+    RGB = bytearray(3*width*height)
+    for i, (p, d) in enumerate(zip(pixels, D)):
+        g = 160 + p*95//255
+        if d: RGB[3*i:3*i+3] = (255, g*(255-d)//255, g*(255-d)//255)
+        else: RGB[3*i:3*i+3] = (g, g, g)
+    return (width, height, 3, bytes(RGB))
+
+def check(job):
+
+    # Rasterize, compare (or update) and write the heatmap of one figure:
+    filename, golden, diffs, dpi, level, tolerance, update = job
+    name   = os.path.splitext(os.path.basename(filename))[0]
+    target = os.path.join(golden, name + ".pgm.gz")
+    image  = rasterize(filename, dpi)
+
+    if update:
+        with gzip.open(target, "wb") as f:
+            f.write("P5 {} {} 255\n".format(*image[:2]).encode() + image[3])
+        return (name, "updated", 0)
+    if not os.path.exists(target):
+        return (name, "missing", 1)
+
+    with gzip.open(target, "rb") as f: reference = read_pnm(f.read())
+    result = difference(reference, image, level)
+    if result is None:
+        return (name, "size {}x{} != {}x{}".format(*(image[:2] +
+                                                     reference[:2])), 1)
+    count, D = result
+    fraction = count / (image[0]*image[1])
+    if fraction > tolerance:
+        write_png(os.path.join(diffs, name + ".png"), heatmap(reference, D))
+        return (name, "{:.4%} pixels differ".format(fraction), fraction)
+    return (name, "ok", fraction)
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Visual regression tests")
+    parser.add_argument("--pictures",  default="pictures")
+    parser.add_argument("--golden",    default="golden")
+    parser.add_argument("--diffs",     default="diffs")
+    parser.add_argument("--dpi",       type=int,   default=50)
+    parser.add_argument("--level",     type=int,   default=32)
+    parser.add_argument("--tolerance", type=float, default=0.001)
+    parser.add_argument("--jobs",      type=int,   default=os.cpu_count())
+    parser.add_argument("--update",    action="store_true")
+    parser.add_argument("--build",     action="store_true")
+    args = parser.parse_args()
+
+    # Build the figures in a scratch directory (removed even on errors,
+    # like a missing gs):
+    scratch = None
+    try:
+        if args.build:
+            scratch = tempfile.mkdtemp()
+            os.makedirs(os.path.join(scratch, "pictures"))
+            subprocess.run([sys.executable, os.path.join(HERE, "figures.py")],
+                           cwd=scratch, check=True)
+            args.pictures = os.path.join(scratch, "pictures")
+
+        for folder in (args.golden, args.diffs):
+            os.makedirs(folder, exist_ok=True)
+        files = sorted(glob.glob(os.path.join(args.pictures, "*.pdf")))
+        jobs  = [(f, args.golden, args.diffs, args.dpi, args.level,
+                  args.tolerance, args.update) for f in files]
+
+        failures = 0
+        with ProcessPoolExecutor(args.jobs) as pool:
+            for name, status, value in pool.map(check, jobs):
+                failed = status not in ("ok", "updated")
+                failures += failed
+                print("{:<24} {}{}".format(name, status,
+                                           "  FAIL" if failed else ""))
+    finally:
+        if scratch: shutil.rmtree(scratch)
+
+    print("{} figures, {} failures".format(len(files), failures))
+    sys.exit(1 if failures else 0)
+
+################################################################################
@@ -0,0 +1,235 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Long running template service (custom spirals on demand):
+#
+#   python service.py                       # JSON lines on stdin/stdout
+#   python service.py --socket spira.sock   # Unix socket
+#   python service.py --port 8765           # TCP socket on localhost
+#
+# Every request is one line of JSON with the arguments of template():
+#
+#   {"K": 2, "angle": 90, "symbol": "$2$", "radii": 24,
+#    "width": 210, "height": 297, "margin": 15, "id": 7}
+#
+# (only K and angle are required) and gets one line of JSON back:
+#
+#   {"id": 7, "ok": true, "cached": false, "ms": 84.2, "bytes": 11539,
+#    "pdf": "<base64>"}
+#
+# or {"id": 7, "ok": false, "error": "..."}. With "output": "name.pdf" the
+# PDF is written to that file of --folder (paths out of it are refused)
+# instead of being returned. From a shell:
+#
+#   echo '{"K": 3, "angle": 120, "output": "mine.pdf"}' | nc -U spira.sock
+#
+# pyx and LaTeX are started once, the layouts are cached (without their
+# samples) and the last --cache PDFs are kept in memory (least recently used
+# ones go first). The numbers must be finite and within LIMITS and the
+# symbol a short formula (see SYMBOL), so no request can run arbitrary LaTeX
+# or hold the others for long.
+
+import io, os, re, sys, json, math, time, base64, argparse, threading
+import socketserver
+
+from collections import OrderedDict
+from functools   import lru_cache
+
+import figures
+
+from geometry import logarithmic_spiral
+
+ARGUMENTS = ("K", "angle", "symbol", "radii", "width", "height", "margin",
+             "points_per_turn", "turns", "min_radii")
+
+# Type and range of the numeric arguments (so no request keeps the others
+# waiting for long):
+LIMITS = {"angle":           (int,   1, 3600), "radii":  (int,   4,   96),
+          "width":           (float, 20, 2000), "height": (float, 20, 2000),
+          "margin":          (float, 0,  1000), "turns":  (float, 1,   20),
+          "points_per_turn": (int,   8,  1440), "min_radii": (float, 0, 100)}
+
+# Symbols: math mode with letters, digits, a few signs and commands only
+# (anything else could run arbitrary LaTeX):
+SYMBOL = re.compile(r"\$(?:[A-Za-z0-9 +\-*/.,()'^_{}|]|\\(?:frac|sqrt|cdot|"
+                    r"times|alpha|beta|gamma|delta|epsilon|varepsilon|zeta|"
+                    r"eta|theta|lambda|mu|nu|xi|pi|rho|sigma|tau|phi|varphi|"
+                    r"chi|psi|omega)(?![A-Za-z]))*\$")
+
+LOCK = threading.Lock()
+
+### TEMPLATES ##################################################################
+
+@lru_cache(maxsize=1024)
+def cached_layout(K, angle, width, height, margin,
+                  radii, points_per_turn, turns, min_radii):
+
+    # Layout without its samples (a few numbers per entry instead of some
+    # hundreds of KB), they are computed again by sampled_layout():
+    return figures.layouts(((K, angle, width, height, margin),), radii,
+                           points_per_turn, turns, min_radii)[0]
+
+def sampled_layout(K, angle, width, height, margin,
+                   radii, points_per_turn, turns, min_radii):
+
+    # Same as layouts(..., samples=True):
+    L = cached_layout(K, angle, width, height, margin,
+                      radii, points_per_turn, turns, min_radii)
+    K_per_turn, rotation, last = L[0], L[1], L[7]
+    return L + (logarithmic_spiral(K_per_turn, turns, points_per_turn,
+                                   rotation)[:last],)
+
+def check(A):
+
+    # Arguments of draw() with their type and range checked:
+    for k, (kind, low, high) in LIMITS.items():
+        x = A[k]
+        if isinstance(x, bool) or not isinstance(x, (int, float)) or \
+           not math.isfinite(x) or (kind is int and x != int(x)):
+            raise ValueError("{} must be a {} number".format(k,
+                             "whole" if kind is int else "finite"))
+        if not low <= x <= high:
+            raise ValueError("{} must be in [{}, {}]".format(k, low, high))
+        A[k] = kind(x)
+    K = A["K"]
+    if isinstance(K, bool) or not isinstance(K, (int, float)) or \
+       not math.isfinite(K) or K <= 0 or K == 1:
+        raise ValueError("K must be a finite positive number other than 1")
+    A["K"] = K = float(K)
+    try:    K_per_turn = K**(360/A["angle"])
+    except OverflowError: K_per_turn = math.inf
+    if not 1e-9 < K_per_turn < 1e9 or K_per_turn == 1:
+        raise ValueError("K is too close to 0, 1 or infinity for this angle")
+    if 2*A["margin"] >= min(A["width"], A["height"]):
+        raise ValueError("margin must be less than half the paper")
+    A.setdefault("symbol", "${:g}$".format(K))
+    if not isinstance(A["symbol"], str) or len(A["symbol"]) > 64 or \
+       not SYMBOL.fullmatch(A["symbol"]) or \
+       A["symbol"].count("{") != A["symbol"].count("}"):
+        raise ValueError("symbol must be a short formula like $\\sqrt{2}$")
+    return A
+
+class Service:
+
+    def __init__(self, size=64, folder="custom"):
+        self.size   = size
+        self.pdfs   = OrderedDict()
+        self.folder = os.path.realpath(folder)
+        figures.setup()
+        figures.text.text(0, 0, r"{\huge \bfseries MMACA}")
+
+    def draw(self, job):
+
+        # Arguments of template() with its defaults:
+        unknown = set(job) - set(ARGUMENTS) - {"id", "output"}
+        if unknown: raise ValueError("unknown arguments: " + ", ".join(unknown))
+        A = dict(radii=24, width=210, height=297, margin=15,
+                 points_per_turn=360, turns=10, min_radii=5)
+        A.update((k, job[k]) for k in ARGUMENTS if k in job)
+        if "K" not in A or "angle" not in A:
+            raise ValueError("K and angle are required")
+        A = check(A)
+        K, angle = A["K"], A["angle"]
+
+        key = tuple(A[k] for k in ARGUMENTS)
+        if key in self.pdfs:
+            self.pdfs.move_to_end(key)
+            return self.pdfs[key], True
+
+        L = sampled_layout(K, angle, A["width"], A["height"], A["margin"],
+                           A["radii"], A["points_per_turn"], A["turns"],
+                           A["min_radii"])
+        f = io.BytesIO()
+        figures.template("Spiral_custom", A["symbol"], K, angle, A["radii"],
+                         A["width"], A["height"], A["margin"],
+                         A["points_per_turn"], A["turns"], A["min_radii"],
+                         precomputed=L, output=f)
+        self.pdfs[key] = f.getvalue()
+        if len(self.pdfs) > self.size: self.pdfs.popitem(last=False)
+        return self.pdfs[key], False
+
+    def output(self, name):
+
+        # File of --folder for an "output", refusing the ones out of it:
+        filename = os.path.realpath(os.path.join(self.folder, name))
+        if os.path.commonpath((self.folder, filename)) != self.folder or \
+           filename == self.folder:
+            raise ValueError("output out of the output folder: " + name)
+        return filename
+
+    def answer(self, line):
+
+        # One JSON request to one JSON response (errors included):
+        start, job = time.perf_counter(), {}
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict): raise ValueError("not an object")
+            if "output" in job: filename = self.output(str(job["output"]))
+            with LOCK: pdf, cached = self.draw(job)
+            response = {"id": job.get("id"), "ok": True, "cached": cached,
+                        "ms": round(1000*(time.perf_counter() - start), 1),
+                        "bytes": len(pdf)}
+            if "output" in job:
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                with open(filename, "wb") as f: f.write(pdf)
+                response["output"] = filename
+            else:
+                response["pdf"] = base64.b64encode(pdf).decode()
+            return response
+        except Exception as error:
+            return {"id": job.get("id") if isinstance(job, dict) else None,
+                    "ok": False,
+                    "error": "{}: {}".format(type(error).__name__, error)}
+
+### SERVERS ####################################################################
+
+def serve_lines(service, rfile, wfile):
+    for line in rfile:
+        if not line.strip(): continue
+        wfile.write((json.dumps(service.answer(line)) + "\n").encode())
+        wfile.flush()
+
+def serve_socket(service, address):
+
+    # One thread per connection (the drawing itself is serialized):
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self): serve_lines(service, self.rfile, self.wfile)
+
+    if isinstance(address, str):
+        if os.path.exists(address): os.remove(address)
+        server = socketserver.ThreadingUnixStreamServer(address, Handler)
+    else:
+        server = socketserver.ThreadingTCPServer(address, Handler)
+    server.daemon_threads = True
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    if isinstance(address, str): os.remove(address)
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Template service")
+    parser.add_argument("--socket", help="Unix socket file")
+    parser.add_argument("--port",   type=int, help="TCP port on localhost")
+    parser.add_argument("--cache",  type=int, default=64,
+                        help="PDFs kept in memory")
+    parser.add_argument("--folder", default="custom",
+                        help="folder of the requests with an output")
+    args = parser.parse_args()
+
+    service = Service(args.cache, args.folder)
+    if   args.socket: serve_socket(service, args.socket)
+    elif args.port:   serve_socket(service, ("127.0.0.1", args.port))
+    else:             serve_lines(service, sys.stdin.buffer, sys.stdout.buffer)
+
+################################################################################
@@ -0,0 +1,359 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Compact SVG output of the figures:
+#
+#   python svg.py                       # every template, pictures/*.svg
+#   python svg.py Phi Root2 --bezier 16 # spiral as 16 cubic Beziers per turn
+#   SPIRA_FORMATS=pdf,svg python figures.py
+#
+# Templates are written straight from their layout (no pyx, no LaTeX): the
+# radii are one path per line style, the spiral one path of relative,
+# quantized commands (--digits decimals of a mm) or, with --bezier, a few
+# cubic Bezier segments per turn built from the exact tangents of the
+# spiral. The styles and the construction markers are shared <defs>, and
+# the spiral is written to the file while it is being encoded.
+#
+# Any other pyx canvas (the examples) goes through write_canvas(): the SVG
+# of pyx is rewritten with relative, quantized paths and every repeated
+# shape (the same relative path at another place) is moved to <defs> and
+# drawn with <use>.
+
+import io, re, argparse
+
+from math     import *
+from geometry import *
+
+from xml.sax.saxutils import escape
+
+from labels        import label
+from constructions import construct
+
+### PATH ENCODING ##############################################################
+
+NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+TOKEN  = re.compile(r"[A-Za-z]|" + NUMBER)
+ARGS   = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "A": 7, "Z": 0}
+
+def number(n, digits):
+
+    # Integer n (in units of 10**-digits) as the shortest decimal string:
+    s = str(abs(n)).rjust(digits+1, "0")
+    if digits: s = (s[:-digits] + "." + s[-digits:]).rstrip("0").rstrip(".")
+    if s.startswith("0."): s = s[1:]
+    return "-" + s if n < 0 else s
+
+class Pen:
+
+    # Relative path commands between quantized points (so the rounding
+    # errors never add up), without repeated command letters and with the
+    # fewest separators:
+    def __init__(self, digits=2):
+        self.digits = digits
+        self.q      = 10**digits
+        self.point  = self.start = (0, 0)
+        self.letter = self.tail  = None
+
+    def quantize(self, x, y):
+        return (round(x*self.q), round(y*self.q))
+
+    def emit(self, letter, values):
+        out = []
+        if letter != self.letter or letter in "mMz":
+            out.append(letter)
+            self.letter, self.tail = letter, None
+        for n in values:
+            s = number(n, self.digits)
+            if self.tail is not None and not (s[0] == "-" or
+                                              s[0] == "." and "." in self.tail):
+                out.append(" ")
+            out.append(s)
+            self.tail = s
+        return "".join(out)
+
+    def move(self, x, y):
+        X, Y = self.quantize(x, y)
+        if self.letter is None: s = self.emit("M", (X, Y))
+        else: s = self.emit("m", (X - self.point[0], Y - self.point[1]))
+        self.point = self.start = (X, Y)
+        return s
+
+    def line(self, x, y):
+        X, Y = self.quantize(x, y)
+        dx, dy = X - self.point[0], Y - self.point[1]
+        self.point = (X, Y)
+        if dy == 0: return self.emit("h", (dx,))
+        if dx == 0: return self.emit("v", (dy,))
+        return self.emit("l", (dx, dy))
+
+    def curve(self, x1, y1, x2, y2, x, y):
+        (X1, Y1), (X2, Y2), (X, Y) = (self.quantize(x1, y1),
+                                      self.quantize(x2, y2),
+                                      self.quantize(x, y))
+        px, py = self.point
+        self.point = (X, Y)
+        return self.emit("c", (X1-px, Y1-py, X2-px, Y2-py, X-px, Y-py))
+
+    def arc(self, rx, ry, angle, large, sweep, x, y):
+        X, Y = self.quantize(x, y)
+        dx, dy = X - self.point[0], Y - self.point[1]
+        self.point = (X, Y)
+        return self.emit("a", self.quantize(rx, ry) + (round(angle*self.q),
+                         int(large)*self.q, int(sweep)*self.q, dx, dy))
+
+    def close(self):
+        self.point = self.start
+        return self.emit("z", ())
+
+def compact_path(d, digits=2):
+
+    # Absolute SVG path data (as written by pyx) to (x, y, rest): its first
+    # point and the relative commands after it, or None if d uses commands
+    # that are not handled here:
+    tokens = TOKEN.findall(d)
+    pen, out, i, first = Pen(digits), [], 0, None
+    while i < len(tokens):
+        letter = tokens[i]
+        if letter not in ARGS: return None
+        i += 1
+        while True:
+            values = [float(t) for t in tokens[i:i + ARGS[letter]]]
+            if len(values) < ARGS[letter] or \
+               any(t.isalpha() for t in tokens[i:i + ARGS[letter]]):
+                return None
+            i += ARGS[letter]
+            if   letter == "M":
+                if first is None:
+                    first = pen.quantize(*values)
+                    pen.point = pen.start = first
+                    pen.letter = "M"
+                else: out.append(pen.move(*values))
+                letter = "L"
+            elif letter == "L": out.append(pen.line(*values))
+            elif letter == "H": out.append(pen.line(values[0], pen.point[1]/pen.q))
+            elif letter == "V": out.append(pen.line(pen.point[0]/pen.q, values[0]))
+            elif letter == "C": out.append(pen.curve(*values))
+            elif letter == "A": out.append(pen.arc(*values))
+            else:               out.append(pen.close())
+            if not ARGS[letter] or i >= len(tokens) or tokens[i].isalpha(): break
+    if first is None: return None
+    return number(first[0], digits), number(first[1], digits), "".join(out)
+
+### CANVAS #####################################################################
+
+ELEMENT = re.compile(r'<path d="([^"]*)"([^>]*?)/>')
+GROUPS  = re.compile(r'(<g( [^>]*)>(?:[^<]|<(?!/?g[ >]))*?)\s*</g>\s*<g\2>')
+
+def compact_svg(source, out, digits=2, repeats=2):
+
+    # The SVG source of pyx, with compact paths, to the text file out.
+    # Consecutive groups with the same style are merged and the shapes used
+    # at least repeats times (and not too short) go to <defs>:
+    merged = GROUPS.sub(r"\1", source)
+    while merged != source: source, merged = merged, GROUPS.sub(r"\1", merged)
+    paths, count = {}, {}
+    for m in ELEMENT.finditer(source):
+        c = compact_path(m.group(1), digits)
+        if c and "id=" not in m.group(2):
+            paths[m.start()] = c
+            if len(c[2]) > 12: count[c[2]] = count.get(c[2], 0) + 1
+    shared = {rest: "p{}".format(k) for k, rest in enumerate(
+              r for r in count if count[r] >= repeats)}
+
+    # Root element (a version="1.1" document, so <use> needs xlink:href and
+    # its namespace), shared shapes and the rest of the elements, in order:
+    start = source.index("<svg")
+    root  = source.index(">", start) + 1
+    head  = source[:root]
+    if shared and "xmlns:xlink=" not in head:
+        head = (head[:start+4] + ' xmlns:xlink="http://www.w3.org/1999/xlink"' +
+                head[start+4:])
+    out.write(head + "\n")
+    if shared:
+        out.write("<defs>\n")
+        for rest, name in shared.items():
+            out.write('<path id="{}" d="M0 0{}"/>\n'.format(name, rest))
+        out.write("</defs>")
+    position = root
+    for m in ELEMENT.finditer(source, root):
+        out.write(source[position:m.start()])
+        position = m.end()
+        if m.start() not in paths:
+            out.write(m.group(0))
+            continue
+        x, y, rest = paths[m.start()]
+        if rest in shared:
+            out.write('<use xlink:href="#{}" x="{}" y="{}"{}/>'.format(
+                      shared[rest], x, y, m.group(2)))
+        else:
+            sep = "" if y[0] == "-" else " "
+            out.write('<path d="M{}{}{}{}"{}/>'.format(x, sep, y, rest,
+                                                      m.group(2)))
+    out.write(source[position:])
+
+def write_canvas(CANVAS, filename, digits=1):
+
+    # Compact SVG of any pyx canvas (in pt, as pyx writes it, so 1 decimal
+    # is 0.035 mm):
+    buffer = io.BytesIO()
+    CANVAS.writeSVGfile(buffer)
+    with open(filename, "w", encoding="utf-8") as f:
+        compact_svg(buffer.getvalue().decode("utf-8"), f, digits)
+
+### TEMPLATES ##################################################################
+
+# Line widths (mm) and colors of figures.py (pyx normal, THick, THICk...):
+STYLE = """
+path{fill:none;stroke:#000;stroke-width:.2;stroke-linecap:round;stroke-linejoin:round}
+.dashed{stroke-dasharray:.4}
+.spiral{stroke-width:.566}
+.rectangle{fill:#ffe629;stroke:#ffe629;stroke-width:.035}
+.input{fill:none;stroke:#f00;stroke-width:1.131}
+.output{fill:none;stroke:#00f;stroke-width:1.131}
+text{font-family:sans-serif;text-anchor:middle}
+"""
+
+def plain(t):
+
+    # Text of the LaTeX labels used by the templates (escaped):
+    return escape(label(t))
+
+def spiral_bezier(pen, K_per_turn, rotation, scale, X, Y, turns, per_turn):
+
+    # Cubic Bezier segments (per_turn of them per turn) through the spiral,
+    # in mm, with the tangents of the spiral at both ends of every segment:
+    def point(t):
+        r, a = K_per_turn**(-t), 2*pi*t - rotation
+        return (10*(scale*r*sin(a) - X), -10*(scale*r*cos(a) - Y))
+    def tangent(t):
+        u, v = spiral_tangent(K_per_turn, t, rotation)
+        return (10*scale*u, -10*scale*v)
+
+    n = max(1, ceil(turns*per_turn))
+    yield pen.move(*point(0))
+    for i in range(n):
+        t0, t1 = i*turns/n, (i+1)*turns/n
+        (x0, y0), (x1, y1) = point(t0), point(t1)
+        (u0, v0), (u1, v1) = tangent(t0), tangent(t1)
+        h = (t1 - t0)/3
+        yield pen.curve(x0 + h*u0, y0 + h*v0, x1 - h*u1, y1 - h*v1, x1, y1)
+
+def write_template(filename, symbol, K, angle, radii=24,
+                   width=210, height=297, margin=15,
+                   points_per_turn=360, turns=10, min_radii=5,
+                   construction=None, precomputed=None, bezier=0, digits=2,
+                   chunk=256):
+
+    # Same figure as draw_template() in figures.py, in mm with the origin at
+    # the paper center (SVG y axis downwards):
+    precomputed, R = template_layout(K, angle, radii, width, height, margin,
+                                     points_per_turn, turns, min_radii,
+                                     precomputed)
+    K_per_turn, rotation, scale, X, Y, X_top, Y_top, last, P = precomputed
+    def mm(p): return (10*p[0], -10*p[1])
+    if margin: box = (-width/2, -height/2, width, height)
+    else:      box = (-10*X_top, -10*Y_top, 20*X_top, 20*Y_top)
+
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" viewBox="{:g} {:g} '
+                '{:g} {:g}" width="{:g}mm" height="{:g}mm">\n'.format(
+                *box, box[2], box[3]))
+        f.write("<defs><style>{}</style>".format(STYLE))
+        if construction:
+            f.write('<circle id="c" r="2.5"/>')
+        f.write("</defs>\n")
+
+        # Construction rectangle:
+        if construction:
+            frame = (K, angle, K_per_turn, rotation, scale, X, Y)
+            RECTANGLE, INPUT, OUTPUT = construct(construction, frame)
+            if RECTANGLE:
+                pen = Pen(digits)
+                d = pen.move(*mm(RECTANGLE[0])) + "".join(
+                    pen.line(*mm(p)) for p in RECTANGLE[1:]) + pen.close()
+                f.write('<path class="rectangle" d="{}"/>\n'.format(d))
+
+        # Logo and info:
+        f.write('<path style="fill:#000;stroke:none" d="M{:.2f} {:.2f}'
+                'h-33.5v9.5h33.5z"/>\n'.format(10*X_top, -10*Y_top))
+        f.write('<text x="{:.2f}" y="{:.2f}" style="font-size:7.3px;'
+                'font-weight:bold;fill:#fff">MMACA</text>\n'.format(
+                10*X_top - 16.5, -10*Y_top + 7.5))
+        f.write('<text x="{:.2f}" y="{:.2f}" style="font-size:5.1px">{} / '
+                '{}°</text>\n'.format(10*X_top - 16.5, -10*Y_top + 16.5,
+                                      plain(symbol), angle))
+
+        # Radii (one path per line style, every radius from the center):
+        if   radii   <  8: dashed = ()
+        elif radii%2 == 0: dashed = range(1, len(R), 2)
+        else:              dashed = ()
+        for group, name in ((sorted(set(range(len(R))) - set(dashed)), ""),
+                            (dashed, ' class="dashed"')):
+            if not group: continue
+            pen = Pen(digits)
+            d   = [pen.move(*mm((-X, -Y)))]
+            for i in group:
+                d.append(pen.line(*mm((scale*R[i][0]-X, scale*R[i][1]-Y))))
+                d.append(pen.move(*mm((-X, -Y))))
+            f.write('<path{} d="{}"/>\n'.format(name, "".join(d[:-1])))
+
+        # Spiral (streamed in chunks of commands):
+        f.write('<path class="spiral" d="')
+        pen = Pen(digits)
+        if bezier:
+            commands = spiral_bezier(pen, K_per_turn, rotation, scale, X, Y,
+                                     (len(P) - 1)/points_per_turn, bezier)
+        else:
+            commands = (pen.move(*mm((scale*p[0]-X, scale*p[1]-Y))) if i == 0
+                        else pen.line(*mm((scale*p[0]-X, scale*p[1]-Y)))
+                        for i, p in enumerate(P))
+        buffer = []
+        for command in commands:
+            buffer.append(command)
+            if len(buffer) == chunk:
+                f.write("".join(buffer))
+                buffer = []
+        f.write("".join(buffer) + '"/>\n')
+
+        # Construction INPUT and OUTPUT:
+        if construction:
+            for name, points in (("input", INPUT), ("output", OUTPUT)):
+                for p in points:
+                    x, y = mm(p)
+                    f.write('<use href="#c" class="{}" x="{:.2f}" y="{:.2f}"'
+                            '/>\n'.format(name, x, y))
+
+        f.write("</svg>\n")
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    import figures
+
+    parser = argparse.ArgumentParser(description="SVG templates")
+    parser.add_argument("constants", nargs="*",
+                        help="names of figures.CONSTANTS (default: all)")
+    parser.add_argument("--bezier", type=int, default=0,
+                        help="cubic segments per turn (default: polyline)")
+    parser.add_argument("--digits", type=int, default=2,
+                        help="decimals of the coordinates (in mm)")
+    parser.add_argument("--folder", default="pictures")
+    args = parser.parse_args()
+
+    jobs, L = figures.template_layouts(args.constants)
+    total = 0
+    for (name, symbol, value, a), precomputed in zip(jobs, L):
+        filename = "{}/Spiral_{}_{:03d}.svg".format(args.folder, name, a)
+        write_template(filename, symbol, value, a, precomputed=precomputed,
+                       bezier=args.bezier, digits=args.digits)
+        with open(filename, "rb") as f: total += len(f.read())
+    print("{} templates, {} bytes".format(len(jobs), total))
+
+################################################################################
@@ -0,0 +1,262 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Catalogues of templates from a parameter grid:
+#
+#   python sweep.py grid.json --output catalogue
+#
+# where grid.json lists the values of every parameter (all but K optional):
+#
+#   {"K":      [2, 3, "e", "sqrt(2)",
+#               {"name": "Phi", "symbol": "$\\phi$", "value": "(1+sqrt(5))/2"}],
+#    "angle":  [90, 180, 270, 360],
+#    "radii":  [12, 24],
+#    "paper":  ["A4", "A3", "Letter", [200, 200]],
+#    "margin": [15]}
+#
+# Every combination is a template, output/<name>.pdf, and a line of
+# output/manifest.jsonl (a bad entry, like an unknown paper, is a failed
+# line and the rest of the grid is still drawn). The jobs are drawn in
+# batches of --batch (one layouts() call each) by a pool of --workers
+# processes, with at most two batches per worker in flight, and the workers
+# are replaced every --recycle batches, so the memory does not grow with the
+# sweep. Running
+# the same sweep again resumes it: the templates that are already in the
+# manifest are skipped (--restart draws them all again).
+
+import io, os, re, sys, ast, json, math, time, operator, argparse
+
+from itertools          import product, islice
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import figures, tracing
+
+### JOBS #######################################################################
+
+# Operators, constants and functions of the K expressions:
+OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub,
+             ast.Mult: operator.mul, ast.Div: operator.truediv,
+             ast.Pow: operator.pow, ast.USub: operator.neg,
+             ast.UAdd: operator.pos}
+NAMES     = {"pi": math.pi, "e": math.e, "tau": math.tau}
+FUNCTIONS = {f: getattr(math, f) for f in ("sqrt", "exp", "log", "log2",
+             "log10", "sin", "cos", "tan", "asin", "acos", "atan", "sinh",
+             "cosh", "tanh", "radians", "degrees")}
+
+def evaluate(expression):
+
+    # Value of an arithmetic expression of numbers, NAMES and FUNCTIONS,
+    # like "(1+sqrt(5))/2" (parsed, never run):
+    def value(node):
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return float(node.value)
+        if isinstance(node, ast.Name) and node.id in NAMES:
+            return NAMES[node.id]
+        if isinstance(node, ast.BinOp) and type(node.op) in OPERATORS:
+            return OPERATORS[type(node.op)](value(node.left), value(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in OPERATORS:
+            return OPERATORS[type(node.op)](value(node.operand))
+        if isinstance(node, ast.Call) and not node.keywords and \
+           isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS:
+            return FUNCTIONS[node.func.id](*map(value, node.args))
+        raise ValueError("bad expression {!r}".format(expression))
+    return value(ast.parse(expression, mode="eval").body)
+
+def number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool) and \
+           math.isfinite(x)
+
+def constant(k):
+
+    # (name, symbol, value) of a number, an expression or a dict:
+    if isinstance(k, dict):
+        value = constant(k["value"])[2]
+        return (k.get("name", repr(value)),
+                k.get("symbol", "${:g}$".format(value)), value)
+    if isinstance(k, str):
+        value = evaluate(k)
+        return (re.sub(r"[^\w.]+", "_", k).strip("_"), "${:g}$".format(value),
+                value)
+    if not number(k): raise ValueError("K must be a number or an expression")
+    return (repr(k), "${:g}$".format(k), k)
+
+def job(k, angle, radii, paper, margin):
+
+    # Template of a grid entry, or a ValueError if the entry is bad:
+    name, symbol, value = constant(k)
+    if not number(value) or value <= 0 or value == 1:
+        raise ValueError("K must be a positive number other than 1")
+    if not number(angle) or angle != int(angle) or angle <= 0:
+        raise ValueError("angle must be a positive whole number of degrees")
+    if not number(radii) or radii != int(radii) or radii < 4:
+        raise ValueError("radii must be a whole number >= 4")
+    if isinstance(paper, str):
+        if paper not in figures.PAPERS:
+            raise ValueError("unknown paper {!r}".format(paper))
+        (width, height), size = figures.PAPERS[paper], paper
+    elif isinstance(paper, list) and len(paper) == 2 and \
+         all(number(x) and x > 0 for x in paper):
+        # repr() tells apart any two sizes (unlike "{:g}"):
+        (width, height), size = paper, "{!r}x{!r}".format(*paper)
+    else:
+        raise ValueError("paper must be a name or [width, height]")
+    if not number(margin) or not 0 <= 2*margin < min(width, height):
+        raise ValueError("margin must be >= 0 and fit the paper")
+    angle, radii = int(angle), int(radii)
+    return {"file":   "Spiral_{}_{:03d}_{}_{}_{}".format(name, angle, radii,
+                                                         size, margin),
+            "symbol": symbol, "K": value, "angle": angle, "radii": radii,
+            "width":  width,  "height": height, "margin": margin}
+
+def expand(grid):
+
+    # The jobs of the grid, one at a time (a bad entry is a job with ok
+    # False and its error, which is not drawn):
+    K = grid.get("K", []) or [{"name": n, "symbol": s, "value": v}
+                              for n, (s, v, a) in figures.CONSTANTS.items()]
+    for entry in product(K, grid.get("angle", [90]), grid.get("radii", [24]),
+                         grid.get("paper", ["A4"]), grid.get("margin", [15])):
+        try:
+            yield job(*entry)
+        except (ValueError, TypeError, ArithmeticError, KeyError) as error:
+            yield dict(zip(("K", "angle", "radii", "paper", "margin"), entry),
+                       file="Spiral_" + "_".join(re.sub(r"[^\w.]+", "_",
+                            json.dumps(x)).strip("_") for x in entry),
+                       ok=False, error="{}: {}".format(type(error).__name__,
+                                                       error))
+
+def count(grid):
+    n = len(grid.get("K", [])) or len(figures.CONSTANTS)
+    for key in ("angle", "radii", "paper", "margin"):
+        n *= len(grid.get(key, [0]))
+    return n
+
+def batches(jobs, size):
+    jobs = iter(jobs)
+    while True:
+        batch = list(islice(jobs, size))
+        if not batch: return
+        yield batch
+
+### WORKERS ####################################################################
+
+def worker():
+    tracing.worker()
+    figures.setup()
+
+def draw(batch, output):
+
+    # Layouts of the batch in one call per radii, then one template per job
+    # (the layouts of a group with a bad job are computed one by one, so its
+    # error goes to that job only):
+    def layout(jobs, radii):
+        return zip((j["file"] for j in jobs), figures.layouts(
+            [(j["K"], j["angle"], j["width"], j["height"], j["margin"])
+             for j in jobs], radii, samples=True))
+    L = {}
+    for radii in {j["radii"] for j in batch}:
+        group = [j for j in batch if j["radii"] == radii]
+        try:    L.update(layout(group, radii))
+        except Exception: pass
+
+    results = []
+    for j in batch:
+        start = time.perf_counter()
+        try:
+            if j["file"] not in L: L.update(layout([j], j["radii"]))
+            f = io.BytesIO()
+            figures.template(j["file"], j["symbol"], j["K"], j["angle"],
+                             j["radii"], j["width"], j["height"], j["margin"],
+                             precomputed=L.pop(j["file"]), output=f)
+            filename = os.path.join(output, j["file"] + ".pdf")
+            with open(filename + ".part", "wb") as g: g.write(f.getvalue())
+            os.replace(filename + ".part", filename)
+            result = {"ok": True, "bytes": f.tell()}
+        except Exception as error:
+            result = {"ok": False, "error": "{}: {}".format(
+                      type(error).__name__, error)}
+        result["ms"] = round(1000*(time.perf_counter() - start), 1)
+        results.append(dict(j, **result))
+    return results
+
+### MANIFEST ###################################################################
+
+def finished(manifest, output):
+
+    # Templates of a previous run that do not need to be drawn again:
+    done = set()
+    if not os.path.exists(manifest): return done
+    with open(manifest) as f:
+        for line in f:
+            try:    entry = json.loads(line)
+            except ValueError: continue
+            if entry["ok"] and os.path.exists(os.path.join(output,
+                                                 entry["file"] + ".pdf")):
+                done.add(entry["file"])
+    return done
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Sweep a parameter grid")
+    parser.add_argument("grid")
+    parser.add_argument("--output",  default="catalogue")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--batch",   type=int, default=16)
+    parser.add_argument("--recycle", type=int, default=50,
+                        help="batches drawn by a worker before replacing it")
+    parser.add_argument("--restart", action="store_true")
+    args = parser.parse_args()
+
+    with open(args.grid) as f: grid = json.load(f)
+    os.makedirs(args.output, exist_ok=True)
+    manifest = os.path.join(args.output, "manifest.jsonl")
+    if args.restart and os.path.exists(manifest): os.remove(manifest)
+    done = finished(manifest, args.output)
+
+    total, drawn, failed = count(grid), len(done), 0
+    jobs = (j for j in expand(grid) if j["file"] not in done)
+    print("{} templates, {} already drawn".format(total, drawn))
+
+    with ProcessPoolExecutor(args.workers, initializer=worker,
+                             max_tasks_per_child=args.recycle) as pool, \
+         open(manifest, "a") as log:
+
+        def report(entries):
+            global drawn, failed
+            for entry in entries:
+                log.write(json.dumps(entry) + "\n")
+                drawn  += entry["ok"]
+                failed += not entry["ok"]
+                print("[{}/{}] {} {}".format(drawn + failed, total,
+                      entry["file"], entry.get("error", "")))
+            log.flush()
+
+        def record(futures):
+            for future in futures: report(future.result())
+
+        def valid(jobs):
+            # Bad entries go to the manifest without being drawn:
+            for j in jobs:
+                if "error" in j: report([j])
+                else:            yield j
+
+        running = set()
+        for batch in batches(valid(jobs), args.batch):
+            running.add(pool.submit(draw, batch, args.output))
+            if len(running) >= 2*args.workers:
+                ready, running = wait(running, return_when=FIRST_COMPLETED)
+                record(ready)
+        record(wait(running)[0])
+
+    print("{} drawn, {} failed".format(drawn, failed))
+    sys.exit(1 if failed else 0)
+
+################################################################################
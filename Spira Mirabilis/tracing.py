@@ -0,0 +1,154 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Opt-in tracing of the figure builds. Set SPIRA_TRACE to a file name:
+#
+#   SPIRA_TRACE=trace.json python figures.py
+#
+# and every span (each stage of template() and each example_XX) is saved,
+# with its wall and CPU time and counters, in the Chrome trace format
+# (chrome://tracing, https://ui.perfetto.dev). SPIRA_TRACE_MEMORY=1 adds the
+# peak memory of every span (tracemalloc slows down the code it traces, so
+# the times of such a trace are not comparable). A "{pid}" in the file
+# name gives one file per process when figures are built in parallel (the
+# pools call worker() in every process, see sweep.py), and
+#
+#   python tracing.py merged.json trace_*.json
+#
+# merges them into a single timeline.
+
+import os, time, atexit, argparse, threading
+
+from functools  import wraps
+from contextlib import contextmanager
+
+TRACE  = os.environ.get("SPIRA_TRACE", "")
+MEMORY = os.environ.get("SPIRA_TRACE_MEMORY", "") not in ("", "0")
+EVENTS = []
+LOCAL  = threading.local()
+
+### SPANS ######################################################################
+
+def enabled():
+    return bool(TRACE)
+
+def enable(filename, memory=False):
+
+    # Turn tracing on from Python (same as setting SPIRA_TRACE and
+    # SPIRA_TRACE_MEMORY):
+    global TRACE, MEMORY
+    if not TRACE: atexit.register(save)
+    TRACE  = os.environ["SPIRA_TRACE"] = filename
+    MEMORY = memory
+    os.environ["SPIRA_TRACE_MEMORY"] = "1" if memory else "0"
+
+class Span:
+
+    # Counters of an open span (a no-op when tracing is off):
+    def __init__(self): self.counters = {}
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+@contextmanager
+def span(name, **counters):
+
+    # Disabled: nothing is measured
+    S = Span()
+    if not TRACE:
+        yield S
+        return
+
+    # With MEMORY, nested spans share the memory tracer (the outer one owns
+    # it) and pass the peaks they see to their parents:
+    S.counters.update(counters)
+    stack = LOCAL.__dict__.setdefault("stack", [])
+    if MEMORY:
+        import tracemalloc
+        owner = not tracemalloc.is_tracing()
+        if owner: tracemalloc.start()
+        base, peak = tracemalloc.get_traced_memory()
+        if stack and stack[-1]: stack[-1][1] = max(stack[-1][1], peak)
+        tracemalloc.reset_peak()
+    stack.append([base, base] if MEMORY else None)
+
+    # The clocks only run around the body (not the tracer calls):
+    start = time.time()
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield S
+    finally:
+        wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+        S.counters.update(cpu_ms=1e3*cpu)
+        memory = stack.pop()
+        if memory:
+            base, peak = memory
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            if stack and stack[-1]: stack[-1][1] = max(stack[-1][1], peak)
+            if owner: tracemalloc.stop()
+            S.counters.update(peak_kb=(peak - base)/1024)
+        EVENTS.append({"name": name, "ph": "X", "cat": "figures",
+                       "ts":   1e6*start,
+                       "dur":  1e6*wall,
+                       "pid":  os.getpid(),
+                       "tid":  threading.get_ident(),
+                       "args": dict(S.counters, depth=len(stack))})
+
+def traced(function):
+
+    # Decorator: one span per call, named after the function:
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with span(function.__name__):
+            return function(*args, **kwargs)
+    return wrapper
+
+### OUTPUT #####################################################################
+
+def save(filename=None):
+    import json
+    filename = (filename or TRACE).format(pid=os.getpid())
+    if not filename: return
+    with open(filename, "w") as f:
+        json.dump({"traceEvents": EVENTS, "displayTimeUnit": "ms"}, f)
+
+def worker():
+
+    # Initializer of the pool processes: they exit through os._exit, without
+    # running atexit, so their spans are saved by a multiprocessing finalizer
+    # instead. Only with a "{pid}" in the file name (otherwise they would
+    # overwrite the file of the main process), and without the spans that a
+    # forked worker inherits from its parent:
+    del EVENTS[:]
+    if TRACE and "{pid}" in TRACE:
+        from multiprocessing.util import Finalize
+        Finalize(None, save, exitpriority=10)
+
+def merge(output, inputs):
+    import json
+    events = []
+    for filename in inputs:
+        with open(filename) as f: events += json.load(f)["traceEvents"]
+    with open(output, "w") as f:
+        json.dump({"traceEvents": sorted(events, key=lambda e: e["ts"]),
+                   "displayTimeUnit": "ms"}, f)
+
+if TRACE: atexit.register(save)
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Merge trace files")
+    parser.add_argument("output")
+    parser.add_argument("inputs", nargs="+")
+    args = parser.parse_args()
+
+    merge(args.output, args.inputs)
+
+################################################################################
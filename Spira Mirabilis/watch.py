@@ -0,0 +1,178 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Watch mode for the figures and the document:
+#
+#   python watch.py                 # Ctrl+C to stop
+#   python watch.py --no-build      # only the figures
+#
+# Every --interval seconds it checks figures.py, geometry.py,
+# constructions.py and the .tex files. When figures.py changes it is
+# reloaded and only the figures whose definition changed are drawn again:
+#
+#   - an example_XX when its function changed,
+#   - the templates whose entry of CONSTANTS changed (the layouts of the
+#     other ones are kept in memory),
+#   - everything when anything else changed (put_text, template...), or
+#     when geometry.py or constructions.py changed (they are reloaded first,
+#     in that order, as each one imports the one before).
+#
+# Comments and blank lines do not count as changes. pyx and its LaTeX
+# process are loaded once and stay warm. Then (or when a .tex file changes)
+# the document is rebuilt with "build.py --skip figures"; a rebuild that is
+# still running when the next change arrives is restarted.
+
+import os, sys, ast, glob, time, signal, importlib, traceback, subprocess
+import argparse
+
+HERE  = os.path.dirname(os.path.abspath(__file__))
+BUILD = os.path.join(os.path.dirname(HERE), "build.py")
+
+### CHANGES ####################################################################
+
+def definitions(filename):
+
+    # AST of every top-level statement, by the name it defines (the main
+    # block apart, as it draws nothing when the module is imported):
+    with open(filename) as f: tree = ast.parse(f.read())
+    D = {}
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            name = node.name
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1 and \
+             isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+        elif isinstance(node, ast.If) and "__main__" in ast.dump(node.test):
+            name = "__main__"
+        else:
+            name = "<module>"
+        D[name] = D.get(name, "") + ast.dump(node)
+    return D
+
+def stamps():
+    files = [os.path.join(HERE, f) for f in ("figures.py", "geometry.py",
+                                             "constructions.py")]
+    files += glob.glob(os.path.join(HERE, "*.tex"))
+    return {f: os.path.getmtime(f) for f in files if os.path.exists(f)}
+
+### REGENERATION ###############################################################
+
+# Everything that survives a reload of figures.py:
+STATE = {"module": None, "definitions": {}, "examples": set(), "jobs": set(),
+         "cache": {}, "styles": None}
+
+def start():
+
+    # Import figures.py, start LaTeX and compute the layouts of the templates:
+    import figures
+    STATE["module"]      = figures
+    STATE["definitions"] = definitions(figures.__file__)
+    STATE["examples"]    = {f.__name__ for f in figures.EXAMPLES}
+    STATE["jobs"]        = set(figures.template_jobs())
+    STATE["styles"]      = figures.setup()
+    figures.text.text(0, 0, r"{\huge \bfseries MMACA}")
+    keys = [(value, a, 210, 297, 15)
+            for name, symbol, value, a in figures.template_jobs()]
+    STATE["cache"].update(zip(keys, figures.layouts(keys, samples=True)))
+
+def regenerate(geometry_changed=False, constructions_changed=False):
+
+    # Reload geometry.py, constructions.py and figures.py (each one imports
+    # the ones before) and draw the figures that changed (returns how many):
+    old = STATE["definitions"]
+    if geometry_changed:
+        importlib.reload(sys.modules["geometry"])
+        STATE["cache"].clear()
+    if geometry_changed or constructions_changed:
+        importlib.reload(sys.modules["constructions"])
+    figures = importlib.reload(STATE["module"])
+    new     = definitions(figures.__file__)
+    changed = {n for n in set(old) | set(new) if old.get(n) != new.get(n)}
+
+    examples = list(figures.EXAMPLES)
+    jobs     = figures.template_jobs()
+    local    = {f.__name__ for f in examples} | {"__main__", "CONSTANTS",
+                "template_jobs", "template_layouts", "EXAMPLES", "setup"}
+    if "setup" in changed: STATE["styles"] = figures.setup()
+
+    if geometry_changed or changed - local:
+        STATE["cache"].clear()
+    elif not constructions_changed:
+        examples = [f for f in examples if f.__name__ in changed or
+                    f.__name__ not in STATE["examples"] or "setup" in changed]
+        jobs     = [j for j in jobs if j not in STATE["jobs"]]
+
+    for example in examples: example(*STATE["styles"])
+    figures.draw_templates(jobs, STATE["cache"])
+    STATE["module"], STATE["definitions"] = figures, new
+    STATE["examples"] = {f.__name__ for f in figures.EXAMPLES}
+    STATE["jobs"]     = set(figures.template_jobs())
+    return len(examples) + len(jobs)
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Watch mode")
+    parser.add_argument("--interval", type=float, default=0.2)
+    parser.add_argument("--no-build", action="store_true")
+    args = parser.parse_args()
+
+    os.chdir(HERE)
+    sys.path.insert(0, HERE)
+    start()
+    print("Watching", HERE)
+
+    build, built, before = None, None, stamps()
+    try:
+        while True:
+            time.sleep(args.interval)
+
+            # Report the end of the last rebuild:
+            if build and build.poll() is not None and built is not None:
+                print("Document rebuilt in {:.2f} s{}".format(
+                      time.perf_counter() - built,
+                      " (exit code {})".format(build.returncode)
+                      if build.returncode else ""))
+                built = None
+
+            now = stamps()
+            if now == before: continue
+            changed, before = {f for f in now if now[f] != before.get(f)}, now
+            names = {os.path.basename(f) for f in changed}
+            print("Changed:", ", ".join(sorted(names)))
+
+            # Figures:
+            t, drawn = time.perf_counter(), 0
+            if names & {"figures.py", "geometry.py", "constructions.py"}:
+                try:
+                    drawn = regenerate("geometry.py" in names,
+                                       "constructions.py" in names)
+                except Exception:
+                    traceback.print_exc()
+                    continue
+                print("{} figures drawn in {:.0f} ms".format(
+                      drawn, 1000*(time.perf_counter() - t)))
+
+            # Document:
+            if args.no_build or not (drawn or any(f.endswith(".tex")
+                                                  for f in names)): continue
+            if build and build.poll() is None:
+                os.killpg(build.pid, signal.SIGTERM)
+                build.wait()
+            build = subprocess.Popen([sys.executable, BUILD, HERE, "--force",
+                                      "--skip", "figures"],
+                                     stdout=subprocess.DEVNULL,
+                                     start_new_session=True)
+            built = t
+
+    except KeyboardInterrupt:
+        if build and build.poll() is None: os.killpg(build.pid, signal.SIGTERM)
+
+################################################################################
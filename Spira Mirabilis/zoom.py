@@ -0,0 +1,172 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Infinite zoom animations of the spirals (APNG, PNG frames or SVG):
+#
+#   python zoom.py Phi                      # zoom/Zoom_Phi_*.png (APNG)
+#   python zoom.py E --frames 48 --dpi 100 --rgb
+#   python zoom.py Root2 --png --periods 10 # zoom/Zoom_Root2_*/0000.png...
+#   python zoom.py --svg                    # zoom/Zoom_*.svg
+#
+# The spiral is zoomed towards its center K_per_turn times every period, in
+# front of the radii of its template (that do not change with the zoom). A
+# logarithmic spiral zoomed K_per_turn**T times is the same spiral rotated
+# T turns, so the animation repeats itself after every period and only the
+# frames of one period are rendered: the frames of any other period are
+# exactly the same (--png writes their PNG files again without drawing or
+# encoding them). The frames are drawn in log space: the spiral is sampled
+# by its turns u relative to the zoom, from the radius of the corners of
+# the frame down to half a pixel (bounds found with logarithms), and only
+# T mod 1 gets into the angles, so the power K_per_turn**T is never taken
+# and no zoom depth can overflow or underflow. The SVG is one period of
+# the spiral rotating (with animateTransform) over the static radii.
+
+import os, time, argparse
+
+from math     import *
+from geometry import *
+
+from images import png_bytes, apng_bytes
+from raster import Raster, NORMAL, THICK
+from svg    import Pen, STYLE
+
+### GEOMETRY ###################################################################
+
+def zoomed_spiral(K_per_turn, rotation, scale, T, outer, inner, per_turn=360):
+
+    # Points of the spiral (scale at T=0) zoomed K_per_turn**T times, from
+    # radius outer to radius inner (a point u turns after the zoom T has
+    # radius exp(log(scale) - u*log(K_per_turn)) and angle 2*pi*(u + T)):
+    k = log(K_per_turn)
+    u0, u1 = (log(scale) - log(outer))/k, (log(scale) - log(inner))/k
+    phase = T % 1
+    n = max(1, ceil(abs(u1 - u0)*per_turn))
+    P = []
+    for i in range(n + 1):
+        u = u0 + (u1 - u0)*i/n
+        r, a = exp(log(scale) - u*k), 2*pi*(u + phase) - rotation
+        P.append((r*sin(a), r*cos(a)))
+    return P
+
+def rays(radii, rotation, length):
+
+    # Radii of the template (see draw_template() in figures.py) from the
+    # center as (end, dashed):
+    return [((length*sin(2*pi*i/radii - rotation),
+              length*cos(2*pi*i/radii - rotation)),
+             radii >= 8 and radii%2 == 0 and i%2 == 1) for i in range(radii)]
+
+### FRAMES #####################################################################
+
+def render_period(K_per_turn, rotation, scale, frames=24, radii=24,
+                  width=150, height=150, dpi=50, channels=1):
+
+    # The frames of one period (zoom T from 0 to (frames-1)/frames):
+    outer = hypot(width, height)/20
+    R, images = rays(radii, rotation, outer), []
+    for f in range(frames):
+        image = Raster(width/10, height/10, dpi, channels)
+        inner = 0.5/image.k
+        for end, dashed in R:
+            image.stroke(((0, 0), end), NORMAL,
+                         dash=(2*NORMAL, 2*NORMAL) if dashed else None)
+        image.stroke(zoomed_spiral(K_per_turn, rotation, scale, f/frames,
+                                   outer, inner), THICK)
+        images.append(image.image())
+    return images
+
+def write_frames(folder, images, periods=1):
+
+    # PNG files 0000.png, 0001.png... of periods periods, every frame
+    # encoded once (frame n is frame n % len(images)):
+    os.makedirs(folder, exist_ok=True)
+    encoded = [png_bytes(image) for image in images]
+    for n in range(periods*len(images)):
+        with open(os.path.join(folder, "{:04d}.png".format(n)), "wb") as f:
+            f.write(encoded[n % len(encoded)])
+
+def write_svg(filename, K_per_turn, rotation, scale, radii=24,
+              width=150, height=150, seconds=2, digits=2):
+
+    # Spiral from the corners to 0.01 mm rotating once per period (mm, the
+    # origin at the center and the y axis downwards):
+    outer = hypot(width, height)/2
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" viewBox="{:g} {:g} '
+                '{:g} {:g}" width="{:g}mm" height="{:g}mm">\n'.format(
+                -width/2, -height/2, width, height, width, height))
+        f.write("<defs><style>{}</style></defs>\n".format(STYLE))
+        for dashed, name in ((False, ""), (True, ' class="dashed"')):
+            pen, d = Pen(digits), []
+            for end, kind in rays(radii, rotation, outer):
+                if kind != dashed: continue
+                d.append(pen.move(0, 0) + pen.line(end[0], -end[1]))
+            if d: f.write('<path{} d="{}"/>\n'.format(name, "".join(d)))
+        pen, d = Pen(digits), []
+        for x, y in zoomed_spiral(K_per_turn, rotation, 10*scale, 0, outer,
+                                  10**-digits):
+            if d and pen.quantize(x, -y) == pen.point: continue
+            d.append(pen.line(x, -y) if d else pen.move(x, -y))
+        f.write('<g><animateTransform attributeName="transform" type="rotate"'
+                ' from="0" to="360" dur="{:g}s" repeatCount="indefinite"/>\n'
+                '<path class="spiral" d="{}"/></g>\n'.format(seconds,
+                                                             "".join(d)))
+        f.write("</svg>\n")
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    import figures
+
+    parser = argparse.ArgumentParser(description="Infinite zoom animations")
+    parser.add_argument("constants", nargs="*",
+                        help="names of figures.CONSTANTS (default: all)")
+    parser.add_argument("--frames",  type=int,   default=24,
+                        help="frames per period")
+    parser.add_argument("--seconds", type=float, default=2,
+                        help="duration of a period")
+    parser.add_argument("--size",    type=float, default=150,
+                        help="side of the frame (mm)")
+    parser.add_argument("--dpi",     type=int,   default=50)
+    parser.add_argument("--rgb",     action="store_true")
+    parser.add_argument("--png",     action="store_true",
+                        help="PNG frames instead of an APNG")
+    parser.add_argument("--periods", type=int,   default=1,
+                        help="periods of PNG frames")
+    parser.add_argument("--svg",     action="store_true")
+    parser.add_argument("--folder",  default="zoom")
+    args = parser.parse_args()
+
+    jobs, L = figures.template_layouts(args.constants, samples=False)
+    os.makedirs(args.folder, exist_ok=True)
+    for (name, symbol, value, a), layout in zip(jobs, L):
+        K_per_turn, rotation, scale = layout[:3]
+        filename = os.path.join(args.folder, "Zoom_{}_{:03d}".format(name, a))
+        start = time.perf_counter()
+        if args.svg:
+            write_svg(filename + ".svg", K_per_turn, rotation, scale,
+                      width=args.size, height=args.size, seconds=args.seconds)
+            print("{}: {:.2f} s".format(os.path.basename(filename),
+                                        time.perf_counter() - start))
+            continue
+        images = render_period(K_per_turn, rotation, scale, args.frames,
+                               width=args.size, height=args.size,
+                               dpi=args.dpi, channels=3 if args.rgb else 1)
+        if args.png:
+            write_frames(filename, images, args.periods)
+        else:
+            with open(filename + ".png", "wb") as f:
+                f.write(apng_bytes(images, args.seconds/args.frames))
+        print("{}: {} frames rendered for {} in {:.2f} s".format(
+              os.path.basename(filename), len(images),
+              len(images)*(args.periods if args.png else 1),
+              time.perf_counter() - start))
+
+################################################################################
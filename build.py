@@ -0,0 +1,256 @@
+
+#########################################################
+#                                                       #
+#   Author:  Carlos Luna-Mota (carlos.luna@mmaca.cat)   #
+#   Version: 2026-10-19                                 #
+#   License: The Unlicense                              #
+#                                                       #
+#########################################################
+
+# Concurrent build of every document of the repository:
+#
+#   python build.py                 # all the documents that are out of date
+#   python build.py Talk Xerrada    # only the folders that match
+#   python build.py --dry-run       # show the jobs and their dependencies
+#
+# Every folder with a LaTeX makefile is a document and its makefile recipe
+# becomes a chain of jobs: figures.py, pdfstats.py, pdflatex (twice), pdftk
+# and gs. The jobs of different documents run concurrently, at most --jobs
+# at a time, and the output of each one goes to logs/<document>/<job>.log
+# as it is produced (--verbose echoes it too).
+#
+# Unlike the makefiles, the .aux/.toc/.nav/.snm/.out files are kept between
+# builds: the second pdflatex pass is skipped when the first one left them
+# unchanged and LaTeX did not ask for a rerun. --clean removes them.
+
+import os, re, sys, glob, time, asyncio, hashlib, argparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LOGS = os.path.join(HERE, "logs")
+
+AUX  = (".aux", ".toc", ".nav", ".snm", ".out")
+TEMP = (".blg", ".bbl", ".log", ".ind", ".ilg", ".lot", ".lof", ".idx")
+
+GS   = ["gs", "-sDEVICE=pdfwrite", "-dCompatibilityLevel=1.4",
+        "-dPrinted=false", "-dPDFSETTINGS=/prepress",
+        "-dNOPAUSE", "-dQUIET", "-dBATCH"]
+
+### DOCUMENTS ##################################################################
+
+def documents(root):
+
+    # Every folder whose makefile runs pdflatex:
+    for makefile in sorted(glob.glob(os.path.join(root, "**", "makefile"),
+                                     recursive=True)):
+        with open(makefile) as f: recipe = f.read()
+        if "pdflatex" not in recipe: continue
+        folder = os.path.dirname(makefile)
+        names  = dict(re.findall(r"^(\w+)=(.*)$", recipe, re.M))
+        yield {"name":     os.path.relpath(folder, root),
+               "folder":   folder,
+               "input":    names["INPUTFILE"].strip(),
+               "output":   names["OUTPUTFILE"].strip().replace("\\ ", " "),
+               "figures":  "python figures.py" in recipe,
+               "pdfstats": "python pdfstats.py" in recipe}
+
+def selected(doc, patterns):
+
+    # An existing folder selects that document, anything else is a substring
+    # of the document names:
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            if os.path.samefile(pattern, doc["folder"]): return True
+        elif pattern in doc["name"]: return True
+    return not patterns
+
+def generated(doc, filename):
+    base, ext = os.path.splitext(os.path.basename(filename))
+    return (filename.endswith(doc["output"] + ".pdf") or
+            (base in (doc["input"], doc["input"] + "_") and
+             ext in AUX + TEMP + (".pdf",)) or
+            "__pycache__" in filename)
+
+def up_to_date(doc):
+
+    # The output is newer than every other file of the folder:
+    output = os.path.join(doc["folder"], doc["output"] + ".pdf")
+    if not os.path.exists(output): return False
+    newest = max(os.path.getmtime(f) for f in
+                 glob.glob(os.path.join(doc["folder"], "**"), recursive=True)
+                 if os.path.isfile(f) and not generated(doc, f))
+    return newest <= os.path.getmtime(output)
+
+def digest(doc):
+
+    # Fingerprint of the files that LaTeX reads back on the next pass:
+    h = hashlib.sha256()
+    for ext in AUX:
+        filename = os.path.join(doc["folder"], doc["input"] + ext)
+        if os.path.exists(filename):
+            with open(filename, "rb") as f: h.update(ext.encode() + f.read())
+    return h.hexdigest()
+
+def rerun_requested(doc):
+    filename = os.path.join(doc["folder"], doc["input"] + ".log")
+    if not os.path.exists(filename): return True
+    with open(filename, "rb") as f: return b"Rerun to get" in f.read()
+
+def cleanup(doc, aux=False):
+    for ext in TEMP + (AUX if aux else ()):
+        filename = os.path.join(doc["folder"], doc["input"] + ext)
+        if os.path.exists(filename): os.remove(filename)
+    for suffix in (".pdf", "_.pdf"):
+        filename = os.path.join(doc["folder"], doc["input"] + suffix)
+        if os.path.exists(filename): os.remove(filename)
+
+### JOBS #######################################################################
+
+async def command(name, argv, cwd, args):
+
+    # Run argv once a CPU slot is free, streaming its output to the log:
+    log = os.path.join(args.logs, name + ".log")
+    os.makedirs(os.path.dirname(log), exist_ok=True)
+    async with args.slots:
+        print("{:<48} started".format(name), flush=True)
+        try:
+            process = await asyncio.create_subprocess_exec(*argv, cwd=cwd,
+                          stdin=asyncio.subprocess.DEVNULL,
+                          stdout=asyncio.subprocess.PIPE,
+                          stderr=asyncio.subprocess.STDOUT)
+        except FileNotFoundError:
+            print("{:<48} {} not found".format(name, argv[0]), flush=True)
+            return "failed"
+        with open(log, "wb") as f:
+            async for line in process.stdout:
+                f.write(line)
+                f.flush()
+                if args.verbose:
+                    sys.stdout.write("[{}] {}".format(name,
+                                     line.decode(errors="replace")))
+        code = await process.wait()
+    if code: print("{:<48} exit code {} (see {})".format(name, code, log))
+    return "failed" if code else "ok"
+
+def graph(doc, args):
+
+    # {job: (dependencies, action)} of one document, in topological order:
+    name, folder = doc["name"], doc["folder"]
+    python, tex = sys.executable, doc["input"] + ".tex"
+    state, jobs = {}, {}
+
+    async def skipped(): return "skipped"
+
+    def job(stage, after, action): jobs[name + "/" + stage] = (
+        [name + "/" + a for a in after],
+        skipped if stage in args.skip else action)
+
+    def run(stage, *argv):
+        return lambda: command(name + "/" + stage, argv, folder, args)
+
+    if not args.force and up_to_date(doc):
+        async def nothing(): return "up to date"
+        job("all", [], nothing)
+        return jobs
+
+    async def first():
+        state["before"] = digest(doc)
+        status = await run("pdflatex", "pdflatex", "-shell-escape",
+                           "-interaction=nonstopmode", tex)()
+        state["after"]  = digest(doc)
+        return status
+
+    async def second():
+        if state.get("before") == state.get("after") and \
+           not rerun_requested(doc):
+            return "skipped"
+        return await run("pdflatex-2", "pdflatex", "-shell-escape",
+                         "-interaction=nonstopmode", tex)()
+
+    async def clean():
+        cleanup(doc, args.clean)
+        return "ok"
+
+    before = []
+    if doc["figures"]:
+        job("figures", [], run("figures", python, "figures.py"))
+        before = ["figures"]
+    if doc["pdfstats"]:
+        job("pdfstats", before, run("pdfstats", python, "pdfstats.py",
+                                    "pictures"))
+        before = ["pdfstats"]
+    job("pdflatex",   before,         first)
+    job("pdflatex-2", ["pdflatex"],   second)
+    job("pdftk",      ["pdflatex-2"], run("pdftk", "pdftk",
+                                          doc["input"] + ".pdf", "cat",
+                                          "output", doc["input"] + "_.pdf"))
+    job("gs",         ["pdftk"],      run("gs", *GS,
+                                          "-sOutputFile=" + doc["output"] +
+                                          ".pdf", doc["input"] + "_.pdf",
+                                          "pdfmark"))
+    job("clean",      ["gs"],         clean)
+    return jobs
+
+async def execute(jobs, args):
+
+    # One task per job, started as soon as its dependencies are done:
+    args.slots = asyncio.Semaphore(args.jobs)
+    tasks, results = {}, {}
+
+    async def task(name):
+        after, action = jobs[name]
+        status = await asyncio.gather(*(tasks[a] for a in after))
+        start  = time.perf_counter()
+        if any(s in ("failed", "cancelled") for s in status):
+            result = "cancelled"
+        else:
+            try:    result = await action()
+            except Exception as error:
+                print("{:<48} {!r}".format(name, error))
+                result = "failed"
+        results[name] = (result, time.perf_counter() - start)
+        return result
+
+    for name in jobs: tasks[name] = asyncio.ensure_future(task(name))
+    await asyncio.gather(*tasks.values())
+    return results
+
+### MAIN #######################################################################
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Build the documents")
+    parser.add_argument("documents", nargs="*",
+                        help="only these folders (or names containing these)")
+    parser.add_argument("--jobs",    type=int, default=os.cpu_count())
+    parser.add_argument("--logs",    default=LOGS)
+    parser.add_argument("--force",   action="store_true",
+                        help="rebuild the documents that are up to date")
+    parser.add_argument("--clean",   action="store_true",
+                        help="remove the .aux files too (no pass is skipped)")
+    parser.add_argument("--skip",    nargs="*", default=[],
+                        help="stages to skip (figures, pdfstats, pdftk...)")
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    jobs = {}
+    for doc in documents(HERE):
+        if selected(doc, args.documents): jobs.update(graph(doc, args))
+
+    if args.dry_run:
+        for name, (after, action) in jobs.items():
+            print("{:<48} after {}".format(name, ", ".join(after) or "-"))
+        sys.exit(0)
+
+    start   = time.perf_counter()
+    results = asyncio.run(execute(jobs, args))
+
+    print()
+    for name, (result, seconds) in results.items():
+        print("{:<48} {:<12} {:8.2f} s".format(name, result, seconds))
+    failures = sum(r in ("failed", "cancelled") for r, s in results.values())
+    print("{} jobs, {} not built, {:.2f} s".format(len(results), failures,
+                                                   time.perf_counter() - start))
+    sys.exit(1 if failures else 0)
+
+################################################################################